@@ -0,0 +1,85 @@
+"""Benchmarks for the public API functions, end to end.
+
+These need pytest-benchmark (`pip install did_you_miss_me[dev]`). Each call is seeded, so that
+every round (and every run) generates the same columns.
+"""
+
+import pandas as pd
+import pytest
+
+import did_you_miss_me as dymm
+
+
+def test__generate_dataframe(run_benchmark, num_rows):
+    df = run_benchmark(
+        dymm.generate_dataframe,
+        num_rows,
+        kwargs={"exact_rows": num_rows, "num_columns": 12, "seed": 1},
+    )
+
+    assert df.shape == (num_rows, 12)
+
+
+@pytest.mark.parametrize("inplace", [False, True])
+def test__missify_dataframe(run_benchmark, inplace, num_rows):
+    df = pd.DataFrame(
+        {
+            "int": range(num_rows),
+            "float": [x / 2 for x in range(num_rows)],
+            "str": [str(x) for x in range(num_rows)],
+            "timestamp": pd.date_range("2020-01-01", periods=num_rows, freq="s"),
+        }
+    )
+
+    missing_df = run_benchmark(
+        dymm.missify_dataframe,
+        num_rows,
+        args=(df,),
+        # Later rounds of the in-place benchmark write nulls over the nulls from earlier rounds
+        kwargs={"seed": 1, "inplace": inplace},
+    )
+
+    assert missing_df.shape == df.shape
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test__missify_file(run_benchmark, tmp_path, file_format, num_rows):
+    df = pd.DataFrame(
+        {
+            "int": range(num_rows),
+            "float": [x / 2 for x in range(num_rows)],
+            "str": [str(x) for x in range(num_rows)],
+        }
+    )
+    input_path = tmp_path / f"input.{file_format}"
+    if file_format == "csv":
+        df.to_csv(input_path, index=False)
+    else:
+        df.to_parquet(input_path, index=False)
+
+    result_object = run_benchmark(
+        dymm.missify_file,
+        num_rows,
+        args=(input_path, tmp_path / f"output.{file_format}"),
+        kwargs={"chunk_size": 10_000, "seed": 1},
+    )
+
+    assert result_object.num_rows == num_rows
+
+
+def test__generate_multibatch_dataframe(run_benchmark, num_rows):
+    num_batches = 10
+    df = run_benchmark(
+        dymm.generate_multibatch_dataframe,
+        num_rows,
+        kwargs={
+            "exact_rows": num_rows // num_batches,
+            "num_columns": 12,
+            "num_epochs": 2,
+            "batches_per_epoch": num_batches // 2,
+            "print_updates": False,
+            "seed": 1,
+        },
+    )
+
+    assert len(df) == num_rows
@@ -0,0 +1,44 @@
+"""Benchmarks for generating single columns of faker data.
+
+These need pytest-benchmark (`pip install did_you_miss_me[dev]`).
+"""
+
+from did_you_miss_me.faker_types import (
+    FAKER_TYPES,
+)
+from did_you_miss_me.generators.column import (
+    FakerColumnGenerator,
+)
+
+# Faker types that cover each way a column is generated: sampled in bulk (with and without
+# weights), and called row by row (cheap and expensive methods)
+SAMPLE_FAKER_TYPES = [
+    "boolean",
+    "first_name",
+    "state",
+    "pyint",
+    "sha1",
+    "date_time",
+    "address",
+    "sentence",
+]
+
+
+def pytest_generate_tests(metafunc):
+    if "faker_type" in metafunc.fixturenames:
+        if metafunc.config.getoption("--bench-all-faker-types"):
+            faker_types = list(FAKER_TYPES)
+        else:
+            faker_types = SAMPLE_FAKER_TYPES
+        metafunc.parametrize("faker_type", faker_types)
+
+
+def test__faker_column_generator(run_benchmark, faker_type, num_rows):
+    generator = FakerColumnGenerator(
+        name="column",
+        faker_type=faker_type,
+    )
+
+    series = run_benchmark(generator.generate, num_rows, args=(num_rows,))
+
+    assert len(series) == num_rows
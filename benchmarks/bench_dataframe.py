@@ -0,0 +1,159 @@
+"""Benchmarks for generating a single wide dataframe.
+
+These need pytest-benchmark (`pip install did_you_miss_me[dev]`).
+"""
+
+import random
+
+import pytest
+
+from did_you_miss_me.generators.dataframe import (
+    MissingFakerDataframeGenerator,
+)
+from did_you_miss_me.generators.timestamps_and_ids import (
+    Indexes,
+)
+from did_you_miss_me.instrumentation import (
+    InstrumentationCollector,
+)
+
+NUM_ROWS = 500
+NUM_COLUMNS = 40
+
+
+# n_jobs=1 and n_jobs=4 do exactly the same work (every column has its own seeded random
+# stream), so the difference between them is the speedup from the process pool.
+@pytest.mark.parametrize("n_jobs", [1, 4])
+def test__missing_faker_dataframe_generator__wide(benchmark, n_jobs):
+    random.seed(40)
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=NUM_COLUMNS,
+        exact_rows=NUM_ROWS,
+    )
+    next_indexes = Indexes.create()
+
+    result_object = benchmark.pedantic(
+        generator.generate,
+        kwargs={"next_indexes": next_indexes, "n_jobs": n_jobs},
+        setup=lambda: random.seed(1),
+        rounds=3,
+    )
+
+    assert result_object.dataframe.shape == (NUM_ROWS, NUM_COLUMNS)
+    if not benchmark.disabled:
+        benchmark.extra_info["rows_per_second"] = NUM_ROWS / benchmark.stats["mean"]
+
+
+# Small batches of columns that are sampled in bulk, where per-call setup is a large share of the time
+@pytest.mark.parametrize("compiled", [False, True])
+def test__missing_faker_dataframe_generator__compiled(benchmark, compiled):
+    num_batches = 200
+    random.seed(40)
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=NUM_COLUMNS,
+        exact_rows=100,
+    )
+    for column_generator in generator.column_generators:
+        column_generator.faker_type = "first_name"
+    next_indexes = Indexes.create()
+
+    def generate_batches():
+        source = generator.compile() if compiled else generator
+        for _ in range(num_batches):
+            source.generate(next_indexes=next_indexes)
+
+    benchmark.pedantic(generate_batches, rounds=3)
+
+    if not benchmark.disabled:
+        benchmark.extra_info["seconds_per_batch"] = (
+            benchmark.stats["mean"] / num_batches
+        )
+
+
+# Columns of an expensive faker type, called row by row or drawn from a pool of pre-generated values
+@pytest.mark.parametrize("use_value_pool", [False, True])
+def test__missing_faker_dataframe_generator__value_pools(benchmark, use_value_pool):
+    random.seed(40)
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=NUM_COLUMNS,
+        exact_rows=NUM_ROWS,
+        use_value_pools=use_value_pool,
+    )
+    for column_generator in generator.column_generators:
+        column_generator.faker_type = "address"
+    next_indexes = Indexes.create()
+
+    benchmark.pedantic(
+        generator.generate,
+        kwargs={"next_indexes": next_indexes},
+        setup=lambda: random.seed(1),
+        rounds=3,
+    )
+
+    if not benchmark.disabled:
+        benchmark.extra_info["rows_per_second"] = NUM_ROWS / benchmark.stats["mean"]
+
+
+# The same columns built as a pd.DataFrame or as a pyarrow.Table
+@pytest.mark.parametrize("backend", ["pandas", "arrow"])
+def test__missing_faker_dataframe_generator__backend(run_benchmark, backend, num_rows):
+    if backend == "arrow":
+        pytest.importorskip("pyarrow")
+
+    random.seed(40)
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=12,
+        exact_rows=num_rows,
+        include_timestamps=True,
+    )
+    # Faker types that are sampled in bulk, so that building the columns is most of the work
+    for column_generator, faker_type in zip(
+        generator.column_generators,
+        ["first_name", "state", "boolean", "currency_code"] * 3,
+    ):
+        column_generator.faker_type = faker_type
+
+    result_object = run_benchmark(
+        generator.generate,
+        num_rows,
+        kwargs={"backend": backend},
+    )
+
+    if backend == "arrow":
+        assert result_object.table.num_rows == num_rows
+    else:
+        assert result_object.dataframe.shape[0] == num_rows
+
+
+# The compiled-batch workload again, with and without a collector, so the difference is the
+# overhead of instrumentation (with no hooks registered, it should be negligible)
+@pytest.mark.parametrize("collect", [False, True])
+def test__missing_faker_dataframe_generator__instrumentation(benchmark, collect):
+    num_batches = 200
+    random.seed(40)
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=NUM_COLUMNS,
+        exact_rows=100,
+    )
+    for column_generator in generator.column_generators:
+        column_generator.faker_type = "first_name"
+    next_indexes = Indexes.create()
+    plan = generator.compile()
+
+    def generate_batches():
+        for _ in range(num_batches):
+            plan.generate(next_indexes=next_indexes)
+
+    def generate_batches_with_collector():
+        with InstrumentationCollector():
+            generate_batches()
+
+    benchmark.pedantic(
+        generate_batches_with_collector if collect else generate_batches,
+        rounds=3,
+    )
+
+    if not benchmark.disabled:
+        benchmark.extra_info["seconds_per_batch"] = (
+            benchmark.stats["mean"] / num_batches
+        )
@@ -0,0 +1,31 @@
+"""Benchmarks for how long it takes to import the package, in a fresh interpreter.
+
+These need pytest-benchmark (`pip install did_you_miss_me[dev]`). To catch regressions, save a
+baseline with `--benchmark-autosave` and compare against it with `--benchmark-compare-fail=mean:25%`.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "pass",
+        "import did_you_miss_me",
+        "import did_you_miss_me.api",
+        "import did_you_miss_me as dymm; dymm.generate_dataframe(exact_rows=1, num_columns=1)",
+    ],
+)
+def test__import(benchmark, code):
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", code],),
+        kwargs={"check": True},
+        rounds=5,
+    )
+
+    if not benchmark.disabled:
+        benchmark.extra_info["seconds"] = benchmark.stats["mean"]
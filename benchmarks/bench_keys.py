@@ -0,0 +1,59 @@
+"""Benchmarks for key generation.
+
+These need pytest-benchmark (`pip install did_you_miss_me[dev]`).
+"""
+
+import pytest
+
+from did_you_miss_me.generators.keys import (
+    IntegerKeyColumnGenerator,
+    UuidKeyColumnGenerator,
+)
+
+
+@pytest.mark.parametrize("data_type", ["str", "bytes"])
+def test__uuid_key_column_generator(benchmark, data_type):
+    num_rows = 1_000_000
+    generator = UuidKeyColumnGenerator.create(
+        percent_missing=0.0,
+        percent_unique=1.0,
+        data_type=data_type,
+    )
+
+    series = benchmark(generator.generate, num_rows)
+
+    assert len(series) == num_rows
+    if not benchmark.disabled:
+        benchmark.extra_info["rows_per_second"] = num_rows / benchmark.stats["mean"]
+    benchmark.extra_info["bytes_per_row"] = series.memory_usage(deep=True) / num_rows
+
+
+def test__integer_key_column_generator__with_missingness_and_uniqueness(benchmark):
+    num_rows = 10_000_000
+    generator = IntegerKeyColumnGenerator.create(
+        incrementing=True,
+        data_type="int",
+        percent_missing=0.1,
+        percent_unique=0.5,
+    )
+
+    series = benchmark.pedantic(generator.generate, args=(num_rows,), rounds=3)
+
+    assert len(series) == num_rows
+    if not benchmark.disabled:
+        benchmark.extra_info["rows_per_second"] = num_rows / benchmark.stats["mean"]
+
+
+@pytest.mark.parametrize(
+    "generator_class", [IntegerKeyColumnGenerator, UuidKeyColumnGenerator]
+)
+@pytest.mark.parametrize("key", ["primary", "foreign"])
+def test__key_column_generator(run_benchmark, generator_class, key, num_rows):
+    if key == "primary":
+        generator = generator_class.create_primary_key(seed=1)
+    else:
+        generator = generator_class.create_foreign_key(seed=1)
+
+    series = run_benchmark(generator.generate, num_rows, args=(num_rows,))
+
+    assert len(series) == num_rows
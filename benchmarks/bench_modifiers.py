@@ -0,0 +1,77 @@
+"""Benchmarks for adding missingness and typos to existing columns.
+
+These need pytest-benchmark (`pip install did_you_miss_me[dev]`).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from did_you_miss_me.modifiers.fat_fingers import (
+    ColumnFatFingersModifier,
+    DataframeFatFingersModifier,
+)
+from did_you_miss_me.modifiers.missingness import (
+    ColumnMissingnessModifier,
+    ColumnMissingnessType,
+)
+
+
+def _create_series(dtype: str, num_rows: int) -> pd.Series:
+    values = np.random.default_rng(40).integers(0, 10**6, size=num_rows)
+    if dtype == "str":
+        return pd.Series(values.astype(str), dtype=object)
+    return pd.Series(values)
+
+
+@pytest.mark.parametrize("dtype_backend", [None, "numpy_nullable"])
+@pytest.mark.parametrize("missingness_type", list(ColumnMissingnessType))
+@pytest.mark.parametrize("dtype", ["int", "str"])
+def test__column_missingness_modifier(
+    run_benchmark, missingness_type, dtype, dtype_backend, num_rows
+):
+    modifier = ColumnMissingnessModifier.create(
+        missingness_type=missingness_type,
+        dtype_backend=dtype_backend,
+        seed=1,
+    )
+    series = _create_series(dtype, num_rows)
+
+    modified_series = run_benchmark(modifier.modify, num_rows, args=(series,))
+
+    assert len(modified_series) == num_rows
+
+
+def test__column_fat_fingers_modifier(run_benchmark, num_rows):
+    modifier = ColumnFatFingersModifier.create(
+        error_rate=0.05,
+    )
+    series = _create_series("str", num_rows)
+
+    modified_series = run_benchmark(modifier.modify, num_rows, args=(series,))
+
+    assert len(modified_series) == num_rows
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test__dataframe_fat_fingers_modifier(run_benchmark, n_jobs, num_rows):
+    modifier = DataframeFatFingersModifier.create(
+        num_columns=8,
+        error_rates=0.05,
+    )
+    # Half of the columns are text, and half are skipped
+    df = pd.DataFrame(
+        {
+            f"column_{i}": _create_series("str" if i % 2 == 0 else "int", num_rows)
+            for i in range(8)
+        }
+    )
+
+    modified_df = run_benchmark(
+        modifier.modify,
+        num_rows,
+        args=(df,),
+        kwargs={"n_jobs": n_jobs},
+    )
+
+    assert modified_df.shape == df.shape
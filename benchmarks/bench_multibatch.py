@@ -0,0 +1,94 @@
+"""Benchmarks for multibatch generation.
+
+These need pytest-benchmark (`pip install did_you_miss_me[dev]`).
+"""
+
+import random
+import time
+
+import pytest
+
+from did_you_miss_me.generators.dataframe import (
+    DataframeGenerator,
+)
+from did_you_miss_me.generators.multibatch import (
+    MissingFakerEpochGenerator,
+    MissingFakerMultiBatchGenerator,
+)
+
+NUM_ROWS = 100
+
+
+def _create_generator(num_batches: int) -> MissingFakerMultiBatchGenerator:
+    """Create a generator whose batches are cheap to generate, so that the cost of
+    assembling the batches dominates."""
+
+    random.seed(40)
+    dataframe_generator = DataframeGenerator.create(
+        exact_rows=NUM_ROWS,
+        num_columns=20,
+        include_primary_key=True,
+    )
+    for column_generator in dataframe_generator.column_generators:
+        column_generator.faker_type = "first_name"
+
+    return MissingFakerMultiBatchGenerator(
+        epochs=[
+            MissingFakerEpochGenerator.create(
+                dataframe_generator=dataframe_generator,
+                num_batches=num_batches,
+            )
+        ],
+    )
+
+
+@pytest.mark.parametrize("num_batches", [10, 50, 200])
+def test__generate(benchmark, num_batches):
+    generator = _create_generator(num_batches)
+
+    df = benchmark.pedantic(generator.generate, rounds=3, iterations=1)
+
+    assert df.shape[0] == NUM_ROWS * num_batches
+    benchmark.extra_info["num_batches"] = num_batches
+    if not benchmark.disabled:
+        benchmark.extra_info["seconds_per_batch"] = (
+            benchmark.stats["mean"] / num_batches
+        )
+
+
+def test__generate_scales_linearly_with_num_batches():
+    """Time per batch should stay flat as the number of batches grows.
+
+    With quadratic behavior (e.g. concatenating inside the loop), 16x as many batches
+    takes roughly 16x as long per batch.
+    """
+
+    seconds_per_batch = {}
+    for num_batches in [25, 400]:
+        generator = _create_generator(num_batches)
+        start = time.perf_counter()
+        generator.generate()
+        seconds_per_batch[num_batches] = (time.perf_counter() - start) / num_batches
+
+    assert seconds_per_batch[400] < 3 * seconds_per_batch[25]
+
+
+# Both settings generate exactly the same batches, so the difference is the speedup from the process pool.
+@pytest.mark.parametrize("n_jobs", [1, 4])
+def test__generate__parallel(benchmark, n_jobs):
+    num_batches = 200
+    generator = _create_generator(num_batches)
+
+    df = benchmark.pedantic(
+        generator.generate,
+        kwargs={"n_jobs": n_jobs},
+        setup=lambda: random.seed(1),
+        rounds=3,
+    )
+
+    assert df.shape[0] == NUM_ROWS * num_batches
+    benchmark.extra_info["n_jobs"] = n_jobs
+    if not benchmark.disabled:
+        benchmark.extra_info["seconds_per_batch"] = (
+            benchmark.stats["mean"] / num_batches
+        )
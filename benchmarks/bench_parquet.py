@@ -0,0 +1,58 @@
+"""Benchmarks for streaming batches into a Parquet dataset.
+
+These need pytest-benchmark and pyarrow (`pip install did_you_miss_me[dev,arrow]`).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from did_you_miss_me.generators.multibatch import (
+    MissingFakerBatchResultObject,
+)
+from did_you_miss_me.generators.timestamps_and_ids import (
+    Indexes,
+)
+from did_you_miss_me.sinks.parquet import (
+    ParquetSink,
+)
+
+NUM_BATCHES = 20
+ROWS_PER_BATCH = 50_000
+
+
+def _get_result_objects():
+    rng = np.random.default_rng(0)
+    for i in range(NUM_BATCHES):
+        indexes = Indexes(primary_key=i * ROWS_PER_BATCH, timestamp=0, batch_id=i)
+        yield MissingFakerBatchResultObject(
+            epoch_index=i // 5,
+            batch_index=i % 5,
+            dataframe=pd.DataFrame(
+                {
+                    "id": np.arange(i * ROWS_PER_BATCH, (i + 1) * ROWS_PER_BATCH),
+                    "score": rng.random(ROWS_PER_BATCH),
+                    "name": rng.choice(["a", "b", "c", None], size=ROWS_PER_BATCH),
+                }
+            ),
+            indexes=indexes,
+            next_indexes=indexes.advance(ROWS_PER_BATCH),
+        )
+
+
+@pytest.mark.parametrize("row_group_per_batch", [False, True])
+def test__parquet_sink__write(benchmark, tmp_path, row_group_per_batch):
+    sink = ParquetSink.create(
+        root_path=tmp_path, row_group_per_batch=row_group_per_batch
+    )
+
+    result_object = benchmark.pedantic(
+        lambda: sink.write(_get_result_objects()),
+        rounds=3,
+    )
+
+    assert result_object.num_rows == NUM_BATCHES * ROWS_PER_BATCH
+    if not benchmark.disabled:
+        benchmark.extra_info["rows_per_second"] = (
+            result_object.num_rows / benchmark.stats["mean"]
+        )
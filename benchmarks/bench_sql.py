@@ -0,0 +1,45 @@
+"""Benchmarks for streaming batches into SQL.
+
+These need pytest-benchmark (`pip install did_you_miss_me[dev]`).
+"""
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from did_you_miss_me.sinks.sql import (
+    SqlSink,
+)
+
+NUM_BATCHES = 20
+ROWS_PER_BATCH = 10_000
+
+
+def _get_batches():
+    rng = np.random.default_rng(0)
+    for i in range(NUM_BATCHES):
+        yield pd.DataFrame(
+            {
+                "id": np.arange(i * ROWS_PER_BATCH, (i + 1) * ROWS_PER_BATCH),
+                "score": rng.random(ROWS_PER_BATCH),
+                "name": rng.choice(["a", "b", "c", None], size=ROWS_PER_BATCH),
+            }
+        )
+
+
+def test__sql_sink__write(benchmark, tmp_path):
+    conn = sqlite3.connect(tmp_path / "bench.db")
+    sink = SqlSink.create(conn=conn, table_name="bench", if_exists="replace")
+
+    result_object = benchmark.pedantic(
+        lambda: sink.write(_get_batches()),
+        rounds=3,
+    )
+    conn.close()
+
+    assert result_object.num_rows == NUM_BATCHES * ROWS_PER_BATCH
+    if not benchmark.disabled:
+        benchmark.extra_info["rows_per_second"] = (
+            result_object.num_rows / benchmark.stats["mean"]
+        )
@@ -0,0 +1,34 @@
+"""Benchmarks for timestamp generation.
+
+These need pytest-benchmark (`pip install did_you_miss_me[dev]`).
+"""
+
+import numpy as np
+import pytest
+
+from did_you_miss_me.generators.timestamp import (
+    TimestampFormat,
+    TimestampMultiColumnGenerator,
+)
+
+
+@pytest.mark.parametrize("num_rows", [10_000, 1_000_000])
+def test__partial_sort(benchmark, num_rows):
+    values = np.random.default_rng(40).integers(0, 10**9, size=num_rows)
+
+    result = benchmark(TimestampMultiColumnGenerator._partial_sort, values, 0.7)
+
+    assert len(result) == num_rows
+    if not benchmark.disabled:
+        benchmark.extra_info["rows_per_second"] = num_rows / benchmark.stats["mean"]
+
+
+@pytest.mark.parametrize("timestamp_format", list(TimestampFormat))
+def test__generate(run_benchmark, timestamp_format, num_rows):
+    generator = TimestampMultiColumnGenerator.create(
+        timestamp_format=timestamp_format,
+    )
+
+    values = run_benchmark(generator.generate, num_rows, args=(num_rows,))
+
+    assert list(values.keys()) == generator.names
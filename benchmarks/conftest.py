@@ -0,0 +1,146 @@
+"""Options and fixtures shared by the benchmarks.
+
+Row counts come from --bench-rows (default: 1,000 and 100,000 rows). The full suite goes up to
+10 million rows, e.g.
+
+    python -m pytest benchmarks --bench-rows=1000,100000,10000000
+
+Every benchmark that takes a `num_rows` argument is run once per row count.
+"""
+
+import random
+import tracemalloc
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+import pytest
+
+DEFAULT_ROW_COUNTS = "1000,100000"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-rows",
+        default=DEFAULT_ROW_COUNTS,
+        help="Comma-separated row counts to run the benchmarks at (e.g. 1000,100000,10000000).",
+    )
+    parser.addoption(
+        "--bench-all-faker-types",
+        action="store_true",
+        help="Benchmark every faker type, rather than a representative sample.",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "num_rows" in metafunc.fixturenames and not _is_parametrized(
+        metafunc, "num_rows"
+    ):
+        row_counts = [
+            int(x) for x in metafunc.config.getoption("--bench-rows").split(",")
+        ]
+        metafunc.parametrize("num_rows", row_counts)
+
+
+def _is_parametrized(metafunc, argname: str) -> bool:
+    return any(
+        argname in marker.args[0]
+        for marker in metafunc.definition.iter_markers("parametrize")
+    )
+
+
+def get_num_bytes(result: Any) -> Optional[int]:
+    """The size in memory of a benchmark's output, if it is (or contains) pandas data."""
+
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(deep=True).sum())
+
+    if isinstance(result, pd.Series):
+        return int(result.memory_usage(deep=True))
+
+    if isinstance(result, dict):
+        sizes = [get_num_bytes(value) for value in result.values()]
+        if all(size is not None for size in sizes):
+            return sum(sizes)
+
+    if hasattr(result, "dataframe"):
+        return get_num_bytes(result.dataframe)
+
+    # A pyarrow.Table, or a result object with one
+    if hasattr(result, "nbytes"):
+        return int(result.nbytes)
+
+    if hasattr(result, "table"):
+        return get_num_bytes(result.table)
+
+    return None
+
+
+def measure_peak_memory(
+    function: Callable,
+    args: tuple = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Run function once under tracemalloc, and return the peak number of bytes it allocated.
+
+    Only allocations in this process are counted, so work done in worker processes isn't included.
+    """
+
+    tracemalloc.start()
+    try:
+        function(*args, **(kwargs or {}))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+@pytest.fixture
+def run_benchmark(benchmark):
+    """Benchmark a function, and record its throughput and peak memory in the saved results.
+
+    Returns a function that takes the function to benchmark, the number of rows it produces,
+    and its arguments. Each round (and the memory measurement) starts from random.seed(1),
+    so every round does the same work.
+    """
+
+    def run(
+        function: Callable,
+        num_rows: int,
+        args: tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        rounds: Optional[int] = None,
+    ) -> Any:
+        if rounds is None:
+            # Large runs take long enough that one round is a stable measurement
+            rounds = 3 if num_rows < 100_000 else 1
+
+        if not benchmark.disabled:
+            random.seed(1)
+            peak_memory_bytes = measure_peak_memory(function, args, kwargs)
+
+        result = benchmark.pedantic(
+            function,
+            args=args,
+            kwargs=kwargs,
+            setup=lambda: random.seed(1),
+            rounds=rounds,
+        )
+
+        # With --benchmark-disable, the function runs once, untimed
+        if benchmark.disabled:
+            return result
+
+        seconds = benchmark.stats["mean"]
+        benchmark.extra_info["num_rows"] = num_rows
+        benchmark.extra_info["rows_per_second"] = num_rows / seconds
+        benchmark.extra_info["peak_memory_mb"] = peak_memory_bytes / 1e6
+
+        num_bytes = get_num_bytes(result)
+        if num_bytes is not None:
+            benchmark.extra_info["output_mb"] = num_bytes / 1e6
+            benchmark.extra_info["mb_per_second"] = num_bytes / 1e6 / seconds
+
+        return result
+
+    return run
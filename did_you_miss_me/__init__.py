@@ -1,7 +1,50 @@
-from did_you_miss_me.api import (
-    generate_series,  # noqa: F401
-    generate_dataframe,  # noqa: F401
-    missify_dataframe,  # noqa: F401
-    generate_multibatch_dataframe,  # noqa: F401
-    generate_multiple_batches_and_upload_to_sql,  # noqa: F401
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# The public API, and the module that each name is defined in.
+# Names are imported the first time they're used (PEP 562), so that `import did_you_miss_me`
+# on its own doesn't pull in pandas, pydantic and Faker.
+_LAZY_ATTRIBUTES = {
+    "generate_series": "did_you_miss_me.api",
+    "generate_dataframe": "did_you_miss_me.api",
+    "missify_dataframe": "did_you_miss_me.api",
+    "missify_file": "did_you_miss_me.api",
+    "generate_multibatch_dataframe": "did_you_miss_me.api",
+    "iter_multibatch_dataframe": "did_you_miss_me.api",
+    "generate_multiple_batches_and_upload_to_sql": "did_you_miss_me.api",
+    "generate_multiple_batches_and_write_to_parquet": "did_you_miss_me.api",
+    "InstrumentationCollector": "did_you_miss_me.instrumentation",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    # Cache the value, so that __getattr__ is only called once per name
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from did_you_miss_me.api import (
+        generate_series,  # noqa: F401
+        generate_dataframe,  # noqa: F401
+        missify_dataframe,  # noqa: F401
+        missify_file,  # noqa: F401
+        generate_multibatch_dataframe,  # noqa: F401
+        iter_multibatch_dataframe,  # noqa: F401
+        generate_multiple_batches_and_upload_to_sql,  # noqa: F401
+        generate_multiple_batches_and_write_to_parquet,  # noqa: F401
+    )
+    from did_you_miss_me.instrumentation import (
+        InstrumentationCollector,  # noqa: F401
+    )
@@ -1,13 +1,33 @@
 from pydantic import BaseModel
 from abc import ABC
+import inspect
 from typing import Any
 
+from did_you_miss_me.instrumentation import (
+    INSTRUMENTED_METHODS,
+    instrumented,
+)
+
 
 class DataTool(BaseModel, ABC):
     """
     Abstract base class for DataGenerators and DataModifiers.
+
+    The generate, modify and write methods of every subclass are instrumented, so that each
+    call is reported to the hooks in did_you_miss_me.instrumentation (if any are registered).
     """
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+
+        for method_name in INSTRUMENTED_METHODS:
+            method = cls.__dict__.get(method_name)
+            if inspect.isfunction(method) and not getattr(
+                method, "__instrumented__", False
+            ):
+                setattr(cls, method_name, instrumented(method))
+
     @classmethod
     def create(
         cls,
@@ -41,3 +61,16 @@ class DataModifier(DataTool, ABC):
         **kwargs,
     ) -> Any:
         raise NotImplementedError
+
+
+class DataSink(DataTool, ABC):
+    """
+    Abstract base class for DataSinks, which write generated data somewhere (e.g. a database)
+    """
+
+    def write(
+        self,
+        *args,
+        **kwargs,
+    ) -> Any:
+        raise NotImplementedError
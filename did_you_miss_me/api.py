@@ -3,37 +3,61 @@ Public-facing methods for generating synthetic missingness data.
 """
 
 import pandas as pd
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
 from did_you_miss_me.generators.column import (
     MissingFakerColumnGenerator,
 )
 from did_you_miss_me.generators.dataframe import (
+    GenerationBackend,
     MissingFakerDataframeGenerator,
 )
 from did_you_miss_me.generators.multibatch import (
+    MissingFakerBatchResultObject,
     MissingFakerMultiBatchGenerator,
 )
 from did_you_miss_me.modifiers.missingness import (
     ColumnMissingnessModifier,
+    DataframeMissingnessModifier,
+    DtypeBackend,
 )
+from did_you_miss_me.rng import (
+    seeded_random,
+    split_seed,
+)
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from did_you_miss_me.modifiers.files import FileMissingnessResultObject
+    from did_you_miss_me.sinks.parquet import ParquetSinkResultObject
+    from did_you_miss_me.sinks.sql import SqlSinkResultObject
 
 
 def generate_series(
     num_rows: int = 200,
+    seed: Optional[int] = None,
+    dtype_backend: Optional[DtypeBackend] = None,
 ) -> pd.Series:
     """Generate a synthetic series with realistic patterns of missingness.
 
     Parameters:
     - num_rows (int): The number of rows to generate in the series.
+    - dtype_backend (str): "numpy_nullable" or "pyarrow", to store columns with missing values in nullable dtypes (e.g. Int64 or int64[pyarrow]) instead of upcasting them (e.g. int64 to float64). Defaults to None (numpy dtypes).
+    - seed (int): If given, the series only depends on this seed.
     """
 
+    create_seed, generate_seed = split_seed(seed, 2)
+
     generator = MissingFakerColumnGenerator.create(
         name="my_column",
         missingness_type="PROPORTIONAL",
+        dtype_backend=dtype_backend,
+        seed=create_seed,
     )
     series = generator.generate(
         num_rows=num_rows,
+        seed=generate_seed,
     )
 
     return series
@@ -48,7 +72,12 @@ def generate_dataframe(
     include_foreign_keys=False,
     include_timestamps=False,
     # use_ai = False,
-) -> pd.DataFrame:
+    n_jobs: Optional[int] = None,
+    use_value_pools: bool = False,
+    dtype_backend: Optional[DtypeBackend] = None,
+    seed: Optional[int] = None,
+    backend: GenerationBackend = "pandas",
+) -> Union[pd.DataFrame, "pyarrow.Table"]:
     """Generate synthetic datasets with realistic patterns of missingness.
 
     Parameters:
@@ -60,8 +89,18 @@ def generate_dataframe(
     - include_foreign_keys (bool): Whether to include columns simulating foreign keys in the dataset.
     - include_timestamps (bool): Whether to include a timestamp column (or columns) in the dataset.
     - use_ai (bool): Whether to use artificial intelligence to generate the missingness patterns.
+    - n_jobs (int): If given, generate the columns in parallel, in this many worker processes (-1 for one per CPU).
+    - use_value_pools (bool): Whether to draw expensive faker types (like addresses and sentences) from a cache of pre-generated values. Faster, but each column repeats a limited set of values.
+    - dtype_backend (str): "numpy_nullable" or "pyarrow", to store columns with missing values in nullable dtypes (e.g. Int64 or int64[pyarrow]) instead of upcasting them (e.g. int64 to float64). Defaults to None (numpy dtypes).
+    - seed (int): If given, the dataset only depends on this seed (and not on n_jobs). Can't be combined with use_value_pools, since pooled values depend on the pools already cached in this process.
+    - backend (str): "pandas" (the default) returns a pd.DataFrame. "arrow" returns a pyarrow.Table, built column by column without going through pandas, with the same values. Needs pyarrow.
     """
 
+    _check_seed_and_value_pools(seed, use_value_pools)
+
+    # Separate streams for building the generator and for generating data
+    create_seed, generate_seed = split_seed(seed, 2)
+
     dataframe_generator = MissingFakerDataframeGenerator.create(
         exact_rows=exact_rows,
         num_columns=num_columns,
@@ -70,30 +109,103 @@ def generate_dataframe(
         include_foreign_keys=include_foreign_keys,
         include_timestamps=include_timestamps,
         add_missingness=add_missingness,
+        use_value_pools=use_value_pools,
+        dtype_backend=dtype_backend,
+        seed=create_seed,
+    )
+    result_object = dataframe_generator.generate(
+        n_jobs=n_jobs,
+        seed=generate_seed,
+        backend=backend,
     )
-    result_object = dataframe_generator.generate()
+
+    if backend == "arrow":
+        return result_object.table
+
     return result_object.dataframe
 
 
 def missify_dataframe(
     df: pd.DataFrame,
+    seed: Optional[int] = None,
+    inplace: bool = False,
+    n_jobs: Optional[int] = None,
+    dtype_backend: Optional[DtypeBackend] = None,
 ) -> pd.DataFrame:
     """Add missingness to an existing dataframe.
 
     Parameters:
     - df (pd.DataFrame): The dataframe to add missingness to.
+    - seed (int): If given, the missingness only depends on this seed.
+    - inplace (bool): Whether to write nulls into df itself, rather than a copy. Saves memory on large dataframes.
+    - n_jobs (int): If given, add missingness to the columns in a pool of this many threads (-1 for one per CPU).
+    - dtype_backend (str): "numpy_nullable" or "pyarrow", to store columns with missing values in nullable dtypes (e.g. Int64 or int64[pyarrow]) instead of upcasting them (e.g. int64 to float64). Defaults to None (numpy dtypes).
     """
 
-    series_dict = {}
-    for i, column in enumerate(df.columns):
-        column_modifier = ColumnMissingnessModifier.create()
-        missified_series = column_modifier.modify(
-            df[column],
-        )
-        series_dict[column] = missified_series
+    # Separate streams for picking each column's missingness and for drawing the masks
+    create_seed, modify_seed = split_seed(seed, 2)
 
-    df = pd.DataFrame(series_dict)
-    return df
+    with seeded_random(create_seed):
+        column_modifiers = [
+            ColumnMissingnessModifier.create(dtype_backend=dtype_backend)
+            for column in df.columns
+        ]
+
+    dataframe_modifier = DataframeMissingnessModifier(
+        column_modifiers=column_modifiers,
+    )
+
+    return dataframe_modifier.modify(
+        df,
+        inplace=inplace,
+        n_jobs=n_jobs,
+        seed=modify_seed,
+    )
+
+
+def missify_file(
+    input_path,
+    output_path,
+    chunk_size: int = 100_000,
+    file_format: Optional[str] = None,
+    seed: Optional[int] = None,
+) -> "FileMissingnessResultObject":
+    """Add missingness to a CSV or Parquet file, streaming it into a new file one chunk at a time.
+
+    Each column's type of missingness is picked once, up front, and applied to every chunk, so
+    files larger than memory can be missified with (roughly) constant memory. Parquet needs pyarrow.
+
+    Parameters:
+    - input_path (str): The CSV or Parquet file to add missingness to.
+    - output_path (str): The file to write, in the same format as the input.
+    - chunk_size (int): The number of rows to read and write at a time.
+    - file_format (str): "csv" or "parquet". Defaults to the input file's extension.
+    - seed (int): If given, the missingness only depends on this seed (and chunk_size).
+
+    Returns a result object with the number of rows written and the rows per second.
+    """
+
+    # Imported here, so that the rest of the API doesn't load the file readers and writers
+    from did_you_miss_me.modifiers.files import (
+        FileMissingnessModifier,
+        read_column_names,
+    )
+
+    # Separate streams for picking each column's missingness and for drawing the masks
+    create_seed, modify_seed = split_seed(seed, 2)
+
+    file_modifier = FileMissingnessModifier.create(
+        num_columns=len(read_column_names(input_path, file_format=file_format)),
+        chunk_size=chunk_size,
+        seed=create_seed,
+    )
+
+    return file_modifier.modify(
+        input_path,
+        output_path,
+        file_format=file_format,
+        seed=modify_seed,
+    )
 
 
 def generate_multibatch_dataframe(
@@ -108,6 +220,10 @@ def generate_multibatch_dataframe(
     include_timestamps=True,
     # use_ai = False,
     print_updates=True,
+    n_jobs: Optional[int] = None,
+    use_value_pools: bool = False,
+    dtype_backend: Optional[DtypeBackend] = None,
+    seed: Optional[int] = None,
 ) -> pd.DataFrame:
     """Generate synthetic datasets with realistic patterns of missingness.
 
@@ -122,8 +238,17 @@ def generate_multibatch_dataframe(
     - include_foreign_keys (bool): Whether to include columns simulating foreign keys in the dataset.
     - include_timestamps (bool): Whether to include a timestamp column (or columns) in the dataset.
     - use_ai (bool): Whether to use artificial intelligence to generate the missingness patterns.
+    - n_jobs (int): If given, generate the batches in parallel, in this many worker processes (-1 for one per CPU).
+    - use_value_pools (bool): Whether to draw expensive faker types (like addresses and sentences) from a cache of pre-generated values. Faster, but each column repeats a limited set of values.
+    - dtype_backend (str): "numpy_nullable" or "pyarrow", to store columns with missing values in nullable dtypes (e.g. Int64 or int64[pyarrow]) instead of upcasting them (e.g. int64 to float64). Defaults to None (numpy dtypes).
+    - seed (int): If given, the dataset only depends on this seed (and not on n_jobs). Can't be combined with use_value_pools, since pooled values depend on the pools already cached in this process.
     """
 
+    _check_seed_and_value_pools(seed, use_value_pools)
+
+    # Separate streams for building the generator and for generating data
+    create_seed, generate_seed = split_seed(seed, 2)
+
     multibatch_generator = MissingFakerMultiBatchGenerator.create(
         exact_rows=exact_rows,
         num_columns=num_columns,
@@ -134,51 +259,262 @@ def generate_multibatch_dataframe(
         include_foreign_keys=include_foreign_keys,
         include_timestamps=include_timestamps,
         add_missingness=add_missingness,
+        use_value_pools=use_value_pools,
+        dtype_backend=dtype_backend,
+        seed=create_seed,
     )
 
     df = multibatch_generator.generate(
         print_updates=print_updates,
+        n_jobs=n_jobs,
+        seed=generate_seed,
     )
     return df
 
-def _convert_df_to_sql_friendly(
-    df : pd.DataFrame
-) -> pd.DataFrame:
-    type_conversion = {
-        "object": object,
-        "float64": float,
-        "int64": int,
-        'datetime64[ns]': int,
-    }
-
-    df_copy = df.copy()
-    
-    convert_dict = []
-    for i, column in enumerate(df_copy.columns):
-        converted_type = type_conversion[str(df_copy.dtypes[i])]
-        convert_dict.append((column, converted_type))
-    
-    convert_dict = dict(convert_dict)
-
-    df_copy = df_copy.astype(convert_dict)
-
-    return df_copy
- 
+
+def iter_multibatch_dataframe(
+    exact_rows: Optional[int] = None,
+    num_columns: int = 12,
+    num_epochs: int = 5,
+    batches_per_epoch: Optional[int] = None,
+    add_missingness=True,
+    include_batch_id=False,
+    include_primary_key=False,
+    include_foreign_keys=False,
+    include_timestamps=True,
+    # use_ai = False,
+    print_updates=True,
+    n_jobs: Optional[int] = None,
+    use_value_pools: bool = False,
+    dtype_backend: Optional[DtypeBackend] = None,
+    seed: Optional[int] = None,
+) -> Iterator[MissingFakerBatchResultObject]:
+    """Generate synthetic datasets with realistic patterns of missingness, one batch at a time.
+
+    Takes the same parameters as generate_multibatch_dataframe, but yields each batch as soon as
+    it is generated, instead of returning one big dataframe. Each batch is a result object with
+    the batch's dataframe, epoch_index, batch_index, and the indexes before and after the batch.
+    Only one batch is held in memory at a time.
+
+    Parameters:
+    - exact_rows (int): The number of rows to generate in each batch.
+    - num_columns (int): The number of columns to generate in the dataset.
+    - num_epochs (int): The number of epochs to generate in the dataset.
+    - batches_per_epoch (int): The number of batches to generate in each epoch.
+    - add_missingness (bool): Whether to add missingness to the dataset.
+    - include_batch_id (bool): Whether to include a column simulating a batch ID in the dataset.
+    - include_primary_key (bool): Whether to include a column simulating a primary key in the dataset.
+    - include_foreign_keys (bool): Whether to include columns simulating foreign keys in the dataset.
+    - include_timestamps (bool): Whether to include a timestamp column (or columns) in the dataset.
+    - use_ai (bool): Whether to use artificial intelligence to generate the missingness patterns.
+    - n_jobs (int): If given, generate the batches in parallel, in this many worker processes (-1 for one per CPU).
+    - use_value_pools (bool): Whether to draw expensive faker types (like addresses and sentences) from a cache of pre-generated values. Faster, but each column repeats a limited set of values.
+    - dtype_backend (str): "numpy_nullable" or "pyarrow", to store columns with missing values in nullable dtypes (e.g. Int64 or int64[pyarrow]) instead of upcasting them (e.g. int64 to float64). Defaults to None (numpy dtypes).
+    - seed (int): If given, the dataset only depends on this seed (and not on n_jobs). Can't be combined with use_value_pools, since pooled values depend on the pools already cached in this process.
+    """
+
+    _check_seed_and_value_pools(seed, use_value_pools)
+
+    # Separate streams for building the generator and for generating data
+    create_seed, generate_seed = split_seed(seed, 2)
+
+    multibatch_generator = MissingFakerMultiBatchGenerator.create(
+        exact_rows=exact_rows,
+        num_columns=num_columns,
+        num_epochs=num_epochs,
+        batches_per_epoch=batches_per_epoch,
+        include_batch_id=include_batch_id,
+        include_primary_key=include_primary_key,
+        include_foreign_keys=include_foreign_keys,
+        include_timestamps=include_timestamps,
+        add_missingness=add_missingness,
+        use_value_pools=use_value_pools,
+        dtype_backend=dtype_backend,
+        seed=create_seed,
+    )
+
+    return multibatch_generator.iter_batches(
+        print_updates=print_updates,
+        n_jobs=n_jobs,
+        seed=generate_seed,
+    )
+
+
 def generate_multiple_batches_and_upload_to_sql(
     conn,
     table_name,
     if_exists="replace",
-    *args,
-    **kwargs,
-) -> None:
-    df = generate_multibatch_dataframe(
-        *args,
-        **kwargs,
-    )
-    df = _convert_df_to_sql_friendly(df)
-    df.to_sql(
-        table_name,
-        conn,
+    exact_rows: Optional[int] = None,
+    num_columns: int = 12,
+    num_epochs: int = 5,
+    batches_per_epoch: Optional[int] = None,
+    add_missingness=True,
+    include_batch_id=False,
+    include_primary_key=False,
+    include_foreign_keys=False,
+    include_timestamps=True,
+    # use_ai = False,
+    print_updates=True,
+    n_jobs: Optional[int] = None,
+    use_value_pools: bool = False,
+    dtype_backend: Optional[DtypeBackend] = None,
+    seed: Optional[int] = None,
+) -> "SqlSinkResultObject":
+    """Generate a multibatch dataset and stream it into a SQL table, one batch at a time.
+
+    Each batch is inserted (in chunks, as a single transaction) as soon as it is generated,
+    so the full dataset is never held in memory. The table's schema comes from the
+    generator's settings, so column types don't depend on the data in any one batch.
+
+    Parameters:
+    - conn: A DB-API 2.0 connection, e.g. sqlite3.connect("my.db").
+    - table_name (str): The name of the table to write to.
+    - if_exists (str): "replace", "append", or "fail", if the table already exists.
+    - All other parameters are the same as for generate_multibatch_dataframe.
+
+    Returns a result object with the number of rows written and the rows per second.
+    """
+
+    _check_seed_and_value_pools(seed, use_value_pools)
+
+    # Imported here, so that the rest of the API doesn't load the sinks
+    from did_you_miss_me.sinks.sql import SqlSink, infer_sql_schema_from_generator
+
+    # Separate streams for building the generator and for generating data
+    create_seed, generate_seed = split_seed(seed, 2)
+
+    multibatch_generator = MissingFakerMultiBatchGenerator.create(
+        exact_rows=exact_rows,
+        num_columns=num_columns,
+        num_epochs=num_epochs,
+        batches_per_epoch=batches_per_epoch,
+        include_batch_id=include_batch_id,
+        include_primary_key=include_primary_key,
+        include_foreign_keys=include_foreign_keys,
+        include_timestamps=include_timestamps,
+        add_missingness=add_missingness,
+        use_value_pools=use_value_pools,
+        dtype_backend=dtype_backend,
+        seed=create_seed,
+    )
+
+    # All epochs generate the same columns, so the first epoch's generator describes the whole table
+    schema = None
+    if multibatch_generator.num_epochs > 0:
+        schema = infer_sql_schema_from_generator(
+            multibatch_generator.epochs[0].missing_faker_dataframe_generator
+        )
+
+    sink = SqlSink.create(
+        conn=conn,
+        table_name=table_name,
         if_exists=if_exists,
-        index=None,
     )
+
+    result_objects = multibatch_generator.iter_batches(
+        print_updates=print_updates,
+        n_jobs=n_jobs,
+        seed=generate_seed,
+    )
+
+    return sink.write(
+        (result_object.dataframe for result_object in result_objects),
+        schema=schema,
+    )
+
+
+def generate_multiple_batches_and_write_to_parquet(
+    root_path,
+    row_group_per_batch=False,
+    exact_rows: Optional[int] = None,
+    num_columns: int = 12,
+    num_epochs: int = 5,
+    batches_per_epoch: Optional[int] = None,
+    add_missingness=True,
+    include_batch_id=False,
+    include_primary_key=False,
+    include_foreign_keys=False,
+    include_timestamps=True,
+    # use_ai = False,
+    print_updates=True,
+    n_jobs: Optional[int] = None,
+    use_value_pools: bool = False,
+    dtype_backend: Optional[DtypeBackend] = None,
+    seed: Optional[int] = None,
+) -> "ParquetSinkResultObject":
+    """Generate a multibatch dataset and stream it into a partitioned Parquet dataset, one batch at a time.
+
+    The dataset is partitioned by epoch and batch_id (hive-style, e.g. epoch=0/batch_id=17/part-0.parquet),
+    so it can be read back with pd.read_parquet(root_path). Needs pyarrow.
+
+    Parameters:
+    - root_path (str): The directory to write the dataset to.
+    - row_group_per_batch (bool): Write one file per epoch, with one row group per batch, instead of one file per batch.
+    - All other parameters are the same as for generate_multibatch_dataframe.
+
+    Returns a result object with the files written and the rows per second.
+    """
+
+    _check_seed_and_value_pools(seed, use_value_pools)
+
+    # Imported here, so that the rest of the API doesn't load the sinks (or probe for pyarrow)
+    from did_you_miss_me.sinks.parquet import ParquetSink
+    from did_you_miss_me.sinks.schema import infer_schema_from_generator
+
+    sink = ParquetSink.create(
+        root_path=root_path,
+        row_group_per_batch=row_group_per_batch,
+    )
+
+    # Separate streams for building the generator and for generating data
+    create_seed, generate_seed = split_seed(seed, 2)
+
+    multibatch_generator = MissingFakerMultiBatchGenerator.create(
+        exact_rows=exact_rows,
+        num_columns=num_columns,
+        num_epochs=num_epochs,
+        batches_per_epoch=batches_per_epoch,
+        include_batch_id=include_batch_id,
+        include_primary_key=include_primary_key,
+        include_foreign_keys=include_foreign_keys,
+        include_timestamps=include_timestamps,
+        add_missingness=add_missingness,
+        use_value_pools=use_value_pools,
+        dtype_backend=dtype_backend,
+        seed=create_seed,
+    )
+
+    # All epochs generate the same columns, so the first epoch's generator describes the whole dataset
+    schema = None
+    if multibatch_generator.num_epochs > 0:
+        schema = infer_schema_from_generator(
+            multibatch_generator.epochs[0].missing_faker_dataframe_generator
+        )
+
+    result_objects = multibatch_generator.iter_batches(
+        print_updates=print_updates,
+        n_jobs=n_jobs,
+        seed=generate_seed,
+    )
+
+    return sink.write(
+        result_objects,
+        schema=schema,
+    )
+
+
+def _check_seed_and_value_pools(
+    seed: Optional[int],
+    use_value_pools: bool,
+) -> None:
+    """Raise a ValueError if a seed is combined with value pools, which can't be reproduced.
+
+    Pooled values are drawn from the process-wide FakerValuePoolCache, whose pools depend on
+    every earlier call that used them (and differ between worker processes).
+    """
+
+    if seed is not None and use_value_pools:
+        raise ValueError(
+            "seed can't be combined with use_value_pools: pooled values depend on the pools "
+            "already cached in this process, so they aren't reproducible."
+        )
@@ -1,14 +1,324 @@
-import os
+import calendar
+import string
 
+# Every faker method that generators choose column types from.
+# This is a literal (rather than a file read at import time) to keep importing the package fast.
+FAKER_TYPES = (
+    "aba",
+    "address",
+    "administrative_unit",
+    "am_pm",
+    "android_platform_token",
+    "ascii_company_email",
+    "ascii_email",
+    "ascii_free_email",
+    "ascii_safe_email",
+    "bank_country",
+    "bban",
+    "binary",
+    "boolean",
+    "bothify",
+    "bs",
+    "building_number",
+    "catch_phrase",
+    "century",
+    "chrome",
+    "city",
+    "city_prefix",
+    "city_suffix",
+    "color",
+    "color_name",
+    "company",
+    "company_email",
+    "company_suffix",
+    "coordinate",
+    "country",
+    "country_calling_code",
+    "country_code",
+    "credit_card_expire",
+    "credit_card_full",
+    "credit_card_number",
+    "credit_card_provider",
+    "credit_card_security_code",
+    "cryptocurrency",
+    "cryptocurrency_code",
+    "cryptocurrency_name",
+    "csv",
+    "currency",
+    "currency_code",
+    "currency_name",
+    "currency_symbol",
+    "current_country",
+    "current_country_code",
+    "date",
+    "date_between",
+    "date_between_dates",
+    "date_object",
+    "date_of_birth",
+    "date_this_century",
+    "date_this_decade",
+    "date_this_month",
+    "date_this_year",
+    "date_time",
+    "date_time_ad",
+    "date_time_between",
+    "date_time_between_dates",
+    "date_time_this_century",
+    "date_time_this_decade",
+    "date_time_this_month",
+    "date_time_this_year",
+    "day_of_month",
+    "day_of_week",
+    "dga",
+    "domain_name",
+    "domain_word",
+    "dsv",
+    "ean",
+    "ean13",
+    "ean8",
+    "ein",
+    "email",
+    "file_extension",
+    "file_name",
+    "file_path",
+    "firefox",
+    "first_name",
+    "first_name_female",
+    "first_name_male",
+    "first_name_nonbinary",
+    "fixed_width",
+    "free_email",
+    "free_email_domain",
+    "future_date",
+    "future_datetime",
+    "hex_color",
+    "hexify",
+    "hostname",
+    "http_method",
+    "iana_id",
+    "iban",
+    "image_url",
+    "internet_explorer",
+    "invalid_ssn",
+    "ios_platform_token",
+    "ipv4",
+    "ipv4_network_class",
+    "ipv4_private",
+    "ipv4_public",
+    "ipv6",
+    "isbn10",
+    "isbn13",
+    "iso8601",
+    "items",
+    "itin",
+    "job",
+    "json",
+    "language_code",
+    "language_name",
+    "last_name",
+    "last_name_female",
+    "last_name_male",
+    "last_name_nonbinary",
+    "latitude",
+    "latlng",
+    "lexify",
+    "license_plate",
+    "linux_platform_token",
+    "linux_processor",
+    "local_latlng",
+    "locale",
+    "localized_ean",
+    "localized_ean13",
+    "localized_ean8",
+    "location_on_land",
+    "longitude",
+    "mac_address",
+    "mac_platform_token",
+    "mac_processor",
+    "md5",
+    "military_apo",
+    "military_dpo",
+    "military_ship",
+    "military_state",
+    "mime_type",
+    "month",
+    "month_name",
+    "msisdn",
+    "name",
+    "name_female",
+    "name_male",
+    "name_nonbinary",
+    "nic_handle",
+    "nic_handles",
+    "null_boolean",
+    "numerify",
+    "opera",
+    "paragraph",
+    "paragraphs",
+    "password",
+    "past_date",
+    "past_datetime",
+    "phone_number",
+    "port_number",
+    "postalcode",
+    "postalcode_in_state",
+    "postalcode_plus4",
+    "postcode",
+    "postcode_in_state",
+    "prefix",
+    "prefix_female",
+    "prefix_male",
+    "prefix_nonbinary",
+    "pricetag",
+    "profile",
+    "psv",
+    "pybool",
+    "pydecimal",
+    "pydict",
+    "pyfloat",
+    "pyint",
+    "pyiterable",
+    "pylist",
+    "pyset",
+    "pystr",
+    "pystr_format",
+    "pystruct",
+    "pytimezone",
+    "pytuple",
+    "random_choices",
+    "random_digit",
+    "random_digit_not_null",
+    "random_digit_not_null_or_empty",
+    "random_digit_or_empty",
+    "random_element",
+    "random_elements",
+    "random_int",
+    "random_letter",
+    "random_letters",
+    "random_lowercase_letter",
+    "random_number",
+    "random_sample",
+    "random_uppercase_letter",
+    "randomize_nb_elements",
+    "rgb_color",
+    "rgb_css_color",
+    "ripe_id",
+    "safari",
+    "safe_color_name",
+    "safe_domain_name",
+    "safe_email",
+    "safe_hex_color",
+    "secondary_address",
+    "sentence",
+    "sentences",
+    "sha1",
+    "sha256",
+    "simple_profile",
+    "slug",
+    "ssn",
+    "state",
+    "state_abbr",
+    "street_address",
+    "street_name",
+    "street_suffix",
+    "suffix",
+    "suffix_female",
+    "suffix_male",
+    "suffix_nonbinary",
+    "swift",
+    "swift11",
+    "swift8",
+    "tar",
+    "text",
+    "texts",
+    "time",
+    "time_delta",
+    "time_object",
+    "time_series",
+    "timezone",
+    "tld",
+    "tsv",
+    "unix_device",
+    "unix_partition",
+    "unix_time",
+    "upc_a",
+    "upc_e",
+    "uri",
+    "uri_extension",
+    "uri_page",
+    "uri_path",
+    "url",
+    "user_agent",
+    "user_name",
+    "uuid4",
+    "windows_platform_token",
+    "word",
+    "words",
+    "year",
+    "zip",
+    "zipcode",
+    "zipcode_in_state",
+)
 
-def _load_faker_types():
-    script_dir = os.path.dirname(__file__)  # <-- absolute dir the script is in
-    rel_path = "faker_types.txt"
-    abs_file_path = os.path.join(script_dir, rel_path)
-    with open(abs_file_path, "r") as f:
-        faker_types = f.read().split("\n")
 
-    return faker_types
-
-
-FAKER_TYPES = _load_faker_types()
+# Faker types whose values are a single draw from a finite set of elements.
+# Each entry maps a faker type to a function that takes the Faker provider that
+# implements the faker method, and returns the elements it draws from. (If the
+# elements are an OrderedDict, its values are used as sampling weights, the same
+# way Faker's `random_element` uses them.)
+#
+# FakerColumnGenerator samples these types in bulk, instead of calling Faker once per row.
+FAKER_ELEMENT_TYPES = {
+    "administrative_unit": lambda provider: provider.states,
+    "am_pm": lambda provider: ["AM", "PM"],
+    "boolean": lambda provider: [True, False],
+    "century": lambda provider: provider.centuries,
+    "city_prefix": lambda provider: provider.city_prefixes,
+    "city_suffix": lambda provider: provider.city_suffixes,
+    "color_name": lambda provider: list(provider.all_colors.keys()),
+    "company_suffix": lambda provider: provider.company_suffixes,
+    "country": lambda provider: provider.countries,
+    "country_calling_code": lambda provider: provider.country_calling_codes,
+    "country_code": lambda provider: provider.alpha_2_country_codes,
+    "cryptocurrency": lambda provider: provider.cryptocurrencies,
+    "cryptocurrency_code": lambda provider: [x[0] for x in provider.cryptocurrencies],
+    "cryptocurrency_name": lambda provider: [x[1] for x in provider.cryptocurrencies],
+    "currency": lambda provider: provider.currencies,
+    "currency_code": lambda provider: [x[0] for x in provider.currencies],
+    "currency_name": lambda provider: [x[1] for x in provider.currencies],
+    "day_of_week": lambda provider: list(calendar.day_name),
+    "first_name": lambda provider: provider.first_names,
+    "first_name_female": lambda provider: provider.first_names_female,
+    "first_name_male": lambda provider: provider.first_names_male,
+    "first_name_nonbinary": lambda provider: provider.first_names_nonbinary,
+    "free_email_domain": lambda provider: provider.free_email_domains,
+    "http_method": lambda provider: provider.http_methods,
+    "job": lambda provider: provider.jobs,
+    "language_code": lambda provider: list(provider.language_locale_codes.keys()),
+    "language_name": lambda provider: provider.language_names,
+    "last_name": lambda provider: provider.last_names,
+    "last_name_female": lambda provider: provider.last_names_female,
+    "last_name_male": lambda provider: provider.last_names_male,
+    "last_name_nonbinary": lambda provider: provider.last_names_nonbinary,
+    "linux_processor": lambda provider: provider.linux_processors,
+    "mac_processor": lambda provider: provider.mac_processors,
+    "military_ship": lambda provider: provider.military_ship_prefix,
+    "military_state": lambda provider: provider.military_state_abbr,
+    "month": lambda provider: [f"{i:02d}" for i in range(1, 13)],
+    "month_name": lambda provider: list(calendar.month_name)[1:],
+    "null_boolean": lambda provider: [None, True, False],
+    "pybool": lambda provider: [True, False],
+    "random_digit": lambda provider: list(range(10)),
+    "random_digit_not_null": lambda provider: list(range(1, 10)),
+    "random_letter": lambda provider: list(string.ascii_letters),
+    "random_lowercase_letter": lambda provider: list(string.ascii_lowercase),
+    "random_uppercase_letter": lambda provider: list(string.ascii_uppercase),
+    "safe_color_name": lambda provider: provider.safe_colors,
+    "safe_domain_name": lambda provider: provider.safe_domain_names,
+    "state": lambda provider: provider.states,
+    "street_suffix": lambda provider: provider.street_suffixes,
+    "tld": lambda provider: provider.tlds,
+    "uri_extension": lambda provider: provider.uri_extensions,
+    "uri_page": lambda provider: provider.uri_pages,
+    "windows_platform_token": lambda provider: provider.windows_platform_tokens,
+}
@@ -0,0 +1,139 @@
+"""
+An Arrow-native backend for MissingFakerDataframeGenerator, which builds pyarrow arrays column by column.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+from did_you_miss_me.generators.column import (
+    MissingFakerColumnGenerator,
+)
+from did_you_miss_me.generators.value_pool import (
+    get_faker_value_pool_cache,
+)
+from did_you_miss_me.instrumentation import (
+    instrumented,
+)
+from did_you_miss_me.rng import (
+    get_rng,
+    seeded_random,
+)
+
+
+def check_pyarrow() -> None:
+    """Raise an ImportError if pyarrow isn't installed."""
+    if pa is None:
+        raise ImportError(
+            'The "arrow" backend needs pyarrow. Install it with `pip install did_you_miss_me[arrow]`.'
+        )
+
+
+@instrumented
+def generate_arrow_column(
+    column_generator: MissingFakerColumnGenerator,
+    num_rows: int,
+    seed: Optional[int] = None,
+) -> "pa.Array":
+    """Generate a column as an Arrow array, with its missing values as nulls in the validity bitmap.
+
+    The values and the missingness mask are drawn in the same order (and from the same
+    streams) as MissingFakerColumnGenerator.generate, so a column has the same values with
+    either backend. Faker types that are sampled in bulk are taken straight from an Arrow
+    array of their elements; other faker types are converted from a list of faker values.
+    Values that Arrow can't store in a single type (e.g. faker types that return a mix of
+    types) are stored as strings.
+
+    This is a module-level function so that it can be sent to worker processes.
+
+    Args:
+        column_generator: The column to generate.
+        num_rows: The number of rows to generate.
+        seed: If given, seed both the `random` module and the column's Faker instance with it.
+    """
+
+    with seeded_random(seed), seeded_random(seed, column_generator._fake.random):
+        method = getattr(column_generator._fake, column_generator.faker_type)
+        faker_elements = column_generator._get_faker_elements(method)
+
+        if faker_elements is None and column_generator.use_value_pool:
+            # Pools are shared with the pandas backend, so their values are pandas-backed
+            series = get_faker_value_pool_cache().sample(
+                column_generator.faker_type, method, num_rows
+            )
+            values = _to_arrow_array(series.to_numpy(dtype=object).tolist())
+
+        elif faker_elements is None:
+            values = _to_arrow_array([method() for i in range(num_rows)])
+
+        else:
+            elements, probabilities = faker_elements
+            indices = get_rng().choice(len(elements), size=num_rows, p=probabilities)
+
+        mask = column_generator._get_missingness_mask(num_rows)
+
+    if faker_elements is not None:
+        # Taking with null indices writes the nulls at the same time as the values
+        arrow_elements = _get_arrow_elements(column_generator.faker_type, elements)
+        return arrow_elements.take(pa.array(indices, mask=mask if mask.any() else None))
+
+    return _with_nulls(values, mask)
+
+
+def _to_arrow_array(
+    values: List[Any],
+) -> "pa.Array":
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return pa.array([str(value) for value in values])
+
+
+# The elements of each faker type that is sampled in bulk, as Arrow arrays, keyed by faker type.
+_ARROW_ELEMENTS_CACHE: Dict[str, "pa.Array"] = {}
+
+
+def _get_arrow_elements(
+    faker_type: str,
+    elements,
+) -> "pa.Array":
+    if faker_type not in _ARROW_ELEMENTS_CACHE:
+        _ARROW_ELEMENTS_CACHE[faker_type] = _to_arrow_array(
+            elements.to_numpy(dtype=object).tolist()
+        )
+
+    return _ARROW_ELEMENTS_CACHE[faker_type]
+
+
+def _with_nulls(
+    array: "pa.Array",
+    mask: np.ndarray,
+) -> "pa.Array":
+    """Null out the values of array wherever mask is True.
+
+    For flat types (numbers, strings, bytes, etc.), the mask is packed into a validity bitmap
+    and attached to the array's existing buffers, without copying any values.
+    """
+
+    if not mask.any():
+        return array
+
+    is_flat = array.type.num_fields == 0 and not pa.types.is_dictionary(array.type)
+    if is_flat and array.offset == 0 and array.null_count == 0:
+        # Packing a boolean array gives a bitmap that's True for valid values
+        validity = pa.array(~mask).buffers()[1]
+        return pa.Array.from_buffers(
+            array.type,
+            len(array),
+            [validity, *array.buffers()[1:]],
+            null_count=int(mask.sum()),
+        )
+
+    return pc.if_else(pa.array(mask), pa.scalar(None, type=array.type), array)
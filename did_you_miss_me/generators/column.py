@@ -1,9 +1,12 @@
 from abc import ABC
-from faker import Faker
+from collections import OrderedDict
+from copy import deepcopy
+from functools import lru_cache
 import random
-from typing import Any, Dict, List, Optional
-from pydantic import Field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from pydantic import Field, PrivateAttr
 
+import numpy as np
 import pandas as pd
 
 from did_you_miss_me.abc import (
@@ -13,10 +16,25 @@ from did_you_miss_me.modifiers.missingness import (
     ColumnMissingnessType,
     ColumnMissingnessParams,
     ColumnMissingnessModifier,
+    DtypeBackend,
     WEIGHTED_MISSINGNESS_TYPES,
     ProportionalColumnMissingnessParams,
 )
-from did_you_miss_me.faker_types import FAKER_TYPES
+from did_you_miss_me.faker_types import (
+    FAKER_TYPES,
+    FAKER_ELEMENT_TYPES,
+)
+from did_you_miss_me.generators.value_pool import (
+    get_faker_value_pool_cache,
+)
+from did_you_miss_me.rng import (
+    get_rng,
+    seedable,
+    seeded_random,
+)
+
+if TYPE_CHECKING:
+    from faker import Faker
 
 
 class ColumnGenerator(DataGenerator, ABC):
@@ -54,8 +72,23 @@ class FakerColumnGenerator(ColumnGenerator):
         default_factory=lambda: random.choice(FAKER_TYPES),
         description="The name of the faker method to call to generate column values.",
     )
+    use_value_pool: bool = Field(
+        False,
+        description="Whether to draw values from a pool of pre-generated faker values, trading exact Faker fidelity for throughput.",
+    )
 
-    _fake = Faker()
+    _faker: Optional["Faker"] = PrivateAttr(None)
+
+    @property
+    def _fake(self) -> "Faker":
+        """This column's Faker instance, created the first time it's needed.
+
+        Each column gets its own copy of a shared template, so its random state is its own,
+        but only columns that actually generate data pay for building one.
+        """
+        if self._faker is None:
+            self._faker = deepcopy(_get_faker_template())
+        return self._faker
 
     def _generate_faker_value(self, faker_type: str):
         """Generate a value from the faker library.
@@ -67,20 +100,115 @@ class FakerColumnGenerator(ColumnGenerator):
         value = method()
         return value
 
-    def generate(self, num_rows: int) -> pd.Series:
+    def _get_faker_elements(
+        self, method
+    ) -> Optional[Tuple[pd.Series, Optional[np.ndarray]]]:
+        """Get the finite set of elements (and weights) that a faker method draws from.
+
+        Args:
+            method: The (already resolved) faker method.
+
+        Returns:
+            A tuple of (elements, probabilities), or None if the faker type can't be sampled in bulk.
+            probabilities is None when all elements are equally likely.
+        """
+        if self.faker_type not in _FAKER_ELEMENTS_CACHE:
+            _FAKER_ELEMENTS_CACHE[self.faker_type] = _load_faker_elements(
+                self.faker_type,
+                getattr(method, "__self__", None),
+            )
+
+        return _FAKER_ELEMENTS_CACHE[self.faker_type]
+
+    def generate(
+        self,
+        num_rows: int,
+        seed: Optional[int] = None,
+    ) -> pd.Series:
         """Generate a series of random data
 
+        The faker method is resolved once per column. Faker types that draw from a finite
+        set of elements (see FAKER_ELEMENT_TYPES) are sampled in bulk; all other types fall
+        back to calling the faker method once per row, or, with use_value_pool, are drawn
+        from the shared FakerValuePoolCache.
+
         Args:
             num_rows: The number of rows to generate.
+            seed: If given, seed both the `random` module and this column's Faker instance with it.
         """
 
-        series = pd.Series(
-            [self._generate_faker_value(self.faker_type) for i in range(num_rows)]
-        )
+        if seed is not None:
+            with seeded_random(seed), seeded_random(seed, self._fake.random):
+                return FakerColumnGenerator.generate(self, num_rows=num_rows)
+
+        method = getattr(self._fake, self.faker_type)
+        faker_elements = self._get_faker_elements(method)
+
+        if faker_elements is None and self.use_value_pool:
+            series = get_faker_value_pool_cache().sample(
+                self.faker_type, method, num_rows
+            )
+
+        elif faker_elements is None:
+            series = pd.Series([method() for i in range(num_rows)])
+
+        else:
+            elements, probabilities = faker_elements
+            indices = get_rng().choice(len(elements), size=num_rows, p=probabilities)
+            series = elements.take(indices).reset_index(drop=True)
 
         return series
 
 
+@lru_cache(maxsize=None)
+def _get_faker_template() -> "Faker":
+    """Build the Faker instance that every column's Faker is copied from.
+
+    Faker is imported here, rather than at the top of the module, since importing it and
+    loading its providers is one of the slowest parts of importing this package.
+    """
+    from faker import Faker
+
+    return Faker()
+
+
+# Elements for each faker type that has been sampled so far, keyed by faker type.
+# None means that the faker type can't be sampled in bulk.
+_FAKER_ELEMENTS_CACHE: Dict[str, Optional[Tuple[pd.Series, Optional[np.ndarray]]]] = {}
+
+
+def _load_faker_elements(
+    faker_type: str,
+    provider: Any,
+) -> Optional[Tuple[pd.Series, Optional[np.ndarray]]]:
+    """Look up the elements (and weights) for a faker type in FAKER_ELEMENT_TYPES.
+
+    Args:
+        faker_type: The name of the faker method.
+        provider: The Faker provider that implements the faker method.
+    """
+    if faker_type not in FAKER_ELEMENT_TYPES:
+        return None
+
+    try:
+        raw_elements = FAKER_ELEMENT_TYPES[faker_type](provider)
+    except AttributeError:
+        # Not all locales define every element list, so fall back to calling faker row by row.
+        return None
+
+    if isinstance(raw_elements, OrderedDict):
+        weights = np.array(list(raw_elements.values()), dtype=float)
+        probabilities = weights / weights.sum()
+        raw_elements = list(raw_elements.keys())
+    else:
+        probabilities = None
+
+    # Building a Series gives the elements the same dtype that a list of faker values would get.
+    elements = pd.Series(list(raw_elements))
+
+    return elements, probabilities
+
+
 class ConstantColumnGenerator(ColumnGenerator):
     def generate(
         self,
@@ -100,12 +228,15 @@ class ConstantColumnGenerator(ColumnGenerator):
 
 class MissingFakerColumnGenerator(FakerColumnGenerator, ColumnMissingnessModifier):
     @classmethod
+    @seedable
     def create(
         cls,
         name: Optional[str] = None,
         faker_type: Optional[str] = None,
         missingness_type: Optional[ColumnMissingnessType] = None,
         missingness_params: Optional[ColumnMissingnessParams] = None,
+        use_value_pool: bool = False,
+        dtype_backend: Optional[DtypeBackend] = None,
     ):
         if name is None:
             name = f"column_{random.randint(0, 1000000)}"
@@ -136,13 +267,17 @@ class MissingFakerColumnGenerator(FakerColumnGenerator, ColumnMissingnessModifie
             faker_type=faker_type,
             missingness_type=missingness_type,
             missingness_params=missingness_params,
+            use_value_pool=use_value_pool,
+            dtype_backend=dtype_backend,
         )
 
     def generate(
         self,
         num_rows: int,
+        seed: Optional[int] = None,
     ) -> pd.Series:
-        series = super().generate(num_rows=num_rows)
-        modified_series = self.modify(series)
+        with seeded_random(seed), seeded_random(seed, self._fake.random):
+            series = super().generate(num_rows=num_rows)
+            modified_series = self.modify(series)
 
         return modified_series
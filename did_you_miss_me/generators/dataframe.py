@@ -1,5 +1,6 @@
+from concurrent.futures import ProcessPoolExecutor
 import random
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Literal, Optional, Union
 from pydantic import BaseModel, Field
 
 import pandas as pd
@@ -22,11 +23,20 @@ from did_you_miss_me.generators.timestamps_and_ids import (
     TimestampAndIdWidget,
     Indexes,
 )
+from did_you_miss_me.instrumentation import (
+    span,
+)
 from did_you_miss_me.modifiers.missingness import (
     ColumnMissingnessType,
     ColumnMissingnessModifier,
     ProportionalColumnMissingnessParams,
     DataframeMissingnessModifier,
+    DtypeBackend,
+)
+from did_you_miss_me.rng import (
+    seedable,
+    seeded_random,
+    spawn_seeds,
 )
 
 
@@ -44,6 +54,7 @@ class DataframeGenerator(DataGenerator):
         return self.row_count_widget.num_rows
 
     @classmethod
+    @seedable
     def create(
         cls,
         num_columns: Optional[int] = None,
@@ -54,6 +65,7 @@ class DataframeGenerator(DataGenerator):
         include_primary_key=False,
         include_foreign_keys=False,
         include_timestamps: bool = False,
+        use_value_pools: bool = False,
     ):
         if num_columns is None:
             num_columns = 12
@@ -63,6 +75,7 @@ class DataframeGenerator(DataGenerator):
             column_generator = FakerColumnGenerator(
                 name=f"column_{i + 1}",
                 faker_type=random.choice(FAKER_TYPES),
+                use_value_pool=use_value_pools,
             )
             column_generators.append(column_generator)
 
@@ -96,12 +109,27 @@ class DataframeGenerator(DataGenerator):
         )
 
 
+# What MissingFakerDataframeGenerator.generate builds its output with:
+# * "pandas": a pd.DataFrame (see MissingFakerDataframeResultObject)
+# * "arrow": a pyarrow.Table, built column by column without going through pandas (see MissingFakerTableResultObject)
+GenerationBackend = Literal["pandas", "arrow"]
+
+
 class MissingFakerDataframeResultObject(BaseModel):
     """
     A result object for a MissingFakerDataframeGenerator.
     """
 
-    dataframe: Any #pd.DataFrame
+    dataframe: Any  # pd.DataFrame
+    next_indexes: Indexes
+
+
+class MissingFakerTableResultObject(BaseModel):
+    """
+    A result object for a MissingFakerDataframeGenerator, with the "arrow" backend.
+    """
+
+    table: Any  # pyarrow.Table
     next_indexes: Indexes
 
 
@@ -115,6 +143,7 @@ class MissingFakerDataframeGenerator(DataGenerator):
         return self.row_count_widget.num_rows
 
     @classmethod
+    @seedable
     def create(
         cls,
         num_columns: Optional[int] = None,
@@ -126,6 +155,8 @@ class MissingFakerDataframeGenerator(DataGenerator):
         include_foreign_keys=False,
         include_timestamps: bool = False,
         add_missingness: bool = True,
+        use_value_pools: bool = False,
+        dtype_backend: Optional[DtypeBackend] = None,
     ):
         if num_columns is None:
             num_columns = 12
@@ -136,28 +167,29 @@ class MissingFakerDataframeGenerator(DataGenerator):
             max_rows=max_rows,
         )
 
-        timestamp_and_id_widget = (
-            TimestampAndIdWidget.create(
-                include_batch_id=include_batch_id,
-                include_primary_key=include_primary_key,
-                include_foreign_keys=include_foreign_keys,
-                include_timestamps=include_timestamps,
-            )
+        timestamp_and_id_widget = TimestampAndIdWidget.create(
+            include_batch_id=include_batch_id,
+            include_primary_key=include_primary_key,
+            include_foreign_keys=include_foreign_keys,
+            include_timestamps=include_timestamps,
         )
 
         dataframe_generator = DataframeGenerator.create(
             num_columns=num_columns,
             exact_rows=exact_rows,
+            use_value_pools=use_value_pools,
         )
 
         if add_missingness:
             missingness_modifier = DataframeMissingnessModifier.create(
                 num_columns=num_columns,
+                dtype_backend=dtype_backend,
             )
         else:
             missingness_modifier = DataframeMissingnessModifier.create(
                 num_columns=num_columns,
                 missingness_type=ColumnMissingnessType.NEVER,
+                dtype_backend=dtype_backend,
             )
 
         column_generators = []
@@ -173,39 +205,43 @@ class MissingFakerDataframeGenerator(DataGenerator):
             row_count_widget=row_count_widget,
             timestamp_and_id_widget=timestamp_and_id_widget,
         )
-    
+
     @classmethod
+    @seedable
     def create_using_dataframe_generator(
         cls,
         dataframe_generator: DataframeGenerator,
         add_missingness: bool = True,
+        dtype_backend: Optional[DtypeBackend] = None,
     ) -> "MissingFakerDataframeGenerator":
         """Create a MissingFakerDataframeGenerator using a DataframeGenerator.
-        
+
         Args:
             dataframe_generator (DataframeGenerator): The DataframeGenerator to use.
             add_missingness (bool): Whether to add missingness. Defaults to True.
+            dtype_backend (str): "numpy_nullable" or "pyarrow", to store each column in a nullable dtype
+                (e.g. Int64, rather than float64 with NaNs). Defaults to None (numpy dtypes).
 
         Note:
             The idea is that dataframe_generator already defines all the parameters
             for the dataframe, and we just want to add missingness to it.
         """
-        
+
         num_columns = dataframe_generator.num_columns
 
         row_count_widget = dataframe_generator.row_count_widget
-        timestamp_and_id_widget = (
-            dataframe_generator.timestamp_and_id_widget
-        )
+        timestamp_and_id_widget = dataframe_generator.timestamp_and_id_widget
 
         if add_missingness:
             missingness_modifier = DataframeMissingnessModifier.create(
                 num_columns=num_columns,
+                dtype_backend=dtype_backend,
             )
         else:
             missingness_modifier = DataframeMissingnessModifier.create(
                 num_columns=num_columns,
                 missingness_type=ColumnMissingnessType.NEVER,
+                dtype_backend=dtype_backend,
             )
 
         column_generators = []
@@ -221,41 +257,209 @@ class MissingFakerDataframeGenerator(DataGenerator):
             row_count_widget=row_count_widget,
             timestamp_and_id_widget=timestamp_and_id_widget,
         )
-    
 
     def generate(
-            self,
-            next_indexes: Optional[Indexes] = None,
-        ) -> MissingFakerDataframeResultObject:
+        self,
+        next_indexes: Optional[Indexes] = None,
+        n_jobs: Optional[int] = None,
+        executor: Optional[ProcessPoolExecutor] = None,
+        num_rows: Optional[int] = None,
+        seed: Optional[int] = None,
+        backend: GenerationBackend = "pandas",
+    ) -> Union[MissingFakerDataframeResultObject, MissingFakerTableResultObject]:
         """
         Generate a dataframe with the specified number of rows and columns, with missingness applied
+
+        Args:
+            next_indexes (Indexes): The indexes to start the timestamp and ID columns from.
+            n_jobs (int): If given, generate the columns in a pool of n_jobs worker processes.
+                n_jobs=1 generates them in this process, and n_jobs=-1 uses one worker per CPU.
+            executor (ProcessPoolExecutor): An existing process pool to generate the columns with.
+                Pass one in to reuse the same pool across many dataframes. Thread pools aren't
+                supported, since seeding a column reseeds the process-wide `random` module.
+            num_rows (int): The number of rows to generate. Defaults to a draw from row_count_widget.
+            seed (int): If given, the dataframe only depends on this seed. Every column is
+                generated from its own stream spawned from it, with or without workers.
+            backend (str): "pandas" (the default) returns a MissingFakerDataframeResultObject.
+                "arrow" returns a MissingFakerTableResultObject, with a pyarrow.Table whose
+                columns are built as Arrow arrays, with missing values as nulls in their
+                validity bitmaps. Both backends generate the same values. Needs pyarrow.
+
+        Note:
+            When n_jobs, executor or seed is given, each column is generated from its own random
+            stream, spawned from a root seed drawn from the `random` module. The result then
+            only depends on that seed, not on the number of workers. (Except for faker types
+            that embed the current time, like tar and zip, and columns with use_value_pool,
+            whose values depend on the pools already in the process's FakerValuePoolCache.)
         """
 
+        if seed is not None:
+            if n_jobs is None and executor is None:
+                n_jobs = 1
+
+            with seeded_random(seed):
+                return self.generate(
+                    next_indexes=next_indexes,
+                    n_jobs=n_jobs,
+                    executor=executor,
+                    num_rows=num_rows,
+                    backend=backend,
+                )
+
+        if backend == "arrow":
+            # Imported here, so that pyarrow is only needed by the arrow backend
+            from did_you_miss_me.generators.arrow import (
+                check_pyarrow,
+                generate_arrow_column,
+            )
+
+            check_pyarrow()
+            generate_column = generate_arrow_column
+
+        elif backend == "pandas":
+            generate_column = _generate_column
+
+        else:
+            raise ValueError(
+                f'Unrecognized backend: {backend}. Expected "pandas" or "arrow".'
+            )
+
         if next_indexes is None:
             next_indexes = Indexes.create()
 
+        # Draw the row count once, so that every column has the same length
+        if num_rows is None:
+            num_rows = self.num_rows
+
         series_dict = {}
         if self.timestamp_and_id_widget is not None:
             timestamp_and_id_result_object = self.timestamp_and_id_widget.generate(
-                num_rows=self.num_rows,
+                num_rows=num_rows,
                 next_indexes=next_indexes,
             )
             series_dict = {**series_dict, **timestamp_and_id_result_object.columns}
+            next_indexes = timestamp_and_id_result_object.next_indexes
+        else:
+            next_indexes = next_indexes.advance(num_rows)
+
+        if n_jobs is None and executor is None:
+            columns = [
+                generate_column(column_generator, num_rows)
+                for column_generator in self.column_generators
+            ]
+
+        else:
+            columns = self._generate_columns_in_parallel(
+                num_rows=num_rows,
+                n_jobs=n_jobs,
+                executor=executor,
+                generate_column=generate_column,
+            )
+
+        if backend == "arrow":
+            import pyarrow as pa
+
+            # The timestamp and ID columns are built with numpy, which Arrow converts without copying
+            arrays_dict = {
+                name: pa.Array.from_pandas(series)
+                for name, series in series_dict.items()
+            }
+            for column_generator, array in zip(self.column_generators, columns):
+                arrays_dict[column_generator.name] = array
+
+            with span("MissingFakerDataframeGenerator.assemble") as s:
+                table = pa.table(arrays_dict)
+                s.set_output(table)
 
-        for i, column_generator in enumerate(self.column_generators):
-            new_series = column_generator.generate(
-                num_rows=self.num_rows,
+            return MissingFakerTableResultObject(
+                table=table,
+                next_indexes=next_indexes,
             )
 
+        for column_generator, new_series in zip(self.column_generators, columns):
             series_dict[column_generator.name] = new_series
 
-        df = pd.DataFrame(series_dict)
+        with span("MissingFakerDataframeGenerator.assemble") as s:
+            df = pd.DataFrame(series_dict)
+            s.set_output(df)
 
         return MissingFakerDataframeResultObject(
             dataframe=df,
-            next_indexes=timestamp_and_id_result_object.next_indexes,
+            next_indexes=next_indexes,
         )
 
+    def compile(self) -> "CompiledDataframePlan":
+        """Compile this generator into a flat, immutable plan for generating many dataframes.
+
+        Faker methods, the elements they sample from, and missingness types are all resolved
+        once, and buffers for the random draws are allocated up front, so generating from the
+        plan skips all of that per-call setup. The plan generates the same data as this
+        generator (see CompiledDataframePlan.generate).
+        """
+
+        # Imported here, since the plan module needs the classes in this module
+        from did_you_miss_me.generators.plan import compile_dataframe_plan
+
+        return compile_dataframe_plan(self)
+
+    def _generate_columns_in_parallel(
+        self,
+        num_rows: int,
+        n_jobs: Optional[int] = None,
+        executor: Optional[ProcessPoolExecutor] = None,
+        generate_column: Optional[
+            Callable[[MissingFakerColumnGenerator, int, int], Any]
+        ] = None,
+    ) -> List[Any]:
+        """Generate every column from its own seeded random stream, fanning out to worker processes.
+
+        Args:
+            num_rows (int): The number of rows in each column.
+            n_jobs (int): The number of worker processes to start, if no executor is given.
+            executor (ProcessPoolExecutor): The process pool to submit columns to.
+            generate_column (Callable): The (module-level) function that generates a column from
+                its generator, num_rows and seed. Defaults to generating a pd.Series.
+        """
+
+        if executor is not None and not isinstance(executor, ProcessPoolExecutor):
+            # Columns are seeded through the process-wide `random` module (and their Faker
+            # instances), so columns generated on threads would draw from each other's streams
+            raise TypeError(
+                f"executor must be a ProcessPoolExecutor, not {type(executor).__name__}."
+            )
+
+        if generate_column is None:
+            generate_column = _generate_column
+
+        seeds = spawn_seeds(len(self.column_generators))
+
+        if executor is not None:
+            return list(
+                executor.map(
+                    generate_column,
+                    self.column_generators,
+                    [num_rows] * len(seeds),
+                    seeds,
+                )
+            )
+
+        if n_jobs == 1:
+            return [
+                generate_column(column_generator, num_rows, seed)
+                for column_generator, seed in zip(self.column_generators, seeds)
+            ]
+
+        max_workers = None if n_jobs < 0 else n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(
+                pool.map(
+                    generate_column,
+                    self.column_generators,
+                    [num_rows] * len(seeds),
+                    seeds,
+                )
+            )
+
     @staticmethod
     def _generate_column_generator(
         column_generator: ColumnGenerator,
@@ -268,6 +472,8 @@ class MissingFakerDataframeGenerator(DataGenerator):
                 name=column_generator.name,
                 missingness_type=missingness_type,
                 faker_type=column_generator.faker_type,
+                use_value_pool=column_generator.use_value_pool,
+                dtype_backend=column_missingness_modifier.dtype_backend,
             )
 
         elif missingness_type == "PROPORTIONAL":
@@ -275,7 +481,24 @@ class MissingFakerDataframeGenerator(DataGenerator):
                 name=column_generator.name,
                 missingness_type=missingness_type,
                 faker_type=column_generator.faker_type,
+                use_value_pool=column_generator.use_value_pool,
                 missingness_params=ProportionalColumnMissingnessParams(
                     proportion=column_missingness_modifier.missingness_params.proportion,
                 ),
+                dtype_backend=column_missingness_modifier.dtype_backend,
             )
+
+
+def _generate_column(
+    column_generator: MissingFakerColumnGenerator,
+    num_rows: int,
+    seed: Optional[int] = None,
+) -> pd.Series:
+    """Generate a single column from its own random stream.
+
+    This is a module-level function so that it can be sent to worker processes.
+    Both the `random` module (which seeds the NumPy draws) and the column's Faker instance
+    are seeded with seed, and both are restored afterwards.
+    """
+
+    return column_generator.generate(num_rows=num_rows, seed=seed)
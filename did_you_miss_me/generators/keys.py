@@ -1,15 +1,23 @@
 from abc import ABC
 from enum import Enum
+import os
 import random
 from typing import Optional
 from pydantic import Field
-from uuid import uuid4
 
+import numpy as np
 import pandas as pd
 
 from did_you_miss_me.generators.column import (
     ColumnGenerator,
 )
+from did_you_miss_me.modifiers.missingness import (
+    apply_null_mask,
+)
+from did_you_miss_me.rng import (
+    get_rng,
+    seedable,
+)
 
 
 class KeyType(str, Enum):
@@ -19,6 +27,106 @@ class KeyType(str, Enum):
     uuid4 = "UUID4"
 
 
+# The number of rows to draw random numbers for at a time
+_CHUNK_SIZE = 1_000_000
+
+# The number of rows that unmasked values are counted over: one 64-bit word of the packed mask
+_BLOCK_SIZE = 64
+
+
+def _get_bit_positions_table() -> np.ndarray:
+    """A (256, 8) table of the position of each set bit in a byte, e.g. [2, 5] for 0b00100100."""
+
+    table = np.zeros((256, 8), dtype=np.uint8)
+    for byte in range(256):
+        positions = [i for i in range(8) if byte >> i & 1]
+        table[byte, : len(positions)] = positions
+
+    return table
+
+
+_BIT_POSITIONS = _get_bit_positions_table()
+
+
+def _draw_mask(
+    num_rows: int,
+    p: float,
+    rng: np.random.Generator,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Draw a boolean mask where each value is True with probability p.
+
+    Random numbers are drawn in chunks, so the only full-length array is the boolean mask itself.
+    If out is given, the mask is written into it (and it's returned).
+    """
+    mask = np.empty(num_rows, dtype=bool) if out is None else out
+    for start in range(0, num_rows, _CHUNK_SIZE):
+        stop = min(start + _CHUNK_SIZE, num_rows)
+        np.less(rng.random(stop - start), p, out=mask[start:stop])
+
+    return mask
+
+
+def _pack_unmasked(
+    mask: np.ndarray,
+) -> np.ndarray:
+    """Pack ~mask into one 64-bit word per block of _BLOCK_SIZE rows, with each block's first row in the lowest bit.
+
+    The mask's length needs to be a multiple of _BLOCK_SIZE. It's packed in chunks, so there's
+    no full-length temporary array.
+    """
+    packed = np.empty(len(mask) // 8, dtype=np.uint8)
+    for start in range(0, len(mask), _CHUNK_SIZE):
+        packed[start // 8 : (start + _CHUNK_SIZE) // 8] = np.packbits(
+            ~mask[start : start + _CHUNK_SIZE], bitorder="little"
+        )
+
+    return packed.view(np.uint64)
+
+
+def _find_unmasked_positions(
+    unmasked_words: np.ndarray,
+    unmasked_counts: np.ndarray,
+    ranks: np.ndarray,
+) -> np.ndarray:
+    """Find the position of the unmasked value with each rank (i.e. np.flatnonzero(~mask)[ranks]).
+
+    Args:
+        unmasked_words: ~mask, packed by _pack_unmasked.
+        unmasked_counts: The cumulative number of unmasked values, up to the end of each block.
+        ranks: The ranks to look up, each less than unmasked_counts[-1].
+    """
+
+    # The ranks are looked up in sorted order, which reads the counts and the words in order
+    # (and is several times faster than looking them up at random)
+    order = np.argsort(ranks)
+    sorted_ranks = ranks[order]
+
+    block_indexes = np.searchsorted(unmasked_counts, sorted_ranks, side="right")
+    words = unmasked_words[block_indexes]
+    ranks_in_block = sorted_ranks - (
+        unmasked_counts[block_indexes] - np.bitwise_count(words)
+    )
+
+    # Find the byte of each word that holds the unmasked value, then the bit within the byte
+    word_bytes = words.view(np.uint8).reshape(len(words), 8)
+    byte_counts = np.bitwise_count(word_bytes)
+    counts_up_to_byte = np.cumsum(byte_counts, axis=1, dtype=np.int8)
+    byte_offsets = np.count_nonzero(
+        counts_up_to_byte <= ranks_in_block[:, np.newaxis], axis=1
+    )
+
+    rows = np.arange(len(words))
+    ranks_in_byte = ranks_in_block - (
+        counts_up_to_byte[rows, byte_offsets] - byte_counts[rows, byte_offsets]
+    )
+    bit_offsets = _BIT_POSITIONS[word_bytes[rows, byte_offsets], ranks_in_byte]
+
+    positions = np.empty_like(block_indexes)
+    positions[order] = block_indexes * _BLOCK_SIZE + byte_offsets * 8 + bit_offsets
+    return positions
+
+
 class KeyColumnGenerator(ColumnGenerator, ABC):
     """Specifies how to create a column containing a key."""
 
@@ -37,29 +145,54 @@ class KeyColumnGenerator(ColumnGenerator, ABC):
 
     def _apply_uniqueness(self, series: pd.Series) -> pd.Series:
         if self.percent_unique < 1:
-            mask = series.apply(lambda x: random.random() < self.percent_unique)
-            new_series = series.copy()
+            rng = get_rng()
+            num_rows = len(series)
+            num_blocks = -(-num_rows // _BLOCK_SIZE)
+
+            # The mask is padded to a whole number of blocks. Padding rows are masked, so
+            # they're never sampled.
+            mask = np.ones(num_blocks * _BLOCK_SIZE, dtype=bool)
+            _draw_mask(num_rows, self.percent_unique, rng, out=mask[:num_rows])
+
+            # Masked values are replaced with values sampled (with replacement) from the
+            # unmasked ones. Rather than listing the unmasked positions (8 bytes per row), the
+            # mask is packed into bits, the unmasked values are counted per block, and each
+            # sampled rank is looked up in the counts.
+            unmasked_words = _pack_unmasked(mask)
+            unmasked_counts = np.cumsum(
+                np.bitwise_count(unmasked_words), dtype=np.int64
+            )
 
-            choices = list(series[mask==False])
             # Verify that there's at least one choice
-            if len(choices) == 0:
+            num_choices = unmasked_counts[-1] if num_blocks > 0 else 0
+            if num_choices == 0:
                 # If not, just return the original series
                 return series
-            
-            new_series[mask] = new_series[mask].apply(
-                lambda x: random.choice(choices)
+
+            values = series.array
+            new_values = values.copy()
+
+            # Work in chunks, so that temporary arrays stay small for very long columns
+            for start in range(0, num_rows, _CHUNK_SIZE):
+                stop = min(start + _CHUNK_SIZE, num_rows)
+                replaced_positions = np.flatnonzero(mask[start:stop]) + start
+                ranks = rng.integers(0, num_choices, size=len(replaced_positions))
+                sampled_positions = _find_unmasked_positions(
+                    unmasked_words, unmasked_counts, ranks
+                )
+                new_values[replaced_positions] = values.take(sampled_positions)
+
+            return pd.Series(
+                new_values, index=series.index, name=series.name, copy=False
             )
-            return new_series
 
         else:
             return series
 
     def _apply_missingness(self, series: pd.Series) -> pd.Series:
         if self.percent_missing > 0:
-            mask = series.apply(lambda x: random.random() < self.percent_missing)
-            new_series = series.copy()
-            new_series[mask] = None
-            return new_series
+            mask = _draw_mask(len(series), self.percent_missing, get_rng())
+            return apply_null_mask(series, mask)
 
         else:
             return series
@@ -98,12 +231,19 @@ class KeyColumnGenerator(ColumnGenerator, ABC):
 
 
 class UuidKeyColumnGenerator(KeyColumnGenerator):
+    data_type: str = Field(
+        "str",
+        description="The data type of the key: 'str' for the usual 36-character strings, or 'bytes' for the raw 16 bytes of each UUID. (With pyarrow installed, 'bytes' keys are stored as a fixed-width Arrow column.)",
+    )
+
     @classmethod
+    @seedable
     def create(
         cls,
         name: Optional[str] = None,
         percent_unique: Optional[float] = None,
         percent_missing: Optional[float] = None,
+        data_type: Optional[str] = None,
     ) -> "UuidKeyColumnGenerator":
         """Create a UuidKeyColumnGenerator."""
 
@@ -116,26 +256,114 @@ class UuidKeyColumnGenerator(KeyColumnGenerator):
         if percent_missing is None:
             percent_missing = random.random() ** 2
 
+        if data_type is None:
+            data_type = "str"
+
         return cls(
             name=name,
             key_type=KeyType.uuid4,
             percent_missing=percent_missing,
             percent_unique=percent_unique,
+            data_type=data_type,
         )
 
+    @seedable
     def generate(
         self,
         num_rows: int,
     ) -> pd.Series:
-        """Generate a column containing key-like data."""
+        """Generate a column containing key-like data.
+
+        All of the UUIDs in the column are generated at once: the random bytes are read in a
+        single call, and the version and variant bits are set for every UUID together.
+        """
+
+        uuid_bytes = self._generate_uuid4_bytes(num_rows)
+
+        if self.data_type == "str":
+            series = pd.Series(self._format_uuid4_strings(uuid_bytes))
 
-        series = pd.Series([str(uuid4()) for _ in range(num_rows)])
+        elif self.data_type == "bytes":
+            series = self._to_bytes_series(uuid_bytes)
+
+        else:
+            raise ValueError(f"Unrecognized data type for UUID keys: {self.data_type}")
 
         series = self._apply_missingness(series)
         series = self._apply_uniqueness(series)
 
         return series
 
+    @staticmethod
+    def _generate_uuid4_bytes(num_rows: int) -> np.ndarray:
+        """Generate random (version 4) UUIDs, as a (num_rows, 16) array of bytes."""
+
+        uuid_bytes = np.frombuffer(os.urandom(16 * num_rows), dtype=np.uint8)
+        uuid_bytes = uuid_bytes.reshape(num_rows, 16).copy()
+
+        # Set the version (4) and variant (RFC 4122) bits, the same way uuid.uuid4 does
+        uuid_bytes[:, 6] = (uuid_bytes[:, 6] & 0x0F) | 0x40
+        uuid_bytes[:, 8] = (uuid_bytes[:, 8] & 0x3F) | 0x80
+
+        return uuid_bytes
+
+    @staticmethod
+    def _format_uuid4_strings(uuid_bytes: np.ndarray) -> np.ndarray:
+        """Format a (num_rows, 16) array of bytes as UUID strings, like str(uuid)."""
+
+        num_rows = uuid_bytes.shape[0]
+
+        # Look up the two hex digits for every byte at once
+        hex_chars = _HEX_PAIRS[uuid_bytes].view(np.uint8).reshape(num_rows, 32)
+
+        dashes = np.full((num_rows, 1), ord("-"), dtype=np.uint8)
+        chars = np.concatenate(
+            [
+                hex_chars[:, :8],
+                dashes,
+                hex_chars[:, 8:12],
+                dashes,
+                hex_chars[:, 12:16],
+                dashes,
+                hex_chars[:, 16:20],
+                dashes,
+                hex_chars[:, 20:],
+            ],
+            axis=1,
+        )
+
+        # Widen each ASCII character to a unicode code point, then read each row as one string
+        return chars.astype(np.uint32).view("U36").reshape(num_rows)
+
+    @staticmethod
+    def _to_bytes_series(uuid_bytes: np.ndarray) -> pd.Series:
+        """Convert a (num_rows, 16) array of bytes to a series with one 16-byte value per UUID."""
+
+        num_rows = uuid_bytes.shape[0]
+
+        try:
+            import pyarrow as pa
+        except ImportError:
+            buffer = uuid_bytes.tobytes()
+            return pd.Series(
+                [buffer[i * 16 : (i + 1) * 16] for i in range(num_rows)],
+                dtype=object,
+            )
+
+        array = pa.FixedSizeBinaryArray.from_buffers(
+            pa.binary(16),
+            num_rows,
+            [None, pa.py_buffer(uuid_bytes.tobytes())],
+        )
+        return pd.Series(pd.arrays.ArrowExtensionArray(array))
+
+
+# The two hex digits for every possible byte value ("00", "01", ..., "ff"), as a lookup table
+_HEX_PAIRS = np.frombuffer(
+    "".join(f"{i:02x}" for i in range(256)).encode("ascii"),
+    dtype=np.uint16,
+)
+
 
 class IntegerKeyColumnGenerator(KeyColumnGenerator):
     digits: int = Field(
@@ -160,6 +388,7 @@ class IntegerKeyColumnGenerator(KeyColumnGenerator):
     )
 
     @classmethod
+    @seedable
     def create(
         cls,
         name: Optional[str] = None,
@@ -206,6 +435,7 @@ class IntegerKeyColumnGenerator(KeyColumnGenerator):
             pad_with_zeros=pad_with_zeros,
         )
 
+    @seedable
     def generate(
         self,
         num_rows: int,
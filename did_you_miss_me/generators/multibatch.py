@@ -1,7 +1,11 @@
 from abc import ABC
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import os
 import random
-from pydantic import Field
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import Any, Iterator, List, Optional
 
 import pandas as pd
 
@@ -18,6 +22,16 @@ from did_you_miss_me.generators.row_count_widget import (
 from did_you_miss_me.generators.timestamps_and_ids import (
     Indexes,
 )
+from did_you_miss_me.instrumentation import (
+    span,
+)
+from did_you_miss_me.modifiers.missingness import (
+    DtypeBackend,
+)
+from did_you_miss_me.rng import (
+    seedable,
+    spawn_seeds,
+)
 
 
 class EpochGenerator(DataGenerator, ABC):
@@ -39,11 +53,13 @@ class MissingFakerEpochGenerator(EpochGenerator):
     )
 
     @classmethod
+    @seedable
     def create(
         cls,
         dataframe_generator: Optional[DataframeGenerator] = None,
         num_batches: Optional[int] = None,
         add_missingness: bool = True,
+        dtype_backend: Optional[DtypeBackend] = None,
         # next_indexes: Optional[Indexes] = None,
     ) -> "MissingFakerEpochGenerator":
         """Create a plan for generating an Epoch, with missingness and Faker data.
@@ -51,6 +67,7 @@ class MissingFakerEpochGenerator(EpochGenerator):
         Args:
             dataframe_generator (DataframeGenerator): A basic (no missingness) generator for this epoch.
             num_batches (int): The number of batches to generate in this epoch.
+            dtype_backend (str): "numpy_nullable" or "pyarrow", to store each column in a nullable dtype.
 
         Note:
             `dataframe_generator` will be used to create a MissingFakerDataframeGenerator.
@@ -61,9 +78,12 @@ class MissingFakerEpochGenerator(EpochGenerator):
         if dataframe_generator is None:
             dataframe_generator = DataframeGenerator.create()
 
-        missing_faker_dataframe_generator = MissingFakerDataframeGenerator.create_using_dataframe_generator(
-            dataframe_generator=dataframe_generator,
-            add_missingness=add_missingness,
+        missing_faker_dataframe_generator = (
+            MissingFakerDataframeGenerator.create_using_dataframe_generator(
+                dataframe_generator=dataframe_generator,
+                add_missingness=add_missingness,
+                dtype_backend=dtype_backend,
+            )
         )
 
         return cls(
@@ -72,6 +92,30 @@ class MissingFakerEpochGenerator(EpochGenerator):
         )
 
 
+class MissingFakerBatchResultObject(BaseModel):
+    """
+    A single batch, as yielded by MissingFakerMultiBatchGenerator.iter_batches.
+    """
+
+    epoch_index: int
+    batch_index: int
+    dataframe: Any  # pd.DataFrame
+    indexes: Indexes
+    next_indexes: Indexes
+
+
+class MissingFakerBatchPlan(BaseModel):
+    """
+    Everything needed to generate a single batch, independently of the batches before it.
+    """
+
+    epoch_index: int
+    batch_index: int
+    num_rows: int
+    indexes: Indexes
+    seed: int
+
+
 class MultiBatchGenerator(DataGenerator, ABC):
     """
     Abstract base class for MultiBatchGenerators
@@ -88,6 +132,7 @@ class MissingFakerMultiBatchGenerator(MultiBatchGenerator):
         return len(self.epochs)
 
     @classmethod
+    @seedable
     def create(
         cls,
         epochs: Optional[List[MissingFakerEpochGenerator]] = None,
@@ -102,6 +147,8 @@ class MissingFakerMultiBatchGenerator(MultiBatchGenerator):
         include_foreign_keys=False,
         include_timestamps: bool = False,
         add_missingness: bool = True,
+        use_value_pools: bool = False,
+        dtype_backend: Optional[DtypeBackend] = None,
     ):
         if epochs is None:
             if num_epochs is None:
@@ -118,6 +165,7 @@ class MissingFakerMultiBatchGenerator(MultiBatchGenerator):
                 include_primary_key=include_primary_key,
                 include_foreign_keys=include_foreign_keys,
                 include_timestamps=include_timestamps,
+                use_value_pools=use_value_pools,
             )
 
             epochs = [
@@ -125,6 +173,7 @@ class MissingFakerMultiBatchGenerator(MultiBatchGenerator):
                     dataframe_generator=dataframe_generator,
                     num_batches=batches_per_epoch,
                     add_missingness=add_missingness,
+                    dtype_backend=dtype_backend,
                 )
                 for _ in range(num_epochs)
             ]
@@ -138,26 +187,242 @@ class MissingFakerMultiBatchGenerator(MultiBatchGenerator):
         print_updates: bool = False,
         print_mod: int = 5,
         next_indexes: Optional[Indexes] = None,
+        n_jobs: Optional[int] = None,
+        seed: Optional[int] = None,
     ) -> pd.DataFrame:
-        multibatch_df = pd.DataFrame()
+        # Collect every batch, then concatenate once at the end.
+        # (Concatenating inside the loop copies the accumulated dataframe for every batch,
+        # which makes generation quadratic in the number of batches.)
+        batch_dfs = [
+            result_object.dataframe
+            for result_object in self.iter_batches(
+                print_updates=print_updates,
+                print_mod=print_mod,
+                next_indexes=next_indexes,
+                n_jobs=n_jobs,
+                seed=seed,
+            )
+        ]
+
+        if len(batch_dfs) == 0:
+            return pd.DataFrame()
+
+        with span("MissingFakerMultiBatchGenerator.concat") as s:
+            multibatch_df = pd.concat(batch_dfs, ignore_index=True)
+            s.set_output(multibatch_df)
+
+        return multibatch_df
+
+    def iter_batches(
+        self,
+        print_updates: bool = False,
+        print_mod: int = 5,
+        next_indexes: Optional[Indexes] = None,
+        n_jobs: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> Iterator[MissingFakerBatchResultObject]:
+        """Generate the multibatch dataset one batch at a time.
+
+        Each batch is yielded as soon as it is generated, so only one batch needs to be
+        held in memory at a time.
+
+        Args:
+            print_updates (bool): Whether to print progress updates.
+            print_mod (int): Print an update every print_mod batches.
+            next_indexes (Indexes): The indexes to start the first batch from.
+            n_jobs (int): If given, plan every batch up front (see plan_batches), and generate
+                the batches in a pool of n_jobs worker processes. n_jobs=1 generates them in
+                this process, and n_jobs=-1 uses one worker per CPU. Batches are still yielded
+                in order, and the result doesn't depend on the number of workers.
+            seed (int): If given, plan every batch up front from this seed, so that the dataset
+                only depends on the seed (and not on n_jobs). Columns with use_value_pool are
+                the exception, since their pools depend on earlier calls.
+        """
+
+        if seed is not None:
+            yield from self._iter_planned_batches(
+                self.plan_batches(next_indexes=next_indexes, seed=seed),
+                n_jobs=n_jobs if n_jobs is not None else 1,
+                print_updates=print_updates,
+                print_mod=print_mod,
+            )
+            return
 
         if next_indexes is None:
             next_indexes = Indexes.create()
 
+        if n_jobs is not None:
+            yield from self._iter_planned_batches(
+                self.plan_batches(next_indexes=next_indexes),
+                n_jobs=n_jobs,
+                print_updates=print_updates,
+                print_mod=print_mod,
+            )
+            return
+
         for j, epoch_generator in enumerate(self.epochs):
             if print_updates:
                 print(f"===== Epoch: {j} of {self.num_epochs} =====")
 
+            # Every batch in the epoch comes from the same generator, so compile it once
+            plan = epoch_generator.missing_faker_dataframe_generator.compile()
+
             for k in range(epoch_generator.num_batches):
                 if print_updates and k % print_mod == 0:
                     print(f"Batch: {k} of {epoch_generator.num_batches}")
 
-                result_object = epoch_generator.missing_faker_dataframe_generator.generate(
+                result_object = plan.generate(
                     next_indexes=next_indexes,
                 )
 
-                multibatch_df = pd.concat([multibatch_df, result_object.dataframe], ignore_index=True)
-                
+                yield MissingFakerBatchResultObject(
+                    epoch_index=j,
+                    batch_index=k,
+                    dataframe=result_object.dataframe,
+                    indexes=next_indexes,
+                    next_indexes=result_object.next_indexes,
+                )
+
                 next_indexes = result_object.next_indexes
 
-        return multibatch_df
+    @seedable
+    def plan_batches(
+        self,
+        next_indexes: Optional[Indexes] = None,
+    ) -> List[MissingFakerBatchPlan]:
+        """Work out the row count, starting indexes, and random seed of every batch up front.
+
+        Batches only depend on each other through their indexes, so once they are planned,
+        the batches can be generated in any order (or all at once).
+
+        Args:
+            next_indexes (Indexes): The indexes to start the first batch from.
+        """
+
+        if next_indexes is None:
+            next_indexes = Indexes.create()
+
+        seeds = spawn_seeds(sum(epoch.num_batches for epoch in self.epochs))
+
+        batch_plans = []
+        for j, epoch_generator in enumerate(self.epochs):
+            for k in range(epoch_generator.num_batches):
+                num_rows = epoch_generator.missing_faker_dataframe_generator.num_rows
+
+                batch_plans.append(
+                    MissingFakerBatchPlan(
+                        epoch_index=j,
+                        batch_index=k,
+                        num_rows=num_rows,
+                        indexes=next_indexes,
+                        seed=seeds[len(batch_plans)],
+                    )
+                )
+
+                next_indexes = next_indexes.advance(num_rows)
+
+        return batch_plans
+
+    def generate_batch(
+        self,
+        batch_plan: MissingFakerBatchPlan,
+    ) -> MissingFakerBatchResultObject:
+        """Generate a single planned batch.
+
+        All of the randomness in the batch comes from batch_plan.seed, so the batch comes out
+        the same no matter which process generates it, or when.
+        """
+
+        epoch_generator = self.epochs[batch_plan.epoch_index]
+
+        result_object = epoch_generator.missing_faker_dataframe_generator.generate(
+            next_indexes=batch_plan.indexes,
+            num_rows=batch_plan.num_rows,
+            seed=batch_plan.seed,
+        )
+
+        return MissingFakerBatchResultObject(
+            epoch_index=batch_plan.epoch_index,
+            batch_index=batch_plan.batch_index,
+            dataframe=result_object.dataframe,
+            indexes=batch_plan.indexes,
+            next_indexes=result_object.next_indexes,
+        )
+
+    def _iter_planned_batches(
+        self,
+        batch_plans: List[MissingFakerBatchPlan],
+        n_jobs: int,
+        print_updates: bool = False,
+        print_mod: int = 5,
+    ) -> Iterator[MissingFakerBatchResultObject]:
+        """Generate planned batches, in a process pool unless n_jobs is 1, and yield them in order."""
+
+        if n_jobs == 1:
+            for plan in batch_plans:
+                result_object = self.generate_batch(plan)
+                self._print_update(result_object, print_updates, print_mod)
+                yield result_object
+            return
+
+        max_workers = n_jobs if n_jobs > 0 else os.cpu_count()
+
+        # Each worker receives a copy of this generator once, when it starts, rather than with every batch.
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(self,),
+        ) as pool:
+            # Keep a bounded number of batches in flight, so that finished batches
+            # don't pile up in memory while the caller works through earlier ones.
+            remaining_plans = iter(batch_plans)
+            futures = deque(
+                pool.submit(_generate_batch_in_worker, plan)
+                for plan in islice(remaining_plans, 2 * max_workers)
+            )
+
+            while futures:
+                result_object = futures.popleft().result()
+
+                plan = next(remaining_plans, None)
+                if plan is not None:
+                    futures.append(pool.submit(_generate_batch_in_worker, plan))
+
+                self._print_update(result_object, print_updates, print_mod)
+                yield result_object
+
+    def _print_update(
+        self,
+        result_object: MissingFakerBatchResultObject,
+        print_updates: bool,
+        print_mod: int,
+    ) -> None:
+        if not print_updates:
+            return
+
+        num_batches = self.epochs[result_object.epoch_index].num_batches
+
+        if result_object.batch_index == 0:
+            print(
+                f"===== Epoch: {result_object.epoch_index} of {self.num_epochs} ====="
+            )
+
+        if result_object.batch_index % print_mod == 0:
+            print(f"Batch: {result_object.batch_index} of {num_batches}")
+
+
+# The generator that a batch worker process generates batches from. (Set by _init_batch_worker.)
+_worker_multibatch_generator: Optional[MissingFakerMultiBatchGenerator] = None
+
+
+def _init_batch_worker(
+    multibatch_generator: MissingFakerMultiBatchGenerator,
+) -> None:
+    global _worker_multibatch_generator
+    _worker_multibatch_generator = multibatch_generator
+
+
+def _generate_batch_in_worker(
+    batch_plan: MissingFakerBatchPlan,
+) -> MissingFakerBatchResultObject:
+    return _worker_multibatch_generator.generate_batch(batch_plan)
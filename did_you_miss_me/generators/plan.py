@@ -0,0 +1,351 @@
+"""
+Compiled execution plans for generating many batches from the same generator.
+"""
+
+from functools import partial
+import random
+from typing import Any, Callable, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray
+
+from did_you_miss_me.generators.column import (
+    MissingFakerColumnGenerator,
+)
+from did_you_miss_me.generators.dataframe import (
+    MissingFakerDataframeGenerator,
+    MissingFakerDataframeResultObject,
+)
+from did_you_miss_me.generators.row_count_widget import (
+    RowCountWidget,
+)
+from did_you_miss_me.generators.value_pool import (
+    get_faker_value_pool_cache,
+)
+from did_you_miss_me.generators.timestamps_and_ids import (
+    Indexes,
+    TimestampAndIdWidget,
+)
+from did_you_miss_me.instrumentation import (
+    instrumented,
+    span,
+)
+from did_you_miss_me.modifiers.missingness import (
+    ColumnMissingnessType,
+    DtypeBackend,
+    apply_null_mask,
+    to_nullable_dtype,
+)
+from did_you_miss_me.rng import (
+    get_rng,
+    seeded_random,
+    spawn_seeds,
+)
+
+
+class CompiledColumnPlan(BaseModel):
+    """A single column of a CompiledDataframePlan, with everything it needs already bound."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    name: str
+    draw: Callable[[int, np.ndarray], pd.Series]
+    add_missingness: Callable[[pd.Series, np.ndarray, np.ndarray], pd.Series]
+    faker_random: random.Random
+
+
+class CompiledDataframePlan(BaseModel):
+    """A flat, immutable plan for generating dataframes, made by MissingFakerDataframeGenerator.compile.
+
+    All of the per-call setup is done once, when the plan is compiled: faker methods (or the
+    elements and weights that they sample from) are looked up and bound, missingness types
+    are resolved to functions, and buffers for the random draws are allocated up front.
+    Generating a dataframe from the plan draws the same values as generating it from the
+    generator that the plan was compiled from.
+
+    Note:
+        The buffers are reused by every call, so a plan shouldn't be shared between threads.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    column_plans: Tuple[CompiledColumnPlan, ...]
+    row_count_widget: RowCountWidget
+    timestamp_and_id_widget: Optional[TimestampAndIdWidget]
+    uniform_buffer: np.ndarray
+    mask_buffer: np.ndarray
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        return tuple(column_plan.name for column_plan in self.column_plans)
+
+    @instrumented
+    def generate(
+        self,
+        next_indexes: Optional[Indexes] = None,
+        num_rows: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> MissingFakerDataframeResultObject:
+        """Generate a dataframe from the plan, the same way as MissingFakerDataframeGenerator.generate.
+
+        Args:
+            next_indexes (Indexes): The indexes to start the timestamp and ID columns from.
+            num_rows (int): The number of rows to generate. Defaults to a draw from row_count_widget.
+            seed (int): If given, generate every column from its own stream spawned from seed.
+                The result is the same as MissingFakerDataframeGenerator.generate with the same seed.
+        """
+
+        if seed is not None:
+            with seeded_random(seed):
+                return self._generate(
+                    next_indexes=next_indexes,
+                    num_rows=num_rows,
+                    seed_columns=True,
+                )
+
+        return self._generate(
+            next_indexes=next_indexes,
+            num_rows=num_rows,
+            seed_columns=False,
+        )
+
+    def _generate(
+        self,
+        next_indexes: Optional[Indexes],
+        num_rows: Optional[int],
+        seed_columns: bool,
+    ) -> MissingFakerDataframeResultObject:
+        if next_indexes is None:
+            next_indexes = Indexes.create()
+
+        if num_rows is None:
+            num_rows = self.row_count_widget.num_rows
+
+        uniform_buffer, mask_buffer = self._get_buffers(num_rows)
+
+        series_dict = {}
+        if self.timestamp_and_id_widget is not None:
+            timestamp_and_id_result_object = self.timestamp_and_id_widget.generate(
+                num_rows=num_rows,
+                next_indexes=next_indexes,
+            )
+            series_dict.update(timestamp_and_id_result_object.columns)
+            next_indexes = timestamp_and_id_result_object.next_indexes
+        else:
+            next_indexes = next_indexes.advance(num_rows)
+
+        if seed_columns:
+            column_seeds = spawn_seeds(len(self.column_plans))
+        else:
+            column_seeds = [None] * len(self.column_plans)
+
+        for column_plan, column_seed in zip(self.column_plans, column_seeds):
+            with seeded_random(column_seed), seeded_random(
+                column_seed, column_plan.faker_random
+            ):
+                with span("CompiledColumnPlan.draw", column=column_plan.name) as s:
+                    series = column_plan.draw(num_rows, uniform_buffer)
+                    s.set_output(series)
+
+                with span(
+                    "CompiledColumnPlan.add_missingness", column=column_plan.name
+                ) as s:
+                    series_dict[column_plan.name] = column_plan.add_missingness(
+                        series, uniform_buffer, mask_buffer
+                    )
+                    s.set_output(series_dict[column_plan.name])
+
+        with span("CompiledDataframePlan.assemble") as s:
+            # Every series is new, so there's no need for the dataframe to copy them
+            df = pd.DataFrame(series_dict, copy=False)
+            s.set_output(df)
+
+        return MissingFakerDataframeResultObject(
+            dataframe=df,
+            next_indexes=next_indexes,
+        )
+
+    def _get_buffers(
+        self,
+        num_rows: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get views of the preallocated buffers with num_rows values.
+
+        If num_rows is larger than the plan's buffers (e.g. a num_rows passed in by the
+        caller), fresh buffers are allocated for this call.
+        """
+
+        if num_rows > len(self.uniform_buffer):
+            return np.empty(num_rows, dtype=np.float64), np.empty(num_rows, dtype=bool)
+
+        return self.uniform_buffer[:num_rows], self.mask_buffer[:num_rows]
+
+
+def compile_dataframe_plan(
+    dataframe_generator: MissingFakerDataframeGenerator,
+) -> CompiledDataframePlan:
+    """Compile a MissingFakerDataframeGenerator into a CompiledDataframePlan.
+
+    See MissingFakerDataframeGenerator.compile.
+    """
+
+    row_count_widget = dataframe_generator.row_count_widget
+    if row_count_widget.exact_rows is not None:
+        max_rows = row_count_widget.exact_rows
+    else:
+        max_rows = row_count_widget.max_rows
+
+    column_plans = tuple(
+        CompiledColumnPlan(
+            name=column_generator.name,
+            draw=_compile_draw(column_generator),
+            add_missingness=_compile_add_missingness(column_generator),
+            faker_random=column_generator._fake.random,
+        )
+        for column_generator in dataframe_generator.column_generators
+    )
+
+    return CompiledDataframePlan(
+        column_plans=column_plans,
+        row_count_widget=row_count_widget,
+        timestamp_and_id_widget=dataframe_generator.timestamp_and_id_widget,
+        uniform_buffer=np.empty(max_rows, dtype=np.float64),
+        mask_buffer=np.empty(max_rows, dtype=bool),
+    )
+
+
+def _compile_draw(
+    column_generator: MissingFakerColumnGenerator,
+) -> Callable[[int, np.ndarray], pd.Series]:
+    """Bind the faker method (or the elements it samples from) for a column."""
+
+    method = getattr(column_generator._fake, column_generator.faker_type)
+    faker_elements = column_generator._get_faker_elements(method)
+
+    if faker_elements is None and column_generator.use_value_pool:
+        # The cache is looked up on every draw, so that set_faker_value_pool_cache still applies
+        return partial(
+            _draw_pooled_values,
+            column_generator.faker_type,
+            method,
+        )
+
+    if faker_elements is None:
+        return partial(_draw_faker_values, method)
+
+    # Take from the underlying array, rather than the Series, to skip building an index
+    elements, probabilities = faker_elements
+    if probabilities is None:
+        return partial(_draw_uniform_elements, elements.array)
+
+    # The same cumulative distribution that Generator.choice builds on every call
+    cdf = probabilities.cumsum()
+    cdf /= cdf[-1]
+
+    return partial(_draw_weighted_elements, elements.array, cdf)
+
+
+def _draw_faker_values(
+    method: Callable[[], Any],
+    num_rows: int,
+    uniform_buffer: np.ndarray,
+) -> pd.Series:
+    return pd.Series([method() for i in range(num_rows)])
+
+
+def _draw_pooled_values(
+    faker_type: str,
+    method: Callable[[], Any],
+    num_rows: int,
+    uniform_buffer: np.ndarray,
+) -> pd.Series:
+    return get_faker_value_pool_cache().sample(faker_type, method, num_rows)
+
+
+def _draw_uniform_elements(
+    elements: ExtensionArray,
+    num_rows: int,
+    uniform_buffer: np.ndarray,
+) -> pd.Series:
+    indices = get_rng().integers(0, len(elements), size=num_rows)
+    return pd.Series(elements.take(indices), copy=False)
+
+
+def _draw_weighted_elements(
+    elements: ExtensionArray,
+    cdf: np.ndarray,
+    num_rows: int,
+    uniform_buffer: np.ndarray,
+) -> pd.Series:
+    get_rng().random(out=uniform_buffer)
+    indices = cdf.searchsorted(uniform_buffer, side="right")
+    return pd.Series(elements.take(indices), copy=False)
+
+
+def _compile_add_missingness(
+    column_generator: MissingFakerColumnGenerator,
+) -> Callable[[pd.Series, np.ndarray, np.ndarray], pd.Series]:
+    """Resolve a column's missingness type to a function that applies it."""
+
+    dtype_backend = column_generator.dtype_backend
+
+    if column_generator.missingness_type == ColumnMissingnessType.NEVER:
+        if dtype_backend is None:
+            return _add_no_missingness
+        return partial(_convert_to_nullable_dtype, dtype_backend)
+
+    elif column_generator.missingness_type == ColumnMissingnessType.ALWAYS:
+        return partial(_add_all_missingness, dtype_backend)
+
+    elif column_generator.missingness_type == ColumnMissingnessType.PROPORTIONAL:
+        return partial(
+            _add_proportional_missingness,
+            column_generator.missingness_params.proportion,
+            dtype_backend,
+        )
+
+    else:
+        raise ValueError(
+            f"Unrecognized missingness type: {column_generator.missingness_type}"
+        )
+
+
+def _add_no_missingness(
+    series: pd.Series,
+    uniform_buffer: np.ndarray,
+    mask_buffer: np.ndarray,
+) -> pd.Series:
+    return series
+
+
+def _convert_to_nullable_dtype(
+    dtype_backend: DtypeBackend,
+    series: pd.Series,
+    uniform_buffer: np.ndarray,
+    mask_buffer: np.ndarray,
+) -> pd.Series:
+    return to_nullable_dtype(series, dtype_backend)
+
+
+def _add_all_missingness(
+    dtype_backend: Optional[DtypeBackend],
+    series: pd.Series,
+    uniform_buffer: np.ndarray,
+    mask_buffer: np.ndarray,
+) -> pd.Series:
+    mask_buffer.fill(True)
+    return apply_null_mask(series, mask_buffer, dtype_backend=dtype_backend)
+
+
+def _add_proportional_missingness(
+    proportion: float,
+    dtype_backend: Optional[DtypeBackend],
+    series: pd.Series,
+    uniform_buffer: np.ndarray,
+    mask_buffer: np.ndarray,
+) -> pd.Series:
+    get_rng().random(out=uniform_buffer)
+    np.less(uniform_buffer, proportion, out=mask_buffer)
+    return apply_null_mask(series, mask_buffer, dtype_backend=dtype_backend)
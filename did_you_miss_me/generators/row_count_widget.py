@@ -2,6 +2,8 @@ import random
 from pydantic import BaseModel
 from typing import Optional
 
+from did_you_miss_me.rng import seedable
+
 
 class RowCountWidget(BaseModel):
     """Specifies how many rows should be generated
@@ -23,6 +25,7 @@ class RowCountWidget(BaseModel):
             return random.randint(self.min_rows, self.max_rows)
 
     @classmethod
+    @seedable
     def create(
         cls,
         exact_rows: Optional[int] = None,
@@ -1,17 +1,30 @@
 import datetime
 from enum import Enum
 import random
+import time
 from typing import Any, List, Optional
 from pydantic import Field
 
+import numpy as np
 import pandas as pd
 
 from did_you_miss_me.generators.column import (
     MultiColumnGenerator,
 )
+from did_you_miss_me.instrumentation import (
+    span,
+)
+from did_you_miss_me.rng import (
+    get_rng,
+    is_seeded,
+    seedable,
+)
 
 ### Timestamps ###
 
+# The default end_time when a generator is created with a seed (2026-01-01T00:00:00Z)
+SEEDED_END_TIME = 1_767_225_600
+
 
 class TimestampFormat(str, Enum):
     """Types of timestamp formats"""
@@ -40,6 +53,7 @@ class TimestampMultiColumnGenerator(MultiColumnGenerator):
     )
 
     @classmethod
+    @seedable
     def create(
         cls,
         names: Optional[str] = None,
@@ -48,14 +62,22 @@ class TimestampMultiColumnGenerator(MultiColumnGenerator):
         end_time: Optional[int] = None,
         sortedness: Optional[float] = None,
     ) -> Any:
-        """Create a TimestampColumnGenerator."""
+        """Create a TimestampColumnGenerator.
+
+        end_time defaults to the current time, or to SEEDED_END_TIME when the generator is
+        created with a seed (so that the same seed always gives the same timestamps).
+        """
 
         if timestamp_format is None:
             timestamp_format = random.choice(list(TimestampFormat))
 
         if end_time is None:
-            # Get the current unix epoch
-            end_time = int(datetime.datetime.now().timestamp())
+            if is_seeded():
+                # With a seed, the current time would make the timestamps change from call to call
+                end_time = SEEDED_END_TIME
+            else:
+                # Get the current unix epoch
+                end_time = int(datetime.datetime.now().timestamp())
 
         if start_time is None:
             start_time = end_time - 3600 * 24 * random.randint(1, 365)
@@ -78,6 +100,7 @@ class TimestampMultiColumnGenerator(MultiColumnGenerator):
             sortedness=sortedness,
         )
 
+    @seedable
     def generate(
         self,
         num_rows: int,
@@ -85,15 +108,22 @@ class TimestampMultiColumnGenerator(MultiColumnGenerator):
         """Generate a timestamp column."""
 
         # Create a series of random timestamps
-        series = pd.Series(
-            [random.randint(self.start_time, self.end_time) for _ in range(num_rows)]
+        timestamps = get_rng().integers(
+            self.start_time,
+            self.end_time,
+            size=num_rows,
+            endpoint=True,
         )
 
         # Sort the series, at least partially
-        sortedish_series = self._partial_sort(series, self.sortedness)
+        with span("TimestampMultiColumnGenerator.partial_sort") as s:
+            sortedish_series = self._partial_sort(timestamps, self.sortedness)
+            s.set_output(sortedish_series)
 
         # Format the series, depending on the timestamp format
-        formatted_series = self._reformat_series(sortedish_series)
+        with span("TimestampMultiColumnGenerator.reformat") as s:
+            formatted_series = self._reformat_series(sortedish_series)
+            s.set_output(dict(zip(self.names, formatted_series)))
 
         return dict(zip(self.names, formatted_series))
 
@@ -104,34 +134,28 @@ class TimestampMultiColumnGenerator(MultiColumnGenerator):
             formatted_series = [series]
 
         elif self.timestamp_format == TimestampFormat.ISO_8601:
-            formatted_series = [series.apply(datetime.datetime.fromtimestamp)]
+            formatted_series = [self._to_local_datetimes(series)]
 
         elif self.timestamp_format == TimestampFormat.SINGLE_COLUMN_TIMESTAMP:
-            formatted_series = [
-                series.apply(datetime.datetime.fromtimestamp).apply(str)
-            ]
+            formatted_series = [self._to_local_datetimes(series).astype(str)]
 
         elif self.timestamp_format == TimestampFormat.MULTI_COLUMN_TIMESTAMP:
-            date_series = series.apply(datetime.datetime.fromtimestamp).apply(
-                lambda x: x.date()
-            )
-            time_series = series.apply(datetime.datetime.fromtimestamp).apply(
-                lambda x: x.time()
-            )
+            datetime_series = self._to_local_datetimes(series)
+
+            date_series = datetime_series.dt.date
+            time_series = datetime_series.dt.time
 
             formatted_series = [date_series, time_series]
 
         elif self.timestamp_format == TimestampFormat.SINGLE_COLUMN_DATE:
-            formatted_series = [
-                series.apply(datetime.datetime.fromtimestamp).apply(lambda x: x.date())
-            ]
+            formatted_series = [self._to_local_datetimes(series).dt.date]
 
         elif self.timestamp_format == TimestampFormat.MULTI_COLUMN_DATE:
-            datetime_series = series.apply(datetime.datetime.fromtimestamp)
+            datetime_series = self._to_local_datetimes(series)
 
-            year_series = datetime_series.apply(lambda x: x.year)
-            month_series = datetime_series.apply(lambda x: x.month)
-            day_series = datetime_series.apply(lambda x: x.day)
+            year_series = datetime_series.dt.year.astype("int64")
+            month_series = datetime_series.dt.month.astype("int64")
+            day_series = datetime_series.dt.day.astype("int64")
 
             formatted_series = [
                 year_series,
@@ -146,6 +170,23 @@ class TimestampMultiColumnGenerator(MultiColumnGenerator):
 
         return formatted_series
 
+    @staticmethod
+    def _to_local_datetimes(series: pd.Series) -> pd.Series:
+        """Convert unix timestamps to naive datetimes in local time.
+
+        This gives the same values as applying datetime.datetime.fromtimestamp to each
+        element, but converts the whole series at once.
+
+        Args:
+            series: A series of integer timestamps, in seconds since the Unix epoch.
+        """
+        timestamps = np.asarray(series, dtype="int64")
+        local_timestamps = timestamps + _get_utc_offsets(timestamps)
+
+        datetimes = pd.to_datetime(local_timestamps, unit="s").as_unit("us")
+
+        return pd.Series(datetimes)
+
     @staticmethod
     def _partial_sort(
         series: pd.Series,
@@ -153,33 +194,30 @@ class TimestampMultiColumnGenerator(MultiColumnGenerator):
     ):
         """Partially sort a pandas Series.
 
+        A random subset of (length * p) values is sorted, and then scattered back into randomly
+        chosen positions, in order. The remaining values fill the other positions in random order.
+
         Args:
             series: The list to partially sort.
             p: A number between 0 and 1 indicating how sorted the list should be. 0 means completely random, 1 means completely sorted.
         """
-        list_ = list(series)
+        values = np.asarray(series)
 
-        length = len(list_)
+        length = len(values)
         cutoff = int(length * p)
 
-        copied_list = list_.copy()
-        random.shuffle(copied_list)
+        rng = get_rng()
+        shuffled_values = values[rng.permutation(length)]
 
-        sorted_list = sorted(copied_list[:cutoff])
-        random_list = copied_list[cutoff:]
-        random.shuffle(random_list)
+        # The positions that receive the sorted values
+        is_sorted_position = np.zeros(length, dtype=bool)
+        is_sorted_position[rng.permutation(length)[:cutoff]] = True
 
-        source_list = [1 for _ in range(cutoff)] + [0 for _ in range(length - cutoff)]
-        random.shuffle(source_list)
+        partially_sorted_values = np.empty_like(shuffled_values)
+        partially_sorted_values[is_sorted_position] = np.sort(shuffled_values[:cutoff])
+        partially_sorted_values[~is_sorted_position] = shuffled_values[cutoff:]
 
-        partially_sorted_list = []
-        for source in source_list:
-            if source == 1:
-                partially_sorted_list.append(sorted_list.pop(0))
-            else:
-                partially_sorted_list.append(random_list.pop(0))
-
-        return pd.Series(partially_sorted_list)
+        return pd.Series(partially_sorted_values)
 
     @staticmethod
     def get_column_names(timestamp_format: TimestampFormat) -> List[str]:
@@ -207,3 +245,37 @@ class TimestampMultiColumnGenerator(MultiColumnGenerator):
             raise NotImplementedError(
                 f"Timestamp format {timestamp_format} not implemented."
             )
+
+
+def _get_utc_offsets(timestamps: np.ndarray) -> np.ndarray:
+    """Get the local UTC offset, in seconds, for each of an array of unix timestamps.
+
+    Offsets are looked up once per distinct day, rather than once per value. On days when
+    the offset changes (e.g. the start or end of daylight saving time), they're looked up
+    once per distinct quarter hour instead, since offsets only change on quarter-hour boundaries.
+    """
+
+    def lookup(moments: np.ndarray) -> np.ndarray:
+        return np.array(
+            [time.localtime(x).tm_gmtoff for x in moments.tolist()],
+            dtype="int64",
+        )
+
+    days, day_inverse = np.unique(timestamps // 86400, return_inverse=True)
+    day_inverse = day_inverse.reshape(-1)
+    start_of_day_offsets = lookup(days * 86400)
+    end_of_day_offsets = lookup(days * 86400 + 86399)
+
+    utc_offsets = start_of_day_offsets[day_inverse]
+
+    is_transition_day = (start_of_day_offsets != end_of_day_offsets)[day_inverse]
+    if is_transition_day.any():
+        quarter_hours, quarter_hour_inverse = np.unique(
+            timestamps[is_transition_day] // 900,
+            return_inverse=True,
+        )
+        utc_offsets[is_transition_day] = lookup(quarter_hours * 900)[
+            quarter_hour_inverse.reshape(-1)
+        ]
+
+    return utc_offsets
@@ -15,6 +15,7 @@ from did_you_miss_me.generators.keys import (
 from did_you_miss_me.generators.timestamp import (
     TimestampMultiColumnGenerator,
 )
+from did_you_miss_me.rng import seedable
 
 
 class Indexes(BaseModel):
@@ -23,6 +24,7 @@ class Indexes(BaseModel):
     batch_id: Optional[int] = None
 
     @classmethod
+    @seedable
     def create(
         cls,
         primary_key: Optional[int] = None,
@@ -44,9 +46,28 @@ class Indexes(BaseModel):
             batch_id=batch_id,
         )
 
+    def advance(
+        self,
+        num_rows: int,
+    ) -> "Indexes":
+        """Get the indexes for the batch that follows a batch of num_rows rows starting at these indexes.
+
+        The timestamp index counts rows, the same way as the primary key. It isn't a time:
+        timestamp columns are drawn from their generator's start_time and end_time, and never
+        read it. So the next batch's indexes only depend on the row count, and can be worked
+        out before the batch is generated (see MissingFakerMultiBatchGenerator.plan_batches).
+        """
+
+        return Indexes(
+            batch_id=self.batch_id + 1,
+            primary_key=self.primary_key + num_rows,
+            timestamp=self.timestamp + num_rows,
+        )
+
+
 class TimestampAndIdResultObject(BaseModel):
 
-    columns: Dict[str, Any]#pd.Series]
+    columns: Dict[str, Any]  # pd.Series]
     next_indexes: Indexes
 
 
@@ -71,6 +92,7 @@ class TimestampAndIdWidget(BaseModel):
     )
 
     @classmethod
+    @seedable
     def create(
         cls,
         include_batch_id: bool = False,
@@ -91,9 +113,11 @@ class TimestampAndIdWidget(BaseModel):
             batch_id_column_generator = None
 
         if include_primary_key:
-            primary_key_column_generator = IntegerKeyColumnGenerator.create_primary_key()
+            primary_key_column_generator = (
+                IntegerKeyColumnGenerator.create_primary_key()
+            )
             names = [primary_key_column_generator.name]
-        
+
         else:
             primary_key_column_generator = None
 
@@ -126,6 +150,7 @@ class TimestampAndIdWidget(BaseModel):
             timestamp_column_generator=timestamp_column_generator,
         )
 
+    @seedable
     def generate(
         self,
         num_rows: int,
@@ -165,13 +190,7 @@ class TimestampAndIdWidget(BaseModel):
 
             series_dict = {**series_dict, **timestamp_series_dict}
 
-        next_primary_key = next_indexes.primary_key + num_rows
-
         return TimestampAndIdResultObject(
             columns=series_dict,
-            next_indexes=Indexes(
-                batch_id=next_indexes.batch_id + 1,
-                primary_key=next_primary_key,
-                timestamp=next_indexes.timestamp + num_rows, #!!! Not right
-            ),
+            next_indexes=next_indexes.advance(num_rows),
         )
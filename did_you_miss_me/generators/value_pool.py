@@ -0,0 +1,204 @@
+"""
+A size-bounded cache of pre-generated Faker values, for faker types that are expensive to call row by row.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+from pydantic import BaseModel, Field, PrivateAttr
+
+import pandas as pd
+
+from did_you_miss_me.rng import get_rng
+
+
+class FakerValuePoolCacheStats(BaseModel):
+    """
+    Counters for a FakerValuePoolCache.
+    """
+
+    hits: int = Field(
+        0, description="Samples drawn from a pool that was already in the cache."
+    )
+    misses: int = Field(0, description="Samples that had to generate a new pool first.")
+    refreshes: int = Field(
+        0, description="Pools that were regenerated after max_draws_per_pool draws."
+    )
+    evictions: int = Field(
+        0, description="Pools dropped to keep the cache under max_pools."
+    )
+
+    @property
+    def hit_rate(self) -> float:
+        num_samples = self.hits + self.misses
+        if num_samples == 0:
+            return 0.0
+        return self.hits / num_samples
+
+
+class FakerValuePool(BaseModel):
+    """
+    The pre-generated values for a single faker type.
+    """
+
+    values: Any  # pd.Series
+    num_draws: int = 0
+
+
+class FakerValuePoolCache(BaseModel):
+    """A per-faker_type cache of pre-generated values, with least-recently-used eviction.
+
+    Instead of calling a faker method once per row, a column that uses the cache calls it
+    pool_size times the first time its faker type is sampled, and then draws rows from that
+    pool (with replacement). Each pool is regenerated once max_draws_per_pool values have
+    been drawn from it, and the least recently used pool is evicted when there are more
+    than max_pools.
+
+    Note:
+        Values drawn from a pool are realistic, but they aren't the values Faker would have
+        returned: a column only has (at most) pool_size distinct values between refreshes, and
+        the data depends on which pools are already in the cache. Faker types that draw from a
+        finite set of elements (see FAKER_ELEMENT_TYPES) are always sampled from those
+        elements instead, which is exact.
+    """
+
+    pool_size: int = Field(
+        1_000,
+        gt=0,
+        description="The number of values to pre-generate for each faker type.",
+    )
+    max_pools: int = Field(
+        64,
+        gt=0,
+        description="The number of pools to keep before evicting the least recently used one.",
+    )
+    max_draws_per_pool: Optional[int] = Field(
+        100_000,
+        gt=0,
+        description="Regenerate a pool after this many values have been drawn from it. None never regenerates.",
+    )
+
+    _pools: "OrderedDict[str, FakerValuePool]" = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _stats: FakerValuePoolCacheStats = PrivateAttr(
+        default_factory=FakerValuePoolCacheStats
+    )
+
+    @classmethod
+    def create(
+        cls,
+        pool_size: Optional[int] = None,
+        max_pools: Optional[int] = None,
+        max_draws_per_pool: Optional[int] = 100_000,
+    ) -> "FakerValuePoolCache":
+        """Create a FakerValuePoolCache."""
+
+        if pool_size is None:
+            pool_size = 1_000
+
+        if max_pools is None:
+            max_pools = 64
+
+        return cls(
+            pool_size=pool_size,
+            max_pools=max_pools,
+            max_draws_per_pool=max_draws_per_pool,
+        )
+
+    @property
+    def stats(self) -> FakerValuePoolCacheStats:
+        """A snapshot of the cache's counters."""
+        return self._stats.model_copy()
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    def __contains__(self, faker_type: str) -> bool:
+        return faker_type in self._pools
+
+    def sample(
+        self,
+        faker_type: str,
+        method: Callable[[], Any],
+        num_rows: int,
+    ) -> pd.Series:
+        """Draw num_rows values for a faker type from its pool, generating the pool if needed.
+
+        Args:
+            faker_type: The name of the faker method, which the pool is cached under.
+            method: The (already resolved) faker method, used to fill the pool.
+            num_rows: The number of values to draw.
+        """
+
+        pool = self._get_pool(faker_type, method)
+
+        indices = get_rng().integers(0, len(pool.values), size=num_rows)
+        pool.num_draws += num_rows
+
+        return pool.values.take(indices).reset_index(drop=True)
+
+    def clear(self) -> None:
+        """Drop every pool and reset the counters."""
+        self._pools.clear()
+        self._stats = FakerValuePoolCacheStats()
+
+    def _get_pool(
+        self,
+        faker_type: str,
+        method: Callable[[], Any],
+    ) -> FakerValuePool:
+        pool = self._pools.get(faker_type)
+
+        if pool is None:
+            self._stats.misses += 1
+            pool = self._generate_pool(method)
+            self._pools[faker_type] = pool
+
+            while len(self._pools) > self.max_pools:
+                self._pools.popitem(last=False)
+                self._stats.evictions += 1
+
+            return pool
+
+        self._stats.hits += 1
+        self._pools.move_to_end(faker_type)
+
+        if (
+            self.max_draws_per_pool is not None
+            and pool.num_draws >= self.max_draws_per_pool
+        ):
+            self._stats.refreshes += 1
+            pool = self._generate_pool(method)
+            self._pools[faker_type] = pool
+
+        return pool
+
+    def _generate_pool(
+        self,
+        method: Callable[[], Any],
+    ) -> FakerValuePool:
+        # Building a Series gives the values the same dtype that a column of faker values would get.
+        return FakerValuePool(
+            values=pd.Series([method() for i in range(self.pool_size)]),
+        )
+
+
+# The cache shared by every FakerColumnGenerator with use_value_pool=True.
+_FAKER_VALUE_POOL_CACHE = FakerValuePoolCache.create()
+
+
+def get_faker_value_pool_cache() -> FakerValuePoolCache:
+    """Get the cache that FakerColumnGenerators draw pooled values from."""
+    return _FAKER_VALUE_POOL_CACHE
+
+
+def set_faker_value_pool_cache(
+    cache: FakerValuePoolCache,
+) -> None:
+    """Replace the cache that FakerColumnGenerators draw pooled values from (e.g. to change its sizes).
+
+    Note:
+        Each worker process has its own cache, so this only affects the current process.
+    """
+    global _FAKER_VALUE_POOL_CACHE
+    _FAKER_VALUE_POOL_CACHE = cache
@@ -0,0 +1,465 @@
+"""
+Hooks for measuring where generation time goes, stage by stage and column by column.
+"""
+
+from functools import wraps
+import json
+import os
+from pathlib import Path
+import threading
+import time
+import tracemalloc
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
+from pydantic import BaseModel, PrivateAttr
+
+import pandas as pd
+
+# The methods of DataTools that are instrumented (see DataTool.__pydantic_init_subclass__)
+INSTRUMENTED_METHODS = ("generate", "modify", "write")
+
+SummaryKey = Literal["stage", "tool", "column"]
+
+
+class InstrumentationEvent(BaseModel):
+    """A single timed call to an instrumented stage.
+
+    Rows and bytes are measured from the stage's output, where it is (or contains) pandas or
+    Arrow data. Bytes are the shallow size of the output (e.g. 8 bytes per row for an object
+    column), so measuring them stays cheap. allocated_bytes is the net memory allocated by the
+    call, and is only measured while tracemalloc is tracing.
+    """
+
+    stage: str
+    tool: Optional[str] = None
+    column: Optional[str] = None
+    start: float
+    seconds: float
+    self_seconds: float
+    num_rows: Optional[int] = None
+    num_bytes: Optional[int] = None
+    allocated_bytes: Optional[int] = None
+    depth: int = 0
+    process_id: int
+    thread_id: int
+
+
+class InstrumentationHook(Protocol):
+    """A callable that receives an InstrumentationEvent whenever an instrumented stage finishes."""
+
+    def __call__(self, event: InstrumentationEvent) -> None: ...
+
+
+_HOOKS: List[InstrumentationHook] = []
+
+
+def add_hook(
+    hook: InstrumentationHook,
+) -> None:
+    """Register a hook, which is called with every InstrumentationEvent until it's removed.
+
+    Events are only reported for stages that run in this process. Stages run in worker
+    processes (e.g. with n_jobs) aren't reported, but stages run in worker threads are.
+    """
+
+    _HOOKS.append(hook)
+
+
+def remove_hook(
+    hook: InstrumentationHook,
+) -> None:
+    """Unregister a hook that was registered with add_hook."""
+
+    _HOOKS.remove(hook)
+
+
+class _SpanStack(threading.local):
+    def __init__(self):
+        self.spans: List["_Span"] = []
+        # The last dataframe measured on this thread, and its size. A dataframe is often the
+        # output of a stage and of the stages around it, and measuring one isn't free.
+        self.last_measured: Tuple[Optional[weakref.ref], Tuple[int, int]] = (
+            None,
+            (0, 0),
+        )
+
+
+_SPAN_STACK = _SpanStack()
+
+
+class _Span:
+    """Times a stage, and reports it to every hook when it finishes.
+
+    The time spent in stages nested inside this one (on the same thread) is subtracted from
+    its self_seconds.
+    """
+
+    def __init__(
+        self,
+        stage: str,
+        tool: Optional[str] = None,
+        column: Optional[str] = None,
+        owner: Optional[int] = None,
+    ):
+        self.stage = stage
+        self.tool = tool
+        self.column = column
+        self.owner = owner
+        self.num_rows = None
+        self.num_bytes = None
+        self.child_seconds = 0.0
+
+    def set_output(
+        self,
+        output: Any,
+    ) -> None:
+        self.num_rows, self.num_bytes = _measure_output(output)
+
+    def __enter__(self) -> "_Span":
+        self.depth = len(_SPAN_STACK.spans)
+        _SPAN_STACK.spans.append(self)
+
+        self.start_bytes = (
+            tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        )
+        self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        seconds = time.perf_counter() - self.start
+
+        allocated_bytes = None
+        if self.start_bytes is not None and tracemalloc.is_tracing():
+            allocated_bytes = tracemalloc.get_traced_memory()[0] - self.start_bytes
+
+        _SPAN_STACK.spans.pop()
+        if _SPAN_STACK.spans:
+            _SPAN_STACK.spans[-1].child_seconds += seconds
+
+        # Stages that raise aren't reported
+        if exc_info[0] is not None:
+            return
+
+        event = InstrumentationEvent(
+            stage=self.stage,
+            tool=self.tool,
+            column=self.column,
+            start=self.start,
+            seconds=seconds,
+            self_seconds=max(seconds - self.child_seconds, 0.0),
+            num_rows=self.num_rows,
+            num_bytes=self.num_bytes,
+            allocated_bytes=allocated_bytes,
+            depth=self.depth,
+            process_id=os.getpid(),
+            thread_id=threading.get_ident(),
+        )
+
+        for hook in list(_HOOKS):
+            hook(event)
+
+
+class _NullSpan:
+    """Stands in for a _Span when no hooks are registered, so that spans cost next to nothing."""
+
+    def set_output(self, output: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(
+    stage: str,
+    column: Optional[str] = None,
+):
+    """Time a block of code as a stage, e.g.
+
+        with span("MissingFakerDataframeGenerator.assemble") as s:
+            df = pd.DataFrame(series_dict)
+            s.set_output(df)
+
+    Args:
+        stage: The name of the stage.
+        column: The column that the stage generates or modifies, if any.
+    """
+
+    if not _HOOKS:
+        return _NULL_SPAN
+
+    return _Span(stage, column=column)
+
+
+T = TypeVar("T")
+
+
+def instrumented(
+    function: Callable[..., T],
+    stage: Optional[str] = None,
+) -> Callable[..., T]:
+    """Report every call of a function (or method) to the registered hooks.
+
+    The tool and column of each event come from the function's first argument (self, for a
+    method): its class name, and its `name`, if that's a string. A call that directly re-enters
+    the same stage for the same object (e.g. a method that re-calls itself once it has set up
+    a seed) is counted as part of the outer call.
+
+    Args:
+        function: The function to instrument.
+        stage: The name of the stage. Defaults to the function's qualified name, e.g.
+            "FakerColumnGenerator.generate".
+    """
+
+    if stage is None:
+        stage = function.__qualname__
+
+    @wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        if not _HOOKS:
+            return function(*args, **kwargs)
+
+        owner = args[0] if args else None
+
+        spans = _SPAN_STACK.spans
+        if spans and spans[-1].stage == stage and spans[-1].owner == id(owner):
+            return function(*args, **kwargs)
+
+        name = getattr(owner, "name", None)
+
+        with _Span(
+            stage,
+            tool=type(owner).__name__ if owner is not None else None,
+            column=name if isinstance(name, str) else None,
+            owner=id(owner),
+        ) as s:
+            output = function(*args, **kwargs)
+            s.set_output(output)
+
+        return output
+
+    wrapper.__instrumented__ = True
+
+    return wrapper
+
+
+def _measure_output(
+    output: Any,
+) -> Tuple[Optional[int], Optional[int]]:
+    """Get the number of rows and (shallow) bytes in a stage's output, where it can be measured."""
+
+    if isinstance(output, pd.DataFrame):
+        last_dataframe, last_size = _SPAN_STACK.last_measured
+        if last_dataframe is not None and last_dataframe() is output:
+            return last_size
+
+        size = len(output), int(output.memory_usage(index=False).sum())
+        _SPAN_STACK.last_measured = (weakref.ref(output), size)
+
+        return size
+
+    if isinstance(output, pd.Series):
+        return len(output), int(output.memory_usage(index=False))
+
+    if isinstance(output, dict):
+        sizes = [_measure_output(value) for value in output.values()]
+        if sizes and all(None not in size for size in sizes):
+            return sizes[0][0], sum(num_bytes for _, num_bytes in sizes)
+        return None, None
+
+    # A pyarrow.Array or pyarrow.Table
+    if hasattr(output, "nbytes") and hasattr(output, "__len__"):
+        return len(output), int(output.nbytes)
+
+    # Result objects that hold a dataframe, a table or a dict of columns
+    for attribute in ("dataframe", "table", "columns"):
+        value = getattr(output, attribute, None)
+        if value is not None:
+            return _measure_output(value)
+
+    # Other result objects that count their rows (e.g. FileMissingnessResultObject)
+    num_rows = getattr(output, "num_rows", None)
+    if isinstance(num_rows, int):
+        return num_rows, None
+
+    return None, None
+
+
+class InstrumentationCollector(BaseModel):
+    """A hook that collects every InstrumentationEvent, for a per-stage breakdown or a trace.
+
+    Use it as a context manager, e.g.
+
+        with InstrumentationCollector() as collector:
+            generate_dataframe(seed=1)
+
+        collector.summary()
+        collector.write_chrome_trace("trace.json")
+
+    With trace_allocations, tracemalloc is started for the duration (if it isn't already
+    running), so that every event measures the memory it allocated. Tracing allocations
+    slows Python code down considerably, so times measured with it are inflated.
+    """
+
+    trace_allocations: bool = False
+
+    _events: List[InstrumentationEvent] = PrivateAttr(default_factory=list)
+    _started_tracemalloc: bool = PrivateAttr(default=False)
+
+    @property
+    def events(self) -> List[InstrumentationEvent]:
+        return list(self._events)
+
+    def __call__(
+        self,
+        event: InstrumentationEvent,
+    ) -> None:
+        self._events.append(event)
+
+    def __enter__(self) -> "InstrumentationCollector":
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        add_hook(self)
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        remove_hook(self)
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def clear(self) -> None:
+        """Forget every event collected so far."""
+
+        self._events.clear()
+
+    def summary(
+        self,
+        by: SummaryKey = "stage",
+    ) -> pd.DataFrame:
+        """Break down the collected events by stage, tool or column, slowest first.
+
+        Columns:
+            calls: The number of events.
+            seconds: The total wall time, including nested stages.
+            self_seconds: The total wall time, excluding nested stages.
+            self_share: The share of all self_seconds spent in this stage.
+            num_rows: The total number of rows output.
+            rows_per_second: num_rows / seconds.
+            mb: The total (shallow) size of the output, in MB.
+            allocated_mb: The total memory allocated, in MB (if allocations were traced).
+
+        Args:
+            by: "stage", "tool" or "column". Events without a column are left out of the
+                breakdown by column.
+        """
+
+        columns = [
+            "calls",
+            "seconds",
+            "self_seconds",
+            "self_share",
+            "num_rows",
+            "rows_per_second",
+            "mb",
+            "allocated_mb",
+        ]
+
+        events = [event for event in self._events if getattr(event, by) is not None]
+        if len(events) == 0:
+            return pd.DataFrame(columns=columns, index=pd.Index([], name=by))
+
+        events_df = pd.DataFrame(
+            [event.model_dump() for event in events],
+            columns=list(InstrumentationEvent.model_fields),
+        )
+
+        grouped = events_df.groupby(by, sort=False)
+        summary_df = pd.DataFrame(
+            {
+                "calls": grouped.size(),
+                "seconds": grouped["seconds"].sum(),
+                "self_seconds": grouped["self_seconds"].sum(),
+                "num_rows": grouped["num_rows"].sum(min_count=1),
+                "mb": grouped["num_bytes"].sum(min_count=1) / 1e6,
+                "allocated_mb": grouped["allocated_bytes"].sum(min_count=1) / 1e6,
+            }
+        )
+
+        total_self_seconds = summary_df["self_seconds"].sum()
+        summary_df["self_share"] = (
+            summary_df["self_seconds"] / total_self_seconds
+            if total_self_seconds > 0
+            else 0.0
+        )
+        summary_df["rows_per_second"] = summary_df["num_rows"] / summary_df[
+            "seconds"
+        ].where(summary_df["seconds"] > 0)
+
+        return summary_df[columns].sort_values("self_seconds", ascending=False)
+
+    def to_json(self) -> str:
+        """Dump the collected events as a JSON list."""
+
+        return json.dumps([event.model_dump() for event in self._events])
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Convert the collected events to the Chrome trace event format.
+
+        The trace can be opened in chrome://tracing or https://ui.perfetto.dev. Times are in
+        microseconds from the first event.
+        """
+
+        if len(self._events) == 0:
+            return {"traceEvents": [], "displayTimeUnit": "ms"}
+
+        first_start = min(event.start for event in self._events)
+
+        trace_events = [
+            {
+                "name": event.stage,
+                "cat": event.tool or "stage",
+                "ph": "X",
+                "ts": (event.start - first_start) * 1e6,
+                "dur": event.seconds * 1e6,
+                "pid": event.process_id,
+                "tid": event.thread_id,
+                "args": {
+                    "column": event.column,
+                    "num_rows": event.num_rows,
+                    "num_bytes": event.num_bytes,
+                    "allocated_bytes": event.allocated_bytes,
+                },
+            }
+            for event in self._events
+        ]
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(
+        self,
+        path,
+    ) -> None:
+        """Write the collected events to a Chrome trace (JSON) file. See to_chrome_trace."""
+
+        Path(path).write_text(json.dumps(self.to_chrome_trace()))
@@ -1,14 +1,20 @@
 from abc import ABC
+from concurrent.futures import Executor, ThreadPoolExecutor
 from enum import Enum
-import random
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 
+import numpy as np
 import pandas as pd
 
 from did_you_miss_me.abc import (
     DataModifier,
 )
+from did_you_miss_me.rng import (
+    get_rng,
+    seedable,
+    spawn_seeds,
+)
 
 
 class ColumnMissingnessType(str, Enum):
@@ -79,6 +85,7 @@ class ColumnFatFingersModifier(FatFingersModifier):
     )
 
     @classmethod
+    @seedable
     def create(
         cls,
         error_rate: Optional[float] = None,
@@ -90,20 +97,59 @@ class ColumnFatFingersModifier(FatFingersModifier):
             error_rate=error_rate,
         )
 
+    @seedable
     def modify(
         self,
         series: pd.Series,
     ) -> pd.Series:
-        """Modify a series of data with typos"""
+        """Modify a series of data with typos
+
+        The rows to modify are picked with a single vectorized draw, and grouped by error
+        type. Each error is then applied to its whole group at once, with NumPy's string
+        functions. Only non-empty strings are modified; other values (e.g. missing values)
+        are left as they are.
+        """
+
+        return self._modify(series, get_rng())
+
+    def _modify(
+        self,
+        series: pd.Series,
+        rng: np.random.Generator,
+    ) -> pd.Series:
+        """Modify a series with typos, drawing from rng (and not from the `random` module).
+
+        This doesn't touch any global random state, so it's safe to call from several threads at once.
+        """
 
         new_series = series.copy()
 
-        for i, value in series.items():
-            if random.random() < self.error_rate:
-                new_series[i] = self._modify_value(
-                    value,
-                    self._get_random_error_type(),
-                )
+        positions = np.flatnonzero(rng.random(len(series)) < self.error_rate)
+
+        # Only the (few) selected values are pulled out of the series and checked
+        selected_values = series.iloc[positions].to_numpy(dtype=object)
+        is_modifiable = np.array(
+            [isinstance(value, str) and len(value) > 0 for value in selected_values],
+            dtype=bool,
+        )
+        positions = positions[is_modifiable]
+        selected_values = selected_values[is_modifiable]
+
+        if len(positions) == 0 or len(self.possible_errors) == 0:
+            return new_series
+
+        error_type_indexes = rng.integers(
+            0, len(self.possible_errors), size=len(positions)
+        )
+
+        for i, error_type in enumerate(self.possible_errors):
+            in_group = error_type_indexes == i
+            if not in_group.any():
+                continue
+
+            values = np.array(selected_values[in_group], dtype=np.dtypes.StringDType())
+            modified_values = _ERROR_FUNCTIONS[error_type](values, rng)
+            new_series.iloc[positions[in_group]] = modified_values.astype(object)
 
         return new_series
 
@@ -127,129 +173,231 @@ class ColumnFatFingersModifier(FatFingersModifier):
 
         return possible_errors
 
-    def _get_random_error_type(self):
-        return random.choice(self.possible_errors)
-
-    @staticmethod
-    def _modify_value(
-        value: str,
-        error_type: str,
-    ) -> str:
-        """Modify a single value with typos"""
-
-        if error_type == "missing_chars":
-            # Drop a random character from the string
-            k = random.randint(0, len(value) - 1)
-            modified_value = value[:k] + value[k + 1 :]
-
-        elif error_type == "extra_chars":
-            # Add a random character to the string
-            k = random.randint(0, len(value) - 1)
-            modified_value = value[:k] + random.choice(list(value)) + value[k:]
-
-        elif error_type == "transposed_chars":
-            # Transpose two random characters in the string
-            k = random.randint(0, len(value) - 2)
-            modified_value = value[:k] + value[k + 1] + value[k] + value[k + 2 :]
-
-        elif error_type == "mistaken_chars":
-            # Replace a random character in the string with a random character in the alphabet
-            k = random.randint(0, len(value) - 1)
-            modified_value = (
-                value[:k]
-                + random.choice(list("abcdefghijklmnopqrstuvwxyz1234567890"))
-                + value[k + 1 :]
+
+# The characters that a mistaken character is drawn from
+_MISTAKEN_CHARS = np.array(
+    list("abcdefghijklmnopqrstuvwxyz1234567890"), dtype=np.dtypes.StringDType()
+)
+
+
+def _slice_strings_in_python(
+    values: np.ndarray,
+    start: Union[int, np.ndarray],
+    stop: Union[int, np.ndarray, None],
+) -> np.ndarray:
+    """Slice each string from start to stop, one string at a time.
+
+    This is the fallback for NumPy < 2.3, which doesn't have np.strings.slice.
+    """
+    starts = np.broadcast_to(start, values.shape).tolist()
+    stops = (
+        [None] * len(values)
+        if stop is None
+        else np.broadcast_to(stop, values.shape).tolist()
+    )
+    return np.array(
+        [value[i:j] for value, i, j in zip(values.tolist(), starts, stops)],
+        dtype=np.dtypes.StringDType(),
+    )
+
+
+# Slices each string in an array of strings (with per-string start and stop positions)
+_slice_strings = getattr(np.strings, "slice", _slice_strings_in_python)
+
+
+def _draw_char_positions(
+    lengths: np.ndarray,
+    rng: np.random.Generator,
+    num_excluded: int = 0,
+) -> np.ndarray:
+    """Draw a random character position k in each string, with 0 <= k < length - num_excluded.
+
+    Strings that are too short to leave room for num_excluded characters always get k = 0.
+    """
+    num_choices = np.maximum(lengths - num_excluded, 1)
+    return (rng.random(len(lengths)) * num_choices).astype(np.int64)
+
+
+def _add_missing_chars(values: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Drop a random character from each string"""
+    k = _draw_char_positions(np.strings.str_len(values), rng)
+    return _slice_strings(values, 0, k) + _slice_strings(values, k + 1, None)
+
+
+def _add_extra_chars(values: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Insert a random character (drawn from the same string) into each string"""
+    lengths = np.strings.str_len(values)
+    k = _draw_char_positions(lengths, rng)
+    j = _draw_char_positions(lengths, rng)
+    extra_chars = _slice_strings(values, j, j + 1)
+    return _slice_strings(values, 0, k) + extra_chars + _slice_strings(values, k, None)
+
+
+def _add_transposed_chars(values: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Swap two neighbouring characters in each string (single characters are left as they are)"""
+    k = _draw_char_positions(np.strings.str_len(values), rng, num_excluded=1)
+    return (
+        _slice_strings(values, 0, k)
+        + _slice_strings(values, k + 1, k + 2)
+        + _slice_strings(values, k, k + 1)
+        + _slice_strings(values, k + 2, None)
+    )
+
+
+def _add_mistaken_chars(values: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Replace a random character in each string with a random letter or digit"""
+    k = _draw_char_positions(np.strings.str_len(values), rng)
+    mistaken_chars = _MISTAKEN_CHARS[
+        rng.integers(0, len(_MISTAKEN_CHARS), size=len(values))
+    ]
+    return (
+        _slice_strings(values, 0, k)
+        + mistaken_chars
+        + _slice_strings(values, k + 1, None)
+    )
+
+
+def _add_repeated_chars(values: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Repeat a random character in each string"""
+    k = _draw_char_positions(np.strings.str_len(values), rng)
+    return _slice_strings(values, 0, k + 1) + _slice_strings(values, k, None)
+
+
+# The function that adds each type of error to an array of strings
+_ERROR_FUNCTIONS: Dict[str, Callable[[np.ndarray, np.random.Generator], np.ndarray]] = {
+    "missing_chars": _add_missing_chars,
+    "extra_chars": _add_extra_chars,
+    "transposed_chars": _add_transposed_chars,
+    "mistaken_chars": _add_mistaken_chars,
+    "repeated_chars": _add_repeated_chars,
+}
+
+
+class DataframeFatFingersModifier(FatFingersModifier):
+    """Adds typos to every text column of a dataframe, with a ColumnFatFingersModifier (and error rate) per column."""
+
+    column_modifiers: List[ColumnFatFingersModifier]
+
+    @property
+    def num_columns(self):
+        return len(self.column_modifiers)
+
+    @classmethod
+    @seedable
+    def create(
+        cls,
+        column_modifiers: Optional[List[ColumnFatFingersModifier]] = None,
+        num_columns: Optional[int] = None,
+        error_rates: Optional[Union[float, List[float]]] = None,
+    ) -> "DataframeFatFingersModifier":
+        """Create a DataframeFatFingersModifier.
+
+        Args:
+            column_modifiers: The modifier for each column. If None, one is created per column.
+            num_columns: The number of columns (if column_modifiers and error_rates aren't given). Defaults to 12.
+            error_rates: The error rate for every column, or a list with one error rate per column.
+        """
+
+        if column_modifiers is None:
+            if isinstance(error_rates, list):
+                column_modifiers = [
+                    ColumnFatFingersModifier.create(error_rate=error_rate)
+                    for error_rate in error_rates
+                ]
+
+            else:
+                if num_columns is None:
+                    num_columns = 12
+
+                column_modifiers = [
+                    ColumnFatFingersModifier.create(error_rate=error_rates)
+                    for i in range(num_columns)
+                ]
+
+        return cls(
+            column_modifiers=column_modifiers,
+        )
+
+    @seedable
+    def modify(
+        self,
+        df: pd.DataFrame,
+        inplace: bool = False,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> pd.DataFrame:
+        """Modify a dataframe with typos, column by column.
+
+        Only text columns (object and string dtypes) are modified; every other column is
+        skipped without being read. Unless inplace is True, the result is a shallow,
+        copy-on-write copy of df, so columns without typos aren't copied.
+
+        Args:
+            df: The dataframe to modify. It needs one column per column modifier.
+            inplace: Whether to write the modified columns back into df, instead of a copy.
+            n_jobs: If given, modify the columns in a pool of n_jobs threads (which share
+                df's memory, unlike worker processes). n_jobs=1 modifies them one at a time,
+                and n_jobs=-1 uses one thread per CPU.
+            executor: An existing executor to modify the columns with (e.g. a
+                ProcessPoolExecutor, which copies each column to a worker process).
+
+        Note:
+            Each column draws from its own random stream, spawned from a root seed drawn from
+            the `random` module, so the result doesn't depend on n_jobs or the executor.
+        """
+
+        if len(df.columns) != self.num_columns:
+            raise ValueError(
+                f"The dataframe has {len(df.columns)} columns, but there are {self.num_columns} column modifiers."
+            )
+
+        # Draw a seed for every column (even skipped ones), so that each column's typos don't
+        # depend on the dtypes of the other columns.
+        seeds = spawn_seeds(self.num_columns)
+
+        positions = [
+            i for i in range(self.num_columns) if _is_text_column(df.iloc[:, i])
+        ]
+        column_modifiers = [self.column_modifiers[i] for i in positions]
+        columns = [df.iloc[:, i] for i in positions]
+        column_seeds = [seeds[i] for i in positions]
+
+        if executor is not None:
+            modified_columns = list(
+                executor.map(_modify_column, column_modifiers, columns, column_seeds)
+            )
+
+        elif n_jobs is None or n_jobs == 1:
+            modified_columns = list(
+                map(_modify_column, column_modifiers, columns, column_seeds)
             )
 
-        elif error_type == "repeated_chars":
-            # Repeat a random character in the string
-            k = random.randint(0, len(value) - 1)
-            modified_value = value[:k] + value[k] + value[k:]
-
-        return modified_value
-
-
-# class DataframeFatFingersModifier(FatFingersModifier):
-
-#     @classmethod
-#     def modify(
-#         cls,
-#         df: pd.DataFrame,
-#     ) -> pd.DataFrame:
-#         """Modify a dataframe of data with typos"""
-
-#         create
-
-#         new_df = df.copy()
-#         for column in df.columns:
-#             new_df[column] = self._modify_column(df[column])
-
-#         return new_df
-
-#     def _modify_column(
-
-# column_modifiers: List[ColumnFatFingersModifier]
-
-# @property
-# def num_columns(self):
-#     return len(self.column_modifiers)
-
-# @classmethod
-# def create(
-#     cls,
-#     column_generators: Optional[List[ColumnMissingnessModifier]] = None,
-#     num_columns: Optional[int] = None,
-# ):
-#     if column_generators is None:
-#         if num_columns is None:
-#             num_columns = 12
-
-#         column_modifiers = []
-#         for i in range(num_columns):
-#             column_modifier = cls._generate_column_generator()
-#             column_modifiers.append(column_modifier)
-
-#     return cls(
-#         column_modifiers=column_modifiers,
-#     )
-
-# @staticmethod
-# def _generate_column_generator(
-#     missingness_type: Optional[ColumnMissingnessType] = None,
-# ) -> ColumnMissingnessModifier:
-#     if missingness_type is None:
-#         missingness_type = random.choice(
-#             [
-#                 ColumnMissingnessType.NEVER,
-#                 ColumnMissingnessType.NEVER,
-#                 ColumnMissingnessType.NEVER,
-#                 ColumnMissingnessType.NEVER,
-#                 ColumnMissingnessType.PROPORTIONAL,
-#                 ColumnMissingnessType.PROPORTIONAL,
-#                 ColumnMissingnessType.ALWAYS,
-#                 # "CONDITIONAL",
-#             ]
-#         )
-
-#     if missingness_type == ColumnMissingnessType.ALWAYS:
-#         return ColumnMissingnessModifier(
-#             missingness_type=missingness_type,
-#         )
-
-#     elif missingness_type == ColumnMissingnessType.NEVER:
-#         return ColumnMissingnessModifier(
-#             missingness_type=missingness_type,
-#         )
-
-#     elif missingness_type == ColumnMissingnessType.PROPORTIONAL:
-#         # A little math to make most proportions close to 0 or 1, with "close to 0" being more likely
-#         proportion = random.random() ** 3
-#         if random.random() < 0.25:
-#             proportion = 1 - proportion
-
-#         return ColumnMissingnessModifier(
-#             missingness_type=missingness_type,
-#             missingness_params=ProportionalColumnMissingnessParams(
-#                 proportion=proportion,
-#             ),
-#         )
+        else:
+            max_workers = None if n_jobs < 0 else n_jobs
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                modified_columns = list(
+                    pool.map(_modify_column, column_modifiers, columns, column_seeds)
+                )
+
+        new_df = df if inplace else df.copy(deep=False)
+        for i, modified_column in zip(positions, modified_columns):
+            new_df.isetitem(i, modified_column)
+
+        return new_df
+
+
+def _is_text_column(series: pd.Series) -> bool:
+    """Whether a column can hold strings, judging by its dtype alone."""
+    return series.dtype == object or pd.api.types.is_string_dtype(series.dtype)
+
+
+def _modify_column(
+    column_modifier: ColumnFatFingersModifier,
+    series: pd.Series,
+    seed: int,
+) -> pd.Series:
+    """Modify a single column from its own random stream.
+
+    This is a module-level function so that it can be sent to worker processes.
+    """
+    return column_modifier._modify(series, np.random.default_rng(seed))
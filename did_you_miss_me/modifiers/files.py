@@ -0,0 +1,325 @@
+"""
+Chunked, file-to-file missingness for CSV and Parquet files that are too large to load at once.
+"""
+
+from pathlib import Path
+import time
+from typing import Iterator, List, Optional, Tuple
+from pydantic import BaseModel, Field
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from did_you_miss_me.modifiers.missingness import (
+    ColumnMissingnessModifier,
+    DataframeMissingnessModifier,
+    MissingnessModifier,
+    to_nullable_dtype,
+)
+from did_you_miss_me.rng import (
+    seedable,
+)
+
+FILE_FORMATS = ("csv", "parquet")
+
+
+class FileMissingnessResultObject(BaseModel):
+    """
+    A result object for a FileMissingnessModifier.
+    """
+
+    input_path: str
+    output_path: str
+    num_rows: int
+    num_chunks: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.seconds == 0:
+            return 0.0
+        return self.num_rows / self.seconds
+
+
+class FileMissingnessModifier(MissingnessModifier):
+    """Adds missingness to a CSV or Parquet file, streaming it into a new file one chunk at a time.
+
+    Each column's ColumnMissingnessModifier is chosen up front, so a column has the same type
+    (and proportion) of missingness in every chunk. Only one chunk is held in memory at a time,
+    so files much larger than memory can be missified.
+
+    * CSV files are read in chunks of chunk_size rows, and appended to the output file.
+    * Parquet files are read in batches of chunk_size rows, and written with one row group per
+      batch and the same (Arrow) schema as the input file. Needs pyarrow.
+    """
+
+    dataframe_modifier: DataframeMissingnessModifier
+    chunk_size: int = Field(
+        100_000,
+        gt=0,
+        description="The number of rows to read, missify and write at a time.",
+    )
+    compression: str = Field(
+        "snappy",
+        description="The compression codec for Parquet output.",
+    )
+
+    @property
+    def num_columns(self):
+        return self.dataframe_modifier.num_columns
+
+    @classmethod
+    @seedable
+    def create(
+        cls,
+        column_modifiers: Optional[List[ColumnMissingnessModifier]] = None,
+        num_columns: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        compression: Optional[str] = None,
+    ) -> "FileMissingnessModifier":
+        """Create a FileMissingnessModifier.
+
+        Args:
+            column_modifiers: The modifier for each column of the file. If None, num_columns
+                modifiers are created with ColumnMissingnessModifier.create.
+            num_columns: The number of columns in the file (if column_modifiers isn't given).
+                See read_column_names.
+            chunk_size: The number of rows to process at a time. Defaults to 100,000.
+            compression: The compression codec for Parquet output. Defaults to snappy.
+        """
+
+        if column_modifiers is None:
+            if num_columns is None:
+                raise ValueError("Either column_modifiers or num_columns is needed.")
+
+            column_modifiers = [
+                ColumnMissingnessModifier.create() for i in range(num_columns)
+            ]
+
+        if chunk_size is None:
+            chunk_size = 100_000
+
+        if compression is None:
+            compression = "snappy"
+
+        return cls(
+            dataframe_modifier=DataframeMissingnessModifier(
+                column_modifiers=column_modifiers,
+            ),
+            chunk_size=chunk_size,
+            compression=compression,
+        )
+
+    @seedable
+    def modify(
+        self,
+        input_path,
+        output_path,
+        file_format: Optional[str] = None,
+    ) -> FileMissingnessResultObject:
+        """Add missingness to a file, writing the result to output_path.
+
+        Args:
+            input_path: The CSV or Parquet file to read.
+            output_path: The file to write. It's overwritten if it exists.
+            file_format: "csv" or "parquet". Defaults to the format given by the input file's
+                extension. The output is written in the same format.
+        """
+
+        start = time.perf_counter()
+
+        if file_format is None:
+            file_format = get_file_format(input_path)
+
+        if file_format == "csv":
+            num_rows, num_chunks = self._modify_csv(str(input_path), str(output_path))
+        elif file_format == "parquet":
+            num_rows, num_chunks = self._modify_parquet(
+                str(input_path), str(output_path)
+            )
+        else:
+            raise ValueError(
+                f"Unrecognized file format: {file_format}. Expected one of {FILE_FORMATS}."
+            )
+
+        return FileMissingnessResultObject(
+            input_path=str(input_path),
+            output_path=str(output_path),
+            num_rows=num_rows,
+            num_chunks=num_chunks,
+            seconds=time.perf_counter() - start,
+        )
+
+    def _modify_chunk(
+        self,
+        df: pd.DataFrame,
+    ) -> pd.DataFrame:
+        # Each chunk is a fresh dataframe that nothing else refers to, so it can be modified in place
+        return self.dataframe_modifier.modify(df, inplace=True)
+
+    def _modify_csv(
+        self,
+        input_path: str,
+        output_path: str,
+    ) -> Tuple[int, int]:
+        num_rows = 0
+        num_chunks = 0
+        integer_positions = None
+
+        for df in _iter_csv_chunks(input_path, self.chunk_size):
+            # Each chunk's dtypes are inferred on their own, so an integer column with a blank
+            # in a later chunk is read as floats there. The first chunk decides which columns
+            # are integers, so that every chunk writes them the same way (e.g. "3", not "3.0").
+            if integer_positions is None:
+                integer_positions = [
+                    i for i, dtype in enumerate(df.dtypes) if dtype.kind in "iu"
+                ]
+
+            df = self._modify_chunk(_to_nullable_dtypes(df, integer_positions))
+            df.to_csv(
+                output_path,
+                mode="a" if num_chunks > 0 else "w",
+                header=num_chunks == 0,
+                index=False,
+            )
+            num_rows += len(df)
+            num_chunks += 1
+
+        if num_chunks == 0:
+            # A file with a header, but no rows
+            pd.read_csv(input_path, nrows=0).to_csv(output_path, index=False)
+
+        return num_rows, num_chunks
+
+    def _modify_parquet(
+        self,
+        input_path: str,
+        output_path: str,
+    ) -> Tuple[int, int]:
+        if pq is None:
+            raise ImportError(
+                "Missifying Parquet files needs pyarrow. Install it with `pip install did_you_miss_me[arrow]`."
+            )
+
+        parquet_file = pq.ParquetFile(input_path)
+        # Arrow columns are all nullable, so every chunk can be written with the input's schema.
+        # A pandas index stored in the file is restored as each chunk's index (and isn't
+        # missified), then written back as it was.
+        schema = parquet_file.schema_arrow
+
+        num_rows = 0
+        num_chunks = 0
+
+        with pq.ParquetWriter(
+            output_path, schema, compression=self.compression
+        ) as writer:
+            for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
+                df = self._modify_chunk(batch.to_pandas())
+                table = pa.Table.from_pandas(df, schema=schema)
+                writer.write_table(table, row_group_size=max(len(table), 1))
+                num_rows += len(df)
+                num_chunks += 1
+
+        return num_rows, num_chunks
+
+
+def get_file_format(
+    path,
+) -> str:
+    """Get the format of a file ("csv" or "parquet") from its extension, e.g. data.csv.gz is "csv"."""
+
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+
+    if ".parquet" in suffixes or ".pq" in suffixes:
+        return "parquet"
+
+    if ".csv" in suffixes:
+        return "csv"
+
+    raise ValueError(
+        f"Can't tell the format of {path} from its extension. Pass file_format as one of {FILE_FORMATS}."
+    )
+
+
+def read_column_names(
+    path,
+    file_format: Optional[str] = None,
+) -> List[str]:
+    """Read the column names of a CSV or Parquet file, without reading its rows.
+
+    The columns that store a pandas index (e.g. __index_level_0__ in a Parquet file written by
+    pandas) aren't included, since they're read back as the index rather than as columns.
+    """
+
+    if file_format is None:
+        file_format = get_file_format(path)
+
+    if file_format == "csv":
+        return pd.read_csv(path, nrows=0).columns.tolist()
+
+    if file_format == "parquet":
+        if pq is None:
+            raise ImportError(
+                "Reading Parquet files needs pyarrow. Install it with `pip install did_you_miss_me[arrow]`."
+            )
+        schema = pq.read_schema(path)
+        index_columns = _get_pandas_index_columns(schema)
+        return [name for name in schema.names if name not in index_columns]
+
+    raise ValueError(
+        f"Unrecognized file format: {file_format}. Expected one of {FILE_FORMATS}."
+    )
+
+
+def _get_pandas_index_columns(
+    schema: "pa.Schema",
+) -> List[str]:
+    """Get the names of the columns that store a pandas index, from an Arrow schema's pandas metadata.
+
+    A RangeIndex is stored in the metadata alone (not as a column), so it isn't included.
+    """
+
+    pandas_metadata = schema.pandas_metadata
+    if pandas_metadata is None:
+        return []
+
+    return [
+        index_column
+        for index_column in pandas_metadata.get("index_columns", [])
+        if isinstance(index_column, str)
+    ]
+
+
+def _iter_csv_chunks(
+    path: str,
+    chunk_size: int,
+) -> Iterator[pd.DataFrame]:
+    with pd.read_csv(path, chunksize=chunk_size) as reader:
+        yield from reader
+
+
+def _to_nullable_dtypes(
+    df: pd.DataFrame,
+    integer_positions: List[int],
+) -> pd.DataFrame:
+    """Convert numpy integer and boolean columns to the matching nullable (extension) dtypes.
+
+    Float columns at integer_positions that only hold whole numbers (i.e. integer columns
+    with blanks) are converted to Int64 as well.
+    """
+
+    for i, dtype in enumerate(df.dtypes):
+        if dtype.kind in "iub":
+            df.isetitem(i, to_nullable_dtype(df.iloc[:, i], "numpy_nullable"))
+
+        elif dtype.kind == "f" and i in integer_positions:
+            # convert_dtypes only makes integers of floats that are all whole numbers
+            df.isetitem(i, df.iloc[:, i].convert_dtypes(dtype_backend="numpy_nullable"))
+
+    return df
@@ -1,14 +1,21 @@
 from abc import ABC
+from concurrent.futures import Executor, ThreadPoolExecutor
 from enum import Enum
 import random
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 
+import numpy as np
 import pandas as pd
 
 from did_you_miss_me.abc import (
     DataModifier,
 )
+from did_you_miss_me.rng import (
+    get_rng,
+    seedable,
+    spawn_seeds,
+)
 
 
 class ColumnMissingnessType(str, Enum):
@@ -30,6 +37,12 @@ WEIGHTED_MISSINGNESS_TYPES = [
 ]
 
 
+# How to store columns with missing values, with the same names as pandas' dtype_backend:
+# * "numpy_nullable": pandas' masked extension dtypes (Int64, Float64, boolean, string)
+# * "pyarrow": Arrow-backed dtypes (e.g. int64[pyarrow]), with nulls in a validity bitmap
+DtypeBackend = Literal["numpy_nullable", "pyarrow"]
+
+
 class ColumnMissingnessParams(BaseModel):
     pass
 
@@ -59,12 +72,18 @@ class ColumnMissingnessModifier(MissingnessModifier):
     missingness_params: Optional[ColumnMissingnessParams] = Field(
         None, description="Parameters for the missingness type"
     )
+    dtype_backend: Optional[DtypeBackend] = Field(
+        None,
+        description="Convert the column to this backend's nullable dtype before adding nulls. None keeps numpy dtypes (so integers become floats).",
+    )
 
     @classmethod
+    @seedable
     def create(
         cls,
         missingness_type: Optional[ColumnMissingnessType] = None,
         missingness_params: Optional[ColumnMissingnessParams] = None,
+        dtype_backend: Optional[DtypeBackend] = None,
     ):
         if missingness_type is None:
             missingness_type = random.choice(WEIGHTED_MISSINGNESS_TYPES)
@@ -78,33 +97,105 @@ class ColumnMissingnessModifier(MissingnessModifier):
         return cls(
             missingness_type=missingness_type,
             missingness_params=missingness_params,
+            dtype_backend=dtype_backend,
         )
 
+    @seedable
     def modify(
         self,
         series: pd.Series,
     ) -> pd.Series:
+        mask = self._get_missingness_mask(len(series))
+        new_series = apply_null_mask(series, mask, dtype_backend=self.dtype_backend)
+
+        return new_series
+
+    def _get_missingness_mask(
+        self,
+        num_rows: int,
+        rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """Get a boolean mask of the rows that should be missing.
+
+        Args:
+            num_rows: The length of the mask.
+            rng: The generator to draw from. Defaults to get_rng().
+        """
         if self.missingness_type == ColumnMissingnessType.ALWAYS:
-            new_series = pd.Series([None for i in range(len(series))])
+            mask = np.ones(num_rows, dtype=bool)
 
         elif self.missingness_type == ColumnMissingnessType.NEVER:
-            new_series = series.copy()
+            mask = np.zeros(num_rows, dtype=bool)
 
         elif self.missingness_type == ColumnMissingnessType.PROPORTIONAL:
-            z = pd.Series(
-                [
-                    random.random() < self.missingness_params.proportion
-                    for i in range(len(series))
-                ]
-            )
-            new_series = series.copy()
-            new_series[z] = None
-            return new_series
+            if rng is None:
+                rng = get_rng()
+            mask = rng.random(num_rows) < self.missingness_params.proportion
 
         else:
             raise ValueError(f"Unrecognized missingness type: {self.missingness_type}")
 
-        return new_series
+        return mask
+
+
+def apply_null_mask(
+    series: pd.Series,
+    mask: np.ndarray,
+    dtype_backend: Optional[DtypeBackend] = None,
+) -> pd.Series:
+    """Return a copy of a series with nulls written wherever mask is True.
+
+    The null value fits the dtype of the series: NaN for numeric columns, NaT for datetimes,
+    pd.NA for extension dtypes, and None for object columns.
+
+    Args:
+        series: The series to add nulls to.
+        mask: A boolean array with the same length as series.
+        dtype_backend: If given, convert the series to this backend's nullable dtype first
+            (whether or not any values are masked), so that e.g. an int64 column becomes Int64
+            with a null mask, rather than float64 with NaNs. See to_nullable_dtype.
+    """
+    if dtype_backend is not None:
+        series = to_nullable_dtype(series, dtype_backend)
+
+    if not mask.any():
+        return series.copy()
+
+    if series.dtype == object:
+        values = series.to_numpy(copy=True)
+        values[mask] = None
+        # Keep the object dtype, rather than letting pandas infer e.g. "str" from the values
+        return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+    if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+        # Extension arrays (e.g. strings) hold their own null value, so they can be written
+        # to directly, which is much cheaper than series.mask
+        values = series.array.copy()
+        values[mask] = None
+        return pd.Series(values, index=series.index, name=series.name, copy=False)
+
+    return series.mask(mask)
+
+
+def to_nullable_dtype(
+    series: pd.Series,
+    dtype_backend: DtypeBackend,
+) -> pd.Series:
+    """Convert a series to a dtype that can hold nulls without changing its type.
+
+    Integers, floats, booleans and object columns of strings are converted to the backend's
+    nullable dtypes (e.g. Int64 or int64[pyarrow]). Other object columns (e.g. lists) stay
+    as they are, as do datetimes with "numpy_nullable" (NaT is already a null).
+
+    Args:
+        series: The series to convert.
+        dtype_backend: "numpy_nullable" or "pyarrow" ("pyarrow" needs pyarrow).
+    """
+    return series.convert_dtypes(
+        dtype_backend=dtype_backend,
+        # Otherwise, float columns that happen to hold whole numbers would become integers
+        convert_integer=series.dtype.kind != "f",
+    )
 
 
 class DataframeMissingnessModifier(MissingnessModifier):
@@ -115,20 +206,24 @@ class DataframeMissingnessModifier(MissingnessModifier):
         return len(self.column_modifiers)
 
     @classmethod
+    @seedable
     def create(
         cls,
         column_generators: Optional[List[ColumnMissingnessModifier]] = None,
         num_columns: Optional[int] = None,
         missingness_type: Optional[ColumnMissingnessType] = None,
+        dtype_backend: Optional[DtypeBackend] = None,
     ):
-        if column_generators is None:
+        column_modifiers = column_generators
+        if column_modifiers is None:
             if num_columns is None:
                 num_columns = 12
 
             column_modifiers = []
             for i in range(num_columns):
                 column_modifier = cls._generate_column_generator(
-                    missingness_type=missingness_type
+                    missingness_type=missingness_type,
+                    dtype_backend=dtype_backend,
                 )
                 column_modifiers.append(column_modifier)
 
@@ -136,9 +231,92 @@ class DataframeMissingnessModifier(MissingnessModifier):
             column_modifiers=column_modifiers,
         )
 
+    @seedable
+    def modify(
+        self,
+        df: pd.DataFrame,
+        inplace: bool = False,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> pd.DataFrame:
+        """Add missingness to a dataframe, column by column.
+
+        Without inplace, the result is a shallow, copy-on-write copy of df: only the columns
+        that get nulls are new, and every other column shares its memory with df. With
+        inplace=True, nulls are written straight into the existing columns wherever their
+        dtype can hold them (floats, datetimes, objects and extension dtypes); integer and
+        boolean columns can't, so they're replaced with a new (float or object) column. Columns
+        whose modifier has a dtype_backend are always replaced, with their nullable dtype.
+
+        Args:
+            df: The dataframe to add missingness to. It needs one column per column modifier.
+            inplace: Whether to modify df, instead of a copy.
+            n_jobs: If given, process the columns in a pool of n_jobs threads (which share
+                df's memory, unlike worker processes). n_jobs=1 processes them one at a time,
+                and n_jobs=-1 uses one thread per CPU.
+            executor: An existing executor to process the columns with.
+
+        Note:
+            Each column draws from its own random stream, spawned from a root seed drawn from
+            the `random` module, so the result doesn't depend on n_jobs, the executor, or inplace.
+        """
+
+        if len(df.columns) != self.num_columns:
+            raise ValueError(
+                f"The dataframe has {len(df.columns)} columns, but there are {self.num_columns} column modifiers."
+            )
+
+        seeds = spawn_seeds(self.num_columns)
+        new_df = df if inplace else df.copy(deep=False)
+
+        # Columns that are written in place only need their mask; the rest need a new column
+        write_in_place = [
+            inplace and column_modifier.dtype_backend is None and _can_hold_nulls(dtype)
+            for column_modifier, dtype in zip(self.column_modifiers, df.dtypes)
+        ]
+        tasks = [
+            (
+                (_draw_null_mask, column_modifier, len(df), seed)
+                if in_place
+                else (_missify_column, column_modifier, df.iloc[:, i], seed)
+            )
+            for i, (column_modifier, seed, in_place) in enumerate(
+                zip(self.column_modifiers, seeds, write_in_place)
+            )
+        ]
+
+        pool = None
+        if executor is None and n_jobs is not None and n_jobs != 1:
+            max_workers = None if n_jobs < 0 else n_jobs
+            executor = pool = ThreadPoolExecutor(max_workers=max_workers)
+
+        try:
+            if executor is None:
+                # One column at a time, so that at most one new column is held at once
+                results = (function(*args) for function, *args in tasks)
+            else:
+                futures = [executor.submit(*task) for task in tasks]
+                results = (future.result() for future in futures)
+
+            for i, result in enumerate(results):
+                if result is None:
+                    continue
+
+                if write_in_place[i]:
+                    new_df.iloc[result, i] = None
+                else:
+                    new_df.isetitem(i, result)
+
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        return new_df
+
     @staticmethod
     def _generate_column_generator(
         missingness_type: Optional[ColumnMissingnessType] = None,
+        dtype_backend: Optional[DtypeBackend] = None,
     ) -> ColumnMissingnessModifier:
         if missingness_type is None:
             missingness_type = random.choice(
@@ -157,11 +335,13 @@ class DataframeMissingnessModifier(MissingnessModifier):
         if missingness_type == ColumnMissingnessType.ALWAYS:
             return ColumnMissingnessModifier(
                 missingness_type=missingness_type,
+                dtype_backend=dtype_backend,
             )
 
         elif missingness_type == ColumnMissingnessType.NEVER:
             return ColumnMissingnessModifier(
                 missingness_type=missingness_type,
+                dtype_backend=dtype_backend,
             )
 
         elif missingness_type == ColumnMissingnessType.PROPORTIONAL:
@@ -175,4 +355,41 @@ class DataframeMissingnessModifier(MissingnessModifier):
                 missingness_params=ProportionalColumnMissingnessParams(
                     proportion=proportion,
                 ),
+                dtype_backend=dtype_backend,
             )
+
+
+def _can_hold_nulls(dtype) -> bool:
+    """Whether nulls can be written into a column of this dtype without changing the dtype."""
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        return True
+
+    return dtype.kind in "fcmMO"
+
+
+def _draw_null_mask(
+    column_modifier: ColumnMissingnessModifier,
+    num_rows: int,
+    seed: int,
+) -> Optional[np.ndarray]:
+    """Draw a column's missingness mask from its own random stream, or None if no rows are missing."""
+    mask = column_modifier._get_missingness_mask(num_rows, np.random.default_rng(seed))
+    if not mask.any():
+        return None
+
+    return mask
+
+
+def _missify_column(
+    column_modifier: ColumnMissingnessModifier,
+    series: pd.Series,
+    seed: int,
+) -> Optional[pd.Series]:
+    """Add missingness to a copy of a column, or return None if it's unchanged."""
+    mask = column_modifier._get_missingness_mask(
+        len(series), np.random.default_rng(seed)
+    )
+    if not mask.any() and column_modifier.dtype_backend is None:
+        return None
+
+    return apply_null_mask(series, mask, dtype_backend=column_modifier.dtype_backend)
@@ -0,0 +1,147 @@
+"""
+Helpers for drawing random numbers in bulk.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+import inspect
+import random
+from typing import Any, Callable, Iterator, List, Optional, TypeVar
+
+import numpy as np
+
+
+def get_rng() -> np.random.Generator:
+    """Create a NumPy random Generator for vectorized draws.
+
+    The Generator is seeded from the global `random` module, so calling
+    `random.seed(...)` still makes the output of every generator and modifier reproducible.
+    """
+
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def spawn_seeds(
+    num_seeds: int,
+    root_seed: Optional[int] = None,
+) -> List[int]:
+    """Derive independent seeds from a root seed, one per task.
+
+    The seeds come from numpy's SeedSequence.spawn, so the random streams they start don't
+    overlap, and each seed only depends on the root seed and its position. If root_seed is
+    None, it is drawn from the global `random` module.
+
+    Args:
+        num_seeds: The number of seeds to derive.
+        root_seed: The seed to derive them from.
+    """
+
+    if root_seed is None:
+        root_seed = random.getrandbits(64)
+
+    children = np.random.SeedSequence(root_seed).spawn(num_seeds)
+
+    return [int(child.generate_state(1, dtype=np.uint64)[0]) for child in children]
+
+
+def split_seed(
+    seed: Optional[int],
+    num_seeds: int,
+) -> List[Optional[int]]:
+    """Split a seed into independent seeds for a sequence of steps (see spawn_seeds).
+
+    If seed is None, every step gets None, so that unseeded runs stay unseeded.
+
+    Args:
+        seed: The seed to split.
+        num_seeds: The number of seeds to split it into.
+    """
+
+    if seed is None:
+        return [None] * num_seeds
+
+    return spawn_seeds(num_seeds, root_seed=seed)
+
+
+# Whether the global `random` module has been seeded by seeded_random (see is_seeded)
+_IS_SEEDED: ContextVar[bool] = ContextVar("is_seeded", default=False)
+
+
+def is_seeded() -> bool:
+    """Whether the calling code runs inside seeded_random (e.g. a method called with a seed).
+
+    Defaults that would otherwise depend on something other than the seed (like the current
+    time) should then be fixed, so that the output only depends on the seed.
+    """
+
+    return _IS_SEEDED.get()
+
+
+@contextmanager
+def seeded_random(
+    seed: Optional[int],
+    random_instance: Optional[random.Random] = None,
+) -> Iterator[None]:
+    """Seed a random.Random instance for the duration of a block.
+
+    The previous state is restored afterwards, so the block doesn't disturb any draws
+    made outside of it.
+
+    Args:
+        seed: The seed to use inside the block. If None, the block runs unseeded.
+        random_instance: The instance to seed (e.g. a Faker instance's `.random`).
+            Defaults to the global `random` module.
+    """
+
+    if seed is None:
+        yield
+        return
+
+    token = None
+    if random_instance is None:
+        random_instance = random
+        token = _IS_SEEDED.set(True)
+
+    state = random_instance.getstate()
+    random_instance.seed(seed)
+    try:
+        yield
+    finally:
+        random_instance.setstate(state)
+        if token is not None:
+            _IS_SEEDED.reset(token)
+
+
+T = TypeVar("T")
+
+
+def seedable(method: Callable[..., T]) -> Callable[..., T]:
+    """Give a create, generate or modify method an optional, keyword-only `seed` argument.
+
+    With a seed, the method runs inside seeded_random(seed). Every draw it makes, from the
+    `random` module or from get_rng, then depends only on the seed, and draws made outside
+    the method are left alone. Without a seed, the method runs exactly as before.
+    """
+
+    @wraps(method)
+    def wrapper(*args: Any, seed: Optional[int] = None, **kwargs: Any) -> T:
+        with seeded_random(seed):
+            return method(*args, **kwargs)
+
+    # Show the seed argument in help() and signatures
+    signature = inspect.signature(method)
+    parameters = list(signature.parameters.values())
+    seed_parameter = inspect.Parameter(
+        "seed",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=Optional[int],
+    )
+    if parameters and parameters[-1].kind == inspect.Parameter.VAR_KEYWORD:
+        parameters.insert(len(parameters) - 1, seed_parameter)
+    else:
+        parameters.append(seed_parameter)
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+
+    return wrapper
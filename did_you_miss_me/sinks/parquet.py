@@ -0,0 +1,267 @@
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from pydantic import BaseModel, Field
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from did_you_miss_me.abc import (
+    DataSink,
+)
+from did_you_miss_me.generators.multibatch import (
+    MissingFakerBatchResultObject,
+)
+from did_you_miss_me.sinks.schema import (
+    ColumnType,
+    SchemaColumn,
+    infer_schema,
+)
+
+
+class ParquetSinkResultObject(BaseModel):
+    """
+    A result object for a ParquetSink.
+    """
+
+    root_path: str
+    num_rows: int
+    num_batches: int
+    file_paths: List[str]
+    seconds: float = Field(
+        description="Total time spent in ParquetSink.write, including waiting for batches to be generated.",
+    )
+    write_seconds: float = Field(
+        description="Time spent converting batches to Arrow and writing them.",
+    )
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.seconds == 0:
+            return 0.0
+        return self.num_rows / self.seconds
+
+
+def _get_arrow_types() -> Dict[ColumnType, Any]:
+    """The Arrow type to store each column type as."""
+
+    return {
+        "boolean": pa.bool_(),
+        "integer": pa.int64(),
+        "float": pa.float64(),
+        "timestamp": pa.timestamp("us"),
+        "date": pa.date32(),
+        "time": pa.time64("us"),
+        "binary": pa.binary(),
+        "string": pa.string(),
+    }
+
+
+# How to convert (non-null) python values that Arrow can't convert on its own
+_PYTHON_VALUE_CONVERTERS: Dict[ColumnType, Callable[[Any], Any]] = {
+    "boolean": bool,
+    "integer": int,
+    "float": float,
+    "binary": bytes,
+    "string": str,
+}
+
+
+class ParquetSink(DataSink):
+    """Streams multibatch output into a hive-partitioned Parquet dataset.
+
+    * By default, each batch is written to its own file: root_path/epoch=<epoch_index>/batch_id=<batch_id>/part-0.parquet
+    * With row_group_per_batch=True, each epoch is written to a single file (root_path/epoch=<epoch_index>/part-0.parquet), with one row group per batch.
+
+    Either way, only one batch is held in memory at a time, and every file shares the same schema,
+    so the dataset can be read back with e.g. pd.read_parquet(root_path).
+    """
+
+    root_path: str = Field(
+        description="The directory to write the dataset to.",
+    )
+    row_group_per_batch: bool = Field(
+        False,
+        description="Whether to write one file per epoch, with a row group per batch, instead of one file per batch.",
+    )
+    compression: str = Field(
+        "snappy",
+        description="The Parquet compression codec to use.",
+    )
+
+    @classmethod
+    def create(
+        cls,
+        root_path: str,
+        row_group_per_batch: Optional[bool] = None,
+        compression: Optional[str] = None,
+    ) -> "ParquetSink":
+        """Create a ParquetSink."""
+
+        if pa is None:
+            raise ImportError(
+                "ParquetSink needs pyarrow. Install it with `pip install did_you_miss_me[arrow]`."
+            )
+
+        if row_group_per_batch is None:
+            row_group_per_batch = False
+
+        if compression is None:
+            compression = "snappy"
+
+        return cls(
+            root_path=str(root_path),
+            row_group_per_batch=row_group_per_batch,
+            compression=compression,
+        )
+
+    def write(
+        self,
+        result_objects: Iterable[MissingFakerBatchResultObject],
+        schema: Optional[List[SchemaColumn]] = None,
+    ) -> ParquetSinkResultObject:
+        """Write a stream of batches to the dataset, one batch at a time.
+
+        Args:
+            result_objects: The batches to write, e.g. from MissingFakerMultiBatchGenerator.iter_batches.
+                The epoch_index and indexes.batch_id of each batch are used as partition keys.
+            schema: The columns of the dataset (e.g. from infer_schema_from_generator).
+                If None, the schema is inferred from the first batch.
+        """
+
+        start = time.perf_counter()
+        write_seconds = 0.0
+        num_rows = 0
+        num_batches = 0
+        file_paths = []
+
+        arrow_schema = None
+        # With row_group_per_batch, the writer for the current epoch's file
+        writer = None
+        writer_epoch_index = None
+
+        try:
+            for result_object in result_objects:
+                write_start = time.perf_counter()
+
+                df = result_object.dataframe
+                if arrow_schema is None:
+                    if schema is None:
+                        schema = infer_schema(df)
+                    arrow_schema = _to_arrow_schema(schema)
+
+                table = _to_arrow_table(df, schema, arrow_schema)
+
+                if self.row_group_per_batch:
+                    if writer_epoch_index != result_object.epoch_index:
+                        if writer is not None:
+                            writer.close()
+
+                        file_path = self._get_file_path(
+                            epoch_index=result_object.epoch_index
+                        )
+                        writer = pq.ParquetWriter(
+                            file_path, arrow_schema, compression=self.compression
+                        )
+                        writer_epoch_index = result_object.epoch_index
+                        file_paths.append(file_path)
+
+                    writer.write_table(table, row_group_size=max(len(table), 1))
+
+                else:
+                    file_path = self._get_file_path(
+                        epoch_index=result_object.epoch_index,
+                        batch_id=result_object.indexes.batch_id,
+                    )
+                    pq.write_table(table, file_path, compression=self.compression)
+                    file_paths.append(file_path)
+
+                write_seconds += time.perf_counter() - write_start
+                num_rows += len(df)
+                num_batches += 1
+
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return ParquetSinkResultObject(
+            root_path=self.root_path,
+            num_rows=num_rows,
+            num_batches=num_batches,
+            file_paths=file_paths,
+            seconds=time.perf_counter() - start,
+            write_seconds=write_seconds,
+        )
+
+    def _get_file_path(
+        self,
+        epoch_index: int,
+        batch_id: Optional[int] = None,
+    ) -> str:
+        """Get the path of a file in the dataset, creating its partition directories if needed."""
+
+        directory = os.path.join(self.root_path, f"epoch={epoch_index}")
+        if batch_id is not None:
+            directory = os.path.join(directory, f"batch_id={batch_id}")
+
+        os.makedirs(directory, exist_ok=True)
+
+        return os.path.join(directory, "part-0.parquet")
+
+
+def _to_arrow_schema(
+    schema: List[SchemaColumn],
+) -> "pa.Schema":
+    arrow_types = _get_arrow_types()
+
+    return pa.schema(
+        [pa.field(column.name, arrow_types[column.column_type]) for column in schema]
+    )
+
+
+def _to_arrow_table(
+    df: pd.DataFrame,
+    schema: List[SchemaColumn],
+    arrow_schema: "pa.Schema",
+) -> "pa.Table":
+    """Convert a batch to an Arrow table with the given schema, one column at a time."""
+
+    arrays = [
+        _to_arrow_array(df[column.name], column.column_type, field.type)
+        for column, field in zip(schema, arrow_schema)
+    ]
+
+    return pa.Table.from_arrays(arrays, schema=arrow_schema)
+
+
+def _to_arrow_array(
+    series: pd.Series,
+    column_type: ColumnType,
+    arrow_type: "pa.DataType",
+) -> "pa.Array":
+    """Convert a column to an Arrow array of the given type.
+
+    Most columns convert directly (without going through python objects). Columns that Arrow
+    can't convert on its own, like lists stored as TEXT or integers that missingness has
+    turned into floats, are converted value by value.
+    """
+
+    try:
+        return pa.Array.from_pandas(series, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        pass
+
+    convert = _PYTHON_VALUE_CONVERTERS.get(column_type, lambda value: value)
+    is_null = series.isna().to_numpy()
+    values = [
+        None if null else convert(value)
+        for value, null in zip(series.to_numpy(dtype=object).tolist(), is_null)
+    ]
+
+    return pa.array(values, type=arrow_type)
@@ -0,0 +1,221 @@
+"""
+Backend-neutral column types for the sinks, inferred from a dataframe or from the generator that made it.
+
+Each sink maps these types to its own (e.g. SQL or Arrow) types.
+"""
+
+import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Literal
+from pydantic import BaseModel
+
+import numpy as np
+import pandas as pd
+
+from did_you_miss_me.generators.column import (
+    FakerColumnGenerator,
+)
+from did_you_miss_me.generators.dataframe import (
+    MissingFakerDataframeGenerator,
+)
+from did_you_miss_me.generators.keys import (
+    KeyColumnGenerator,
+)
+from did_you_miss_me.generators.timestamp import (
+    TimestampFormat,
+)
+from did_you_miss_me.rng import (
+    seeded_random,
+)
+
+ColumnType = Literal[
+    "boolean",
+    "integer",
+    "float",
+    "timestamp",
+    "date",
+    "time",
+    "binary",
+    "string",
+]
+
+
+class SchemaColumn(BaseModel):
+    """A column of a dataset: its name and (backend-neutral) type."""
+
+    name: str
+    column_type: ColumnType
+
+
+def infer_schema(
+    df: pd.DataFrame,
+) -> List[SchemaColumn]:
+    """Infer a type for each column of a dataframe, from its dtype.
+
+    Object columns are typed by their first non-null value. Anything that isn't a number,
+    boolean, date, time, or bytes is stored as a string.
+
+    Note:
+        A single batch doesn't always tell the whole story (e.g. a column that is all null in
+        the first batch). When the generator is available, infer_schema_from_generator gives
+        types that are stable across batches.
+    """
+
+    return [
+        SchemaColumn(name=str(name), column_type=_infer_column_type(df[name]))
+        for name in df.columns
+    ]
+
+
+def infer_schema_from_generator(
+    dataframe_generator: MissingFakerDataframeGenerator,
+) -> List[SchemaColumn]:
+    """Infer a type for each column that a generator produces, from the generator's metadata.
+
+    The types come from each column generator's settings (faker_type, the data_type of keys,
+    and the TimestampFormat), so they don't depend on the values (or missingness) in any
+    particular batch. Columns come in the same order as in the generated dataframes.
+    """
+
+    columns = []
+
+    widget = dataframe_generator.timestamp_and_id_widget
+    if widget is not None:
+        if widget.batch_id_column_generator is not None:
+            columns.append(
+                SchemaColumn(
+                    name=widget.batch_id_column_generator.name, column_type="integer"
+                )
+            )
+
+        key_generators = [
+            widget.primary_key_column_generator
+        ] + widget.foreign_key_column_generators
+        for key_generator in key_generators:
+            if key_generator is not None:
+                columns.append(
+                    SchemaColumn(
+                        name=key_generator.name,
+                        column_type=_get_key_column_type(key_generator),
+                    )
+                )
+
+        timestamp_generator = widget.timestamp_column_generator
+        if timestamp_generator is not None:
+            column_types = _TIMESTAMP_COLUMN_TYPES[timestamp_generator.timestamp_format]
+            for name, column_type in zip(timestamp_generator.names, column_types):
+                columns.append(SchemaColumn(name=name, column_type=column_type))
+
+    for column_generator in dataframe_generator.column_generators:
+        columns.append(
+            SchemaColumn(
+                name=column_generator.name,
+                column_type=_get_faker_column_type(column_generator),
+            )
+        )
+
+    return columns
+
+
+# The types of the columns generated for each timestamp format
+_TIMESTAMP_COLUMN_TYPES: Dict[TimestampFormat, List[ColumnType]] = {
+    TimestampFormat.UNIX_EPOCH: ["integer"],
+    TimestampFormat.ISO_8601: ["timestamp"],
+    TimestampFormat.SINGLE_COLUMN_TIMESTAMP: ["string"],
+    TimestampFormat.MULTI_COLUMN_TIMESTAMP: ["date", "time"],
+    TimestampFormat.SINGLE_COLUMN_DATE: ["date"],
+    TimestampFormat.MULTI_COLUMN_DATE: ["integer", "integer", "integer"],
+}
+
+
+def _get_key_column_type(
+    key_generator: KeyColumnGenerator,
+) -> ColumnType:
+    if key_generator.data_type == "bytes":
+        return "binary"
+
+    if key_generator.data_type == "int":
+        return "integer"
+
+    return "string"
+
+
+# Types for each faker type that has been looked up so far, keyed by faker type.
+_FAKER_COLUMN_TYPE_CACHE: Dict[str, ColumnType] = {}
+
+
+def _get_faker_column_type(
+    column_generator: FakerColumnGenerator,
+    num_samples: int = 20,
+) -> ColumnType:
+    """Look up the type for a faker type, by sampling a few values from faker.
+
+    The faker instance's random state is restored afterwards, so sampling doesn't change the
+    generated data. Faker types that return a mix of python types are stored as strings.
+    """
+
+    faker_type = column_generator.faker_type
+
+    if faker_type not in _FAKER_COLUMN_TYPE_CACHE:
+        fake = column_generator._fake
+        with seeded_random(0, fake.random):
+            method = getattr(fake, faker_type)
+            column_types = {
+                _get_column_type_for_value(value)
+                for value in (method() for _ in range(num_samples))
+                if value is not None
+            }
+
+        _FAKER_COLUMN_TYPE_CACHE[faker_type] = (
+            column_types.pop() if len(column_types) == 1 else "string"
+        )
+
+    return _FAKER_COLUMN_TYPE_CACHE[faker_type]
+
+
+def _get_column_type_for_value(
+    value: Any,
+) -> ColumnType:
+    # Check subclasses before their parents: bool before int, and datetime before date
+    if isinstance(value, (bool, np.bool_)):
+        return "boolean"
+    if isinstance(value, (int, np.integer)):
+        return "integer"
+    if isinstance(value, (float, Decimal, np.floating)):
+        return "float"
+    if isinstance(value, bytes):
+        return "binary"
+    if isinstance(value, datetime.datetime):
+        return "timestamp"
+    if isinstance(value, datetime.date):
+        return "date"
+    if isinstance(value, datetime.time):
+        return "time"
+
+    return "string"
+
+
+def _infer_column_type(
+    series: pd.Series,
+) -> ColumnType:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return _infer_column_type(pd.Series(series.cat.categories))
+
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return "boolean"
+
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return "integer"
+
+    if pd.api.types.is_float_dtype(series.dtype):
+        return "float"
+
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return "timestamp"
+
+    if series.dtype == object:
+        non_null_values = series.dropna()
+        if len(non_null_values) > 0:
+            return _get_column_type_for_value(non_null_values.iloc[0])
+
+    return "string"
@@ -0,0 +1,346 @@
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from pydantic import BaseModel, Field
+
+import numpy as np
+import pandas as pd
+
+from did_you_miss_me.abc import (
+    DataSink,
+)
+from did_you_miss_me.generators.dataframe import (
+    MissingFakerDataframeGenerator,
+)
+from did_you_miss_me.sinks.schema import (
+    ColumnType,
+    SchemaColumn,
+    infer_schema,
+    infer_schema_from_generator,
+)
+
+
+class SqlColumn(BaseModel):
+    """A column in a SQL table: its name and SQL type."""
+
+    name: str
+    sql_type: str
+
+
+class SqlSinkResultObject(BaseModel):
+    """
+    A result object for a SqlSink.
+    """
+
+    table_name: str
+    num_rows: int
+    num_batches: int
+    seconds: float = Field(
+        description="Total time spent in SqlSink.write, including waiting for batches to be generated.",
+    )
+    write_seconds: float = Field(
+        description="Time spent creating the table and inserting rows.",
+    )
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.seconds == 0:
+            return 0.0
+        return self.num_rows / self.seconds
+
+
+# How to convert (non-null) python values for each SQL type, so that any DB-API driver can bind them
+_SQL_VALUE_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "BOOLEAN": bool,
+    "INTEGER": int,
+    "REAL": float,
+    "TIMESTAMP": str,
+    "DATE": str,
+    "TIME": str,
+    "BLOB": bytes,
+    "TEXT": str,
+}
+
+# Placeholders for each DB-API paramstyle (see PEP 249)
+_PLACEHOLDERS: Dict[str, Callable[[int], str]] = {
+    "qmark": lambda i: "?",
+    "numeric": lambda i: f":{i + 1}",
+    "format": lambda i: "%s",
+    "pyformat": lambda i: "%s",
+}
+
+
+class SqlSink(DataSink):
+    """Streams batches of data into a SQL table, writing each batch as soon as it arrives.
+
+    * The table is created from the schema of the first batch.
+    * Each batch is inserted with executemany, chunk_size rows at a time, and committed as a single transaction.
+    * Works with any DB-API 2.0 connection (e.g. sqlite3, psycopg2).
+    """
+
+    conn: Any = Field(
+        description="A DB-API 2.0 connection, e.g. sqlite3.connect('my.db').",
+    )
+    table_name: str = Field(
+        description="The name of the table to write to.",
+    )
+    if_exists: str = Field(
+        "replace",
+        description="What to do if the table already exists: 'replace' drops and recreates it, 'append' adds rows to it, and 'fail' raises an error.",
+    )
+    chunk_size: int = Field(
+        10_000,
+        description="The number of rows to send in each executemany call.",
+    )
+    paramstyle: Optional[str] = Field(
+        None,
+        description="The DB-API paramstyle of the connection's driver. If None, it's looked up from the driver module.",
+    )
+
+    @classmethod
+    def create(
+        cls,
+        conn: Any,
+        table_name: str,
+        if_exists: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        paramstyle: Optional[str] = None,
+    ) -> "SqlSink":
+        """Create a SqlSink."""
+
+        if if_exists is None:
+            if_exists = "replace"
+
+        if if_exists not in ["replace", "append", "fail"]:
+            raise ValueError(f"Unrecognized value for if_exists: {if_exists}")
+
+        if chunk_size is None:
+            chunk_size = 10_000
+
+        if paramstyle is None:
+            driver_module = sys.modules.get(type(conn).__module__.split(".")[0])
+            paramstyle = getattr(driver_module, "paramstyle", "qmark")
+
+        if paramstyle not in _PLACEHOLDERS:
+            raise ValueError(f"Unsupported paramstyle: {paramstyle}")
+
+        return cls(
+            conn=conn,
+            table_name=table_name,
+            if_exists=if_exists,
+            chunk_size=chunk_size,
+            paramstyle=paramstyle,
+        )
+
+    def write(
+        self,
+        dataframes: Iterable[pd.DataFrame],
+        schema: Optional[List[SqlColumn]] = None,
+    ) -> SqlSinkResultObject:
+        """Write a stream of dataframes to the table, one batch at a time.
+
+        Only the batch being written is held in memory, so dataframes can be a generator
+        that produces each batch on demand.
+
+        Args:
+            dataframes: The batches to write. Every batch should have the same columns.
+            schema: The columns of the table (e.g. from infer_sql_schema_from_generator).
+                If None, the schema is inferred from the first batch. Either way, it is
+                worked out once and reused for every batch.
+        """
+
+        start = time.perf_counter()
+        write_seconds = 0.0
+        num_rows = 0
+        num_batches = 0
+
+        columns = schema
+        insert_sql = None
+        for df in dataframes:
+            write_start = time.perf_counter()
+
+            if insert_sql is None:
+                if columns is None:
+                    columns = infer_sql_schema(df)
+                self._create_table(columns)
+                insert_sql = self._get_insert_sql(columns)
+
+            self._insert(df, columns, insert_sql)
+
+            write_seconds += time.perf_counter() - write_start
+            num_rows += len(df)
+            num_batches += 1
+
+        return SqlSinkResultObject(
+            table_name=self.table_name,
+            num_rows=num_rows,
+            num_batches=num_batches,
+            seconds=time.perf_counter() - start,
+            write_seconds=write_seconds,
+        )
+
+    def _create_table(
+        self,
+        columns: List[SqlColumn],
+    ) -> None:
+        table = _quote_identifier(self.table_name)
+        column_definitions = ", ".join(
+            f"{_quote_identifier(column.name)} {column.sql_type}" for column in columns
+        )
+
+        if self.if_exists == "replace":
+            statements = [
+                f"DROP TABLE IF EXISTS {table}",
+                f"CREATE TABLE {table} ({column_definitions})",
+            ]
+        elif self.if_exists == "append":
+            statements = [f"CREATE TABLE IF NOT EXISTS {table} ({column_definitions})"]
+        else:
+            # If the table already exists, the database raises an error
+            statements = [f"CREATE TABLE {table} ({column_definitions})"]
+
+        def execute_statements(cursor):
+            for statement in statements:
+                cursor.execute(statement)
+
+        self._execute_in_transaction(execute_statements)
+
+    def _get_insert_sql(
+        self,
+        columns: List[SqlColumn],
+    ) -> str:
+        """Prepare the INSERT statement once, so every chunk of every batch reuses it."""
+
+        column_names = ", ".join(_quote_identifier(column.name) for column in columns)
+        placeholders = ", ".join(
+            _PLACEHOLDERS[self.paramstyle](i) for i in range(len(columns))
+        )
+
+        return f"INSERT INTO {_quote_identifier(self.table_name)} ({column_names}) VALUES ({placeholders})"
+
+    def _insert(
+        self,
+        df: pd.DataFrame,
+        columns: List[SqlColumn],
+        insert_sql: str,
+    ) -> None:
+        """Insert a batch in chunks of chunk_size rows, as a single transaction."""
+
+        def insert_chunks(cursor):
+            # Convert one column of one chunk at a time, rather than copying the whole batch
+            for chunk_start in range(0, len(df), self.chunk_size):
+                chunk_stop = chunk_start + self.chunk_size
+                column_values = [
+                    _to_sql_values(
+                        df[column.name].iloc[chunk_start:chunk_stop], column.sql_type
+                    )
+                    for column in columns
+                ]
+                cursor.executemany(insert_sql, list(zip(*column_values)))
+
+        self._execute_in_transaction(insert_chunks)
+
+    def _execute_in_transaction(
+        self,
+        execute: Callable[[Any], Any],
+    ) -> None:
+        """Run execute(cursor), then commit; or roll back if anything goes wrong."""
+
+        cursor = self.conn.cursor()
+        try:
+            execute(cursor)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+
+def infer_sql_schema(
+    df: pd.DataFrame,
+) -> List[SqlColumn]:
+    """Infer a SQL type for each column of a dataframe, from its dtype (see infer_schema).
+
+    Note:
+        A single batch doesn't always tell the whole story (e.g. a column that is all null in
+        the first batch). When the generator is available, infer_sql_schema_from_generator
+        gives types that are stable across batches.
+    """
+
+    return _to_sql_schema(infer_schema(df))
+
+
+def infer_sql_schema_from_generator(
+    dataframe_generator: MissingFakerDataframeGenerator,
+) -> List[SqlColumn]:
+    """Infer a SQL type for each column that a generator produces, from the generator's metadata.
+
+    See infer_schema_from_generator. The types don't depend on the values (or missingness) in
+    any particular batch.
+    """
+
+    return _to_sql_schema(infer_schema_from_generator(dataframe_generator))
+
+
+# The SQL type to store each column type as
+_SQL_TYPES: Dict[ColumnType, str] = {
+    "boolean": "BOOLEAN",
+    "integer": "INTEGER",
+    "float": "REAL",
+    "timestamp": "TIMESTAMP",
+    "date": "DATE",
+    "time": "TIME",
+    "binary": "BLOB",
+    "string": "TEXT",
+}
+
+
+def _to_sql_schema(
+    schema: List[SchemaColumn],
+) -> List[SqlColumn]:
+    return [
+        SqlColumn(name=column.name, sql_type=_SQL_TYPES[column.column_type])
+        for column in schema
+    ]
+
+
+# The numpy dtype kinds whose values (after .tolist()) can be bound as-is, for each SQL type
+_NATIVE_DTYPE_KINDS: Dict[str, str] = {
+    "BOOLEAN": "b",
+    "INTEGER": "iu",
+    "REAL": "f",
+}
+
+
+def _to_sql_values(
+    series: pd.Series,
+    sql_type: str,
+) -> List[Any]:
+    """Convert a series to a list of values that DB-API drivers can bind, with None for nulls.
+
+    Columns whose dtype already matches the SQL type skip the per-value conversion.
+    """
+
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in _NATIVE_DTYPE_KINDS.get(
+        sql_type, ""
+    ):
+        if dtype.kind != "f" or not series.isna().any():
+            return series.to_numpy().tolist()
+
+        return series.to_numpy(dtype=object, na_value=None).tolist()
+
+    convert = _SQL_VALUE_CONVERTERS[sql_type]
+    is_null = series.isna().to_numpy()
+
+    return [
+        None if null else convert(value)
+        for value, null in zip(series.to_numpy(dtype=object).tolist(), is_null)
+    ]
+
+
+def _quote_identifier(
+    name: str,
+) -> str:
+    return '"' + name.replace('"', '""') + '"'
@@ -5,12 +5,14 @@ setup(
     version="0.1.0",
     install_requires=[
         "faker",
+        "numpy>=2.0",
         "pandas",
         "pydantic",
     ],
     extras_require={
-        "dev": ["pytest", "black", "ruff", "tabulate"],
+        "dev": ["pytest", "pytest-benchmark", "black", "ruff", "tabulate"],
         "ai": ["langchain"],
+        "arrow": ["pyarrow"],
     },
     packages=find_packages(include=["did_you_miss_me", "did_you_miss_me.*"]),
 )
@@ -0,0 +1,132 @@
+import pytest
+import random
+
+import numpy as np
+
+pa = pytest.importorskip("pyarrow")
+
+import did_you_miss_me as dymm
+from did_you_miss_me.generators.arrow import (
+    _with_nulls,
+)
+from did_you_miss_me.generators.dataframe import (
+    MissingFakerDataframeGenerator,
+    MissingFakerTableResultObject,
+)
+from did_you_miss_me.modifiers.missingness import (
+    ProportionalColumnMissingnessParams,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_random_seed():
+    random.seed(40)
+
+
+def _create_generator() -> MissingFakerDataframeGenerator:
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=6,
+        exact_rows=100,
+        include_primary_key=True,
+        include_timestamps=True,
+    )
+    # Faker types sampled in bulk (with and without weights), row by row, and with mixed types
+    faker_types = ["first_name", "state", "pyint", "boolean", "sha1", "pylist"]
+    missingness_types = [
+        "PROPORTIONAL",
+        "ALWAYS",
+        "PROPORTIONAL",
+        "NEVER",
+        "PROPORTIONAL",
+        "PROPORTIONAL",
+    ]
+    for column_generator, faker_type, missingness_type in zip(
+        generator.column_generators, faker_types, missingness_types
+    ):
+        column_generator.faker_type = faker_type
+        column_generator.missingness_type = missingness_type
+        if missingness_type == "PROPORTIONAL":
+            column_generator.missingness_params = ProportionalColumnMissingnessParams(
+                proportion=0.3
+            )
+
+    return generator
+
+
+def test__generate__arrow_backend():
+    generator = _create_generator()
+
+    result_object = generator.generate(backend="arrow", seed=1)
+
+    assert isinstance(result_object, MissingFakerTableResultObject)
+    table = result_object.table
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 100
+
+    names = [c.name for c in generator.column_generators]
+    assert table.column_names[-6:] == names
+    assert table.schema.field(names[2]).type == pa.int64()
+    assert table.schema.field(names[3]).type == pa.bool_()
+    # An all-null column keeps the type of its values
+    assert table.schema.field(names[1]).type == pa.string()
+    assert table[names[1]].null_count == 100
+    assert table[names[3]].null_count == 0
+    assert 10 < table[names[0]].null_count < 50
+
+
+def test__generate__arrow_backend_matches_pandas_backend():
+    generator = _create_generator()
+
+    table = generator.generate(backend="arrow", seed=1).table
+    df = generator.generate(seed=1).dataframe
+
+    assert table.column_names == df.columns.tolist()
+    for column_generator in generator.column_generators[:5]:
+        name = column_generator.name
+        assert table[name].is_null().to_pylist() == df[name].isna().tolist()
+        assert table[name].drop_null().to_pylist() == df[name].dropna().tolist()
+
+
+def test__generate__arrow_backend_in_parallel():
+    generator = _create_generator()
+
+    table = generator.generate(backend="arrow", seed=1).table
+    parallel_table = generator.generate(backend="arrow", n_jobs=2, seed=1).table
+
+    # pylist draws datetimes relative to the current time, so that column is left out
+    names = [
+        name
+        for name in table.column_names
+        if name != generator.column_generators[5].name
+    ]
+    assert parallel_table.select(names).equals(table.select(names))
+
+
+def test__generate__unrecognized_backend():
+    with pytest.raises(ValueError):
+        _create_generator().generate(backend="polars")
+
+
+def test___with_nulls():
+    mask = np.array([False, True, False, True])
+
+    for array in [
+        pa.array([1, 2, 3, 4]),
+        pa.array(["a", "b", "c", "d"]),
+        pa.array([[1], [2], [3], [4]]),
+    ]:
+        array_with_nulls = _with_nulls(array, mask)
+        assert array_with_nulls.type == array.type
+        assert array_with_nulls.is_null().to_pylist() == mask.tolist()
+        assert array_with_nulls.drop_null().equals(array.filter(pa.array(~mask)))
+
+
+def test__generate_dataframe__arrow_backend():
+    table = dymm.generate_dataframe(
+        exact_rows=20, num_columns=5, backend="arrow", seed=2
+    )
+    df = dymm.generate_dataframe(exact_rows=20, num_columns=5, seed=2)
+
+    assert isinstance(table, pa.Table)
+    assert table.shape == df.shape
+    assert table.column_names == df.columns.tolist()
@@ -0,0 +1,156 @@
+import pytest
+import random
+
+import pandas as pd
+from pydantic import ValidationError
+
+from did_you_miss_me.generators.dataframe import (
+    MissingFakerDataframeGenerator,
+)
+from did_you_miss_me.generators.plan import (
+    CompiledDataframePlan,
+)
+from did_you_miss_me.generators.timestamps_and_ids import (
+    Indexes,
+)
+from did_you_miss_me.generators.value_pool import (
+    FakerValuePoolCache,
+    get_faker_value_pool_cache,
+    set_faker_value_pool_cache,
+)
+from did_you_miss_me.modifiers.missingness import (
+    ProportionalColumnMissingnessParams,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_random_seed():
+    random.seed(40)
+
+
+def _create_generator(**kwargs) -> MissingFakerDataframeGenerator:
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=8,
+        include_primary_key=True,
+        include_timestamps=True,
+        **kwargs,
+    )
+    # A mix of faker types that are sampled in bulk (with and without weights) and row by row
+    faker_types = [
+        "first_name",
+        "state",
+        "http_method",
+        "currency_code",
+        "name",
+        "pyint",
+        "sha1",
+        "boolean",
+    ]
+    missingness_types = [
+        "NEVER",
+        "ALWAYS",
+        "PROPORTIONAL",
+        "NEVER",
+        "PROPORTIONAL",
+        "ALWAYS",
+        "NEVER",
+        "NEVER",
+    ]
+    for column_generator, faker_type, missingness_type in zip(
+        generator.column_generators, faker_types, missingness_types
+    ):
+        column_generator.faker_type = faker_type
+        column_generator.missingness_type = missingness_type
+        if missingness_type == "PROPORTIONAL":
+            column_generator.missingness_params = ProportionalColumnMissingnessParams(
+                proportion=0.3
+            )
+
+    return generator
+
+
+def test__compile():
+    generator = _create_generator(exact_rows=50)
+    plan = generator.compile()
+
+    assert isinstance(plan, CompiledDataframePlan)
+    assert plan.column_names == tuple(c.name for c in generator.column_generators)
+    assert len(plan.uniform_buffer) == 50
+
+    with pytest.raises(ValidationError):
+        plan.column_plans = ()
+
+
+@pytest.mark.parametrize(
+    "row_kwargs",
+    [
+        {"exact_rows": 50},
+        {"min_rows": 20, "max_rows": 80},
+        {"exact_rows": 50, "dtype_backend": "numpy_nullable"},
+    ],
+)
+def test__compiled_plan_generates_the_same_data_as_the_generator(row_kwargs):
+    generator = _create_generator(**row_kwargs)
+    plan = generator.compile()
+    next_indexes = Indexes.create()
+
+    faker_states = [c._fake.random.getstate() for c in generator.column_generators]
+    random.seed(1)
+    expected_result_object = generator.generate(next_indexes=next_indexes)
+
+    for column_generator, faker_state in zip(generator.column_generators, faker_states):
+        column_generator._fake.random.setstate(faker_state)
+    random.seed(1)
+    result_object = plan.generate(next_indexes=next_indexes)
+
+    pd.testing.assert_frame_equal(
+        result_object.dataframe, expected_result_object.dataframe
+    )
+    assert result_object.next_indexes == expected_result_object.next_indexes
+
+
+def test__compiled_plan_reuses_buffers_without_changing_earlier_results():
+    plan = _create_generator(exact_rows=50).compile()
+
+    df_1 = plan.generate().dataframe
+    df_1_copy = df_1.copy()
+    df_2 = plan.generate().dataframe
+
+    pd.testing.assert_frame_equal(df_1, df_1_copy)
+    assert not df_1.equals(df_2)
+
+
+def test__compiled_plan_with_more_rows_than_its_buffers():
+    plan = _create_generator(exact_rows=50).compile()
+
+    df = plan.generate(num_rows=120).dataframe
+
+    assert df.shape == (120, 10)
+    assert len(plan.uniform_buffer) == 50
+
+
+def test__generate__without_timestamps_and_ids():
+    generator = _create_generator(exact_rows=20)
+    generator.timestamp_and_id_widget = None
+    next_indexes = Indexes.create()
+
+    result_object = generator.compile().generate(next_indexes=next_indexes)
+
+    assert result_object.dataframe.shape == (20, 8)
+    assert result_object.next_indexes == next_indexes.advance(20)
+
+
+def test__generate__uses_the_current_value_pool_cache():
+    generator = _create_generator(exact_rows=20, use_value_pools=True)
+    plan = generator.compile()
+
+    original_cache = get_faker_value_pool_cache()
+    cache = FakerValuePoolCache.create(pool_size=10)
+    set_faker_value_pool_cache(cache)
+    try:
+        plan.generate()
+    finally:
+        set_faker_value_pool_cache(original_cache)
+
+    # "name" and "sha1" aren't sampled in bulk, so they're drawn from pools
+    assert "name" in cache and "sha1" in cache
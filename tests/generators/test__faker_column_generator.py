@@ -8,6 +8,7 @@ from did_you_miss_me.generators.column import (
     FakerColumnGenerator,
 )
 
+
 @pytest.fixture(autouse=True)
 def set_random_seed():
     random.seed(40)
@@ -27,3 +28,31 @@ def test__generate_series_from_plan__column_missingness_type__always():
     assert series.shape == (20,)
     print(series[:5].tolist())
     assert ("AM" in series.tolist()) or ("PM" in series.tolist())
+
+
+def test__generate__samples_finite_faker_types_in_bulk():
+    generator = FakerColumnGenerator(
+        name="test_column",
+        faker_type="http_method",
+    )
+    series = generator.generate(
+        num_rows=1000,
+    )
+
+    assert series.shape == (1000,)
+    http_methods = generator._fake.http_method.__self__.http_methods
+    assert set(series.tolist()) <= set(http_methods)
+    assert series.nunique() > 1
+
+
+def test__generate__falls_back_to_one_faker_call_per_row():
+    generator = FakerColumnGenerator(
+        name="test_column",
+        faker_type="sha1",
+    )
+    series = generator.generate(
+        num_rows=20,
+    )
+
+    assert series.shape == (20,)
+    assert series.str.len().eq(40).all()
@@ -0,0 +1,118 @@
+import pytest
+import random
+
+from did_you_miss_me.generators.column import (
+    FakerColumnGenerator,
+)
+from did_you_miss_me.generators.dataframe import (
+    MissingFakerDataframeGenerator,
+)
+from did_you_miss_me.generators.value_pool import (
+    FakerValuePoolCache,
+    get_faker_value_pool_cache,
+    set_faker_value_pool_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_random_seed():
+    random.seed(40)
+
+
+@pytest.fixture
+def cache():
+    """Swap in a small, empty cache for the duration of a test."""
+    original_cache = get_faker_value_pool_cache()
+    cache = FakerValuePoolCache.create(pool_size=20, max_pools=2)
+    set_faker_value_pool_cache(cache)
+    yield cache
+    set_faker_value_pool_cache(original_cache)
+
+
+def _counter():
+    """A stand-in faker method that returns 0, 1, 2, ... so that calls can be counted."""
+    calls = iter(range(1_000_000))
+    return lambda: next(calls)
+
+
+def test__sample(cache):
+    method = _counter()
+
+    series = cache.sample("sentence", method, num_rows=100)
+    assert series.shape == (100,)
+    assert series.index.tolist() == list(range(100))
+    assert set(series.tolist()) <= set(range(20))
+
+    # The second sample is drawn from the same pool, without calling the faker method again
+    series = cache.sample("sentence", method, num_rows=100)
+    assert set(series.tolist()) <= set(range(20))
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test__sample__evicts_the_least_recently_used_pool(cache):
+    cache.sample("address", _counter(), num_rows=5)
+    cache.sample("sentence", _counter(), num_rows=5)
+    cache.sample("address", _counter(), num_rows=5)
+    cache.sample("paragraph", _counter(), num_rows=5)
+
+    assert len(cache) == 2
+    assert "address" in cache
+    assert "sentence" not in cache
+    assert cache.stats.evictions == 1
+
+
+def test__sample__refreshes_pools(cache):
+    cache.max_draws_per_pool = 50
+    method = _counter()
+
+    cache.sample("sentence", method, num_rows=50)
+    series = cache.sample("sentence", method, num_rows=50)
+
+    # The pool was regenerated before the second sample, so it only has values from the second batch of calls
+    assert set(series.tolist()) <= set(range(20, 40))
+    assert cache.stats.refreshes == 1
+
+
+def test__faker_column_generator__use_value_pool(cache):
+    generator = FakerColumnGenerator(
+        name="test_column",
+        faker_type="sentence",
+        use_value_pool=True,
+    )
+
+    series = generator.generate(num_rows=200)
+
+    assert series.shape == (200,)
+    assert series.nunique() <= 20
+    assert "sentence" in cache
+
+
+def test__faker_column_generator__use_value_pool__samples_finite_faker_types_exactly(
+    cache,
+):
+    generator = FakerColumnGenerator(
+        name="test_column",
+        faker_type="http_method",
+        use_value_pool=True,
+    )
+
+    generator.generate(num_rows=200)
+
+    assert len(cache) == 0
+
+
+def test__missing_faker_dataframe_generator__use_value_pools(cache):
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=6,
+        exact_rows=50,
+        use_value_pools=True,
+    )
+    assert all(c.use_value_pool for c in generator.column_generators)
+
+    df = generator.generate().dataframe
+    compiled_df = generator.compile().generate().dataframe
+
+    assert df.shape == compiled_df.shape == (50, 6)
@@ -2,11 +2,17 @@
 
 import pytest
 import random
+import uuid
 
+import numpy as np
 
 from did_you_miss_me.generators.keys import (
     # KeyColumnGenerator,
     IntegerKeyColumnGenerator,
+    UuidKeyColumnGenerator,
+    _BLOCK_SIZE,
+    _find_unmasked_positions,
+    _pack_unmasked,
 )
 
 
@@ -83,4 +89,93 @@ def test__key_column_generator__with_percent_unique():
         starting_value=0,
     ).tolist()
     print(values)
-    assert values == [0, 0, 0, 3, 3, 3, 3, 4, 7, 7]
+    assert values == [0, 0, 2, 2, 3, 5, 6, 7, 9, 9]
+
+
+def test__uuid_key_column_generator():
+    generator = UuidKeyColumnGenerator.create(
+        percent_missing=0.0,
+        percent_unique=1.0,
+    )
+    values = generator.generate(
+        num_rows=1000,
+    ).tolist()
+
+    assert len(set(values)) == 1000
+    for value in values:
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert str(parsed) == value
+
+
+def test__uuid_key_column_generator__with_bytes_data_type():
+    generator = UuidKeyColumnGenerator.create(
+        percent_missing=0.0,
+        percent_unique=1.0,
+        data_type="bytes",
+    )
+    values = generator.generate(
+        num_rows=1000,
+    ).tolist()
+
+    assert len(set(values)) == 1000
+    for value in values:
+        assert len(value) == 16
+        assert uuid.UUID(bytes=value).version == 4
+
+
+def test__key_column_generator__uniqueness_only_reuses_existing_values():
+    generator = IntegerKeyColumnGenerator.create(
+        incrementing=True,
+        data_type="int",
+        percent_missing=0.0,
+        percent_unique=0.3,
+    )
+    series = generator.generate(
+        num_rows=10000,
+        starting_value=0,
+    )
+
+    assert series.shape == (10000,)
+    assert series.between(0, 9999).all()
+    # About 30% of the values are replaced by copies of the other 70%
+    assert 0.65 < series.nunique() / 10000 < 0.75
+
+
+def test__key_column_generator__missingness_proportion():
+    generator = IntegerKeyColumnGenerator.create(
+        incrementing=True,
+        data_type="int",
+        percent_missing=0.25,
+        percent_unique=1.0,
+    )
+    series = generator.generate(
+        num_rows=10000,
+        starting_value=0,
+    )
+
+    assert 0.23 < series.isnull().mean() < 0.27
+
+
+@pytest.mark.parametrize("p", [0.0, 0.5, 0.99])
+def test___find_unmasked_positions(p):
+    rng = np.random.default_rng(1)
+    mask = rng.random(_BLOCK_SIZE * 50) < p
+    # A block with no unmasked values, and one with only unmasked values
+    mask[:_BLOCK_SIZE] = True
+    mask[-_BLOCK_SIZE:] = False
+
+    unmasked_words = _pack_unmasked(mask)
+    unmasked_counts = np.cumsum(np.bitwise_count(unmasked_words), dtype=np.int64)
+    unmasked_positions = np.flatnonzero(~mask)
+    ranks = rng.integers(0, len(unmasked_positions), size=1_000)
+
+    positions = _find_unmasked_positions(unmasked_words, unmasked_counts, ranks)
+
+    np.testing.assert_array_equal(positions, unmasked_positions[ranks])
+    # Every rank is found, in the same order
+    all_ranks = np.arange(len(unmasked_positions))
+    np.testing.assert_array_equal(
+        _find_unmasked_positions(unmasked_words, unmasked_counts, all_ranks),
+        unmasked_positions,
+    )
@@ -1,10 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 import random
 
-from did_you_miss_me.generators.dataframe import (
-    MissingFakerDataframeGenerator
+import pandas as pd
+
+from did_you_miss_me.generators.dataframe import MissingFakerDataframeGenerator
+from did_you_miss_me.generators.timestamps_and_ids import (
+    Indexes,
 )
 
+
 @pytest.fixture(autouse=True)
 def set_random_seed():
     random.seed(40)
@@ -15,7 +20,9 @@ def test_create_instance():
     Test if an instance of MissingFakerDataframeGenerator can be created.
     """
     generator = MissingFakerDataframeGenerator.create()
-    assert isinstance(generator, MissingFakerDataframeGenerator), "Failed to create an instance."
+    assert isinstance(
+        generator, MissingFakerDataframeGenerator
+    ), "Failed to create an instance."
 
 
 def test_batch_id_not_included_by_default():
@@ -24,7 +31,9 @@ def test_batch_id_not_included_by_default():
     """
     result_object = MissingFakerDataframeGenerator.create().generate()
     df = result_object.dataframe
-    assert "column_batch_id" not in df.columns, "'column_batch_id' should not be included by default."
+    assert (
+        "column_batch_id" not in df.columns
+    ), "'column_batch_id' should not be included by default."
 
 
 def test_batch_id_included_when_flag_true():
@@ -35,4 +44,120 @@ def test_batch_id_included_when_flag_true():
         include_batch_id=True,
     ).generate()
     df = result_object.dataframe
-    assert "column_batch_id" in df.columns, "'column_batch_id' should be included when flag is set to True."
+    assert (
+        "column_batch_id" in df.columns
+    ), "'column_batch_id' should be included when flag is set to True."
+
+
+def test_num_rows_is_drawn_once_per_dataframe():
+    """
+    Test that every column has the same length when the row count is drawn from a range.
+    """
+    result_object = MissingFakerDataframeGenerator.create(
+        min_rows=50,
+        max_rows=500,
+        include_primary_key=True,
+        add_missingness=False,
+    ).generate()
+    df = result_object.dataframe
+    assert (
+        df.notnull().all().all()
+    ), "Columns of different lengths shouldn't be padded with nulls."
+
+
+def test_parallel_generation_does_not_depend_on_n_jobs():
+    """
+    Test that generating columns in worker processes gives the same dataframe as generating them in-process.
+    """
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=6,
+        exact_rows=200,
+    )
+    # Avoid faker types that embed the current time (e.g. tar, zip), which can't be reproduced
+    faker_types = ["name", "pyint", "state", "http_method", "sha1", "date_of_birth"]
+    for column_generator, faker_type in zip(generator.column_generators, faker_types):
+        column_generator.faker_type = faker_type
+    next_indexes = Indexes.create()
+
+    random.seed(1)
+    df_in_process = generator.generate(next_indexes=next_indexes, n_jobs=1).dataframe
+
+    random.seed(1)
+    df_parallel = generator.generate(next_indexes=next_indexes, n_jobs=3).dataframe
+
+    pd.testing.assert_frame_equal(df_in_process, df_parallel)
+
+
+def test_parallel_generation_is_reproducible():
+    """
+    Test that parallel generation follows random.seed, and that columns don't share a random stream.
+    """
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=4,
+        exact_rows=100,
+        add_missingness=False,
+    )
+    # Two columns with the same faker type should still get different values
+    for column_generator in generator.column_generators:
+        column_generator.faker_type = "pyint"
+    next_indexes = Indexes.create()
+
+    random.seed(2)
+    df_1 = generator.generate(next_indexes=next_indexes, n_jobs=2).dataframe
+
+    random.seed(2)
+    df_2 = generator.generate(next_indexes=next_indexes, n_jobs=2).dataframe
+
+    pd.testing.assert_frame_equal(df_1, df_2)
+    assert not df_1.iloc[:, 0].equals(df_1.iloc[:, 1])
+
+
+def test_create_with_a_seed_is_reproducible():
+    """
+    Test that create(seed=...) builds the same generator every time, without changing the global random state.
+    """
+    state = random.getstate()
+    generator_1 = MissingFakerDataframeGenerator.create(
+        min_rows=10, max_rows=50, include_primary_key=True, seed=3
+    )
+    assert random.getstate() == state
+
+    generator_2 = MissingFakerDataframeGenerator.create(
+        min_rows=10, max_rows=50, include_primary_key=True, seed=3
+    )
+    assert generator_1.model_dump() == generator_2.model_dump()
+
+
+def test_generate_with_a_seed_does_not_depend_on_how_it_is_generated():
+    """
+    Test that generate(seed=...) gives the same dataframe serially, in worker processes, and from a compiled plan.
+    """
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=4,
+        min_rows=20,
+        max_rows=80,
+        include_primary_key=True,
+    )
+    # Avoid faker types that embed the current time (e.g. tar, zip), which can't be reproduced
+    faker_types = ["name", "pyint", "state", "sha1"]
+    for column_generator, faker_type in zip(generator.column_generators, faker_types):
+        column_generator.faker_type = faker_type
+
+    df = generator.generate(seed=5).dataframe
+
+    random.seed(1)
+    pd.testing.assert_frame_equal(generator.generate(seed=5).dataframe, df)
+    pd.testing.assert_frame_equal(generator.generate(seed=5, n_jobs=2).dataframe, df)
+    pd.testing.assert_frame_equal(generator.compile().generate(seed=5).dataframe, df)
+    assert not generator.generate(seed=6).dataframe.equals(df)
+
+
+def test_generate_rejects_thread_pools():
+    """
+    Test that a thread pool executor is rejected, since seeded columns can't share a process.
+    """
+    generator = MissingFakerDataframeGenerator.create(num_columns=2, exact_rows=10)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(TypeError, match="ProcessPoolExecutor"):
+            generator.generate(executor=executor, seed=1)
@@ -3,9 +3,11 @@
 import pytest
 import random
 
+import pandas as pd
 
-from did_you_miss_me.generators.multibatch import (
-    MissingFakerMultiBatchGenerator
+from did_you_miss_me.generators.multibatch import MissingFakerMultiBatchGenerator
+from did_you_miss_me.generators.timestamps_and_ids import (
+    Indexes,
 )
 from did_you_miss_me.api import (
     generate_multibatch_dataframe,
@@ -19,24 +21,142 @@ def set_random_seed():
 
 def test__create():
     generator = MissingFakerMultiBatchGenerator.create(
-        exact_rows= 3,
-        num_columns= 3,
-        num_epochs= 3,
-        batches_per_epoch= 3,
+        exact_rows=3,
+        num_columns=3,
+        num_epochs=3,
+        batches_per_epoch=3,
     )
 
 
 def test__integer_primary_keys_are_continuous():
     generator = MissingFakerMultiBatchGenerator.create(
-        exact_rows= 3,
-        num_columns= 3,
-        num_epochs= 3,
-        batches_per_epoch= 3,
+        exact_rows=3,
+        num_columns=3,
+        num_epochs=3,
+        batches_per_epoch=3,
         include_primary_key=True,
     )
     df = generator.generate()
     print(df.columns)
     assert df.shape == (27, 4)
     print(list(df["column_primary_key"]))
-    print([185128+x for x in range(27)])
-    assert (df["column_primary_key"] == [str(634120+x) for x in range(27)]).all()
+    print([185128 + x for x in range(27)])
+    assert (df["column_primary_key"] == [str(634120 + x) for x in range(27)]).all()
+
+
+def test__iter_batches():
+    generator = MissingFakerMultiBatchGenerator.create(
+        exact_rows=3,
+        num_columns=3,
+        num_epochs=2,
+        batches_per_epoch=3,
+        include_primary_key=True,
+    )
+    result_objects = list(generator.iter_batches())
+
+    assert [(r.epoch_index, r.batch_index) for r in result_objects] == [
+        (0, 0),
+        (0, 1),
+        (0, 2),
+        (1, 0),
+        (1, 1),
+        (1, 2),
+    ]
+    for result_object in result_objects:
+        assert result_object.dataframe.shape == (3, 4)
+        assert (
+            result_object.next_indexes.primary_key
+            == result_object.indexes.primary_key + 3
+        )
+
+    # Each batch picks up where the previous one left off
+    for previous, current in zip(result_objects, result_objects[1:]):
+        assert current.indexes == previous.next_indexes
+
+
+def test__plan_batches():
+    generator = MissingFakerMultiBatchGenerator.create(
+        min_rows=5,
+        max_rows=15,
+        num_columns=3,
+        num_epochs=2,
+        batches_per_epoch=3,
+    )
+    batch_plans = generator.plan_batches()
+
+    assert [(p.epoch_index, p.batch_index) for p in batch_plans] == [
+        (0, 0),
+        (0, 1),
+        (0, 2),
+        (1, 0),
+        (1, 1),
+        (1, 2),
+    ]
+    assert len({p.seed for p in batch_plans}) == 6
+
+    # Each batch's indexes pick up where the previous batch's rows left off
+    for previous, current in zip(batch_plans, batch_plans[1:]):
+        assert current.indexes == previous.indexes.advance(previous.num_rows)
+
+
+def test__parallel_iter_batches_does_not_depend_on_n_jobs():
+    generator = MissingFakerMultiBatchGenerator.create(
+        min_rows=5,
+        max_rows=15,
+        num_columns=3,
+        num_epochs=2,
+        batches_per_epoch=3,
+        include_primary_key=True,
+    )
+    # Avoid faker types that embed the current time (e.g. tar, zip), which can't be reproduced
+    for epoch_generator in generator.epochs:
+        for (
+            column_generator
+        ) in epoch_generator.missing_faker_dataframe_generator.column_generators:
+            column_generator.faker_type = "name"
+    next_indexes = Indexes.create()
+
+    random.seed(1)
+    in_process = list(generator.iter_batches(next_indexes=next_indexes, n_jobs=1))
+
+    random.seed(1)
+    parallel = list(generator.iter_batches(next_indexes=next_indexes, n_jobs=2))
+
+    assert [(r.epoch_index, r.batch_index) for r in parallel] == [
+        (r.epoch_index, r.batch_index) for r in in_process
+    ]
+    for expected, result_object in zip(in_process, parallel):
+        assert result_object.indexes == expected.indexes
+        assert result_object.next_indexes == expected.next_indexes
+        pd.testing.assert_frame_equal(result_object.dataframe, expected.dataframe)
+
+    # Each batch picks up where the previous one left off, and primary keys stay continuous
+    for previous, current in zip(parallel, parallel[1:]):
+        assert current.indexes == previous.next_indexes
+
+    df = pd.concat([r.dataframe for r in parallel], ignore_index=True)
+    start = next_indexes.primary_key
+    assert (df["column_primary_key"] == [str(start + x) for x in range(len(df))]).all()
+
+
+def test__iter_batches__with_a_seed():
+    generator = MissingFakerMultiBatchGenerator.create(
+        min_rows=5,
+        max_rows=15,
+        num_columns=3,
+        num_epochs=2,
+        batches_per_epoch=2,
+        include_primary_key=True,
+    )
+    for epoch_generator in generator.epochs:
+        for (
+            column_generator
+        ) in epoch_generator.missing_faker_dataframe_generator.column_generators:
+            column_generator.faker_type = "name"
+
+    # With a seed, the starting indexes are drawn from the seed too
+    expected_df = generator.generate(seed=7)
+
+    random.seed(1)
+    pd.testing.assert_frame_equal(generator.generate(seed=7), expected_df)
+    pd.testing.assert_frame_equal(generator.generate(seed=7, n_jobs=2), expected_df)
@@ -4,8 +4,14 @@ import datetime
 import pytest
 import random
 
+import numpy as np
 
+
+from did_you_miss_me.generators.dataframe import (
+    MissingFakerDataframeGenerator,
+)
 from did_you_miss_me.generators.timestamp import (
+    SEEDED_END_TIME,
     TimestampMultiColumnGenerator,
     TimestampFormat,
 )
@@ -24,6 +30,17 @@ def test__timestamp_multi_column_generator():
     print(values)
 
 
+def test__timestamp_multi_column_generator__end_time_with_a_seed():
+    now = datetime.datetime.now().timestamp()
+    assert abs(TimestampMultiColumnGenerator.create().end_time - now) < 60
+
+    # With a seed, the default end_time doesn't depend on the current time
+    assert TimestampMultiColumnGenerator.create(seed=1).end_time == SEEDED_END_TIME
+    generator = MissingFakerDataframeGenerator.create(include_timestamps=True, seed=1)
+    timestamp_generator = generator.timestamp_and_id_widget.timestamp_column_generator
+    assert timestamp_generator.end_time == SEEDED_END_TIME
+
+
 def test__timestamp_multi_column_generator__with_unix_epoch_format():
     generator = TimestampMultiColumnGenerator.create(
         timestamp_format=TimestampFormat.UNIX_EPOCH,
@@ -35,11 +52,11 @@ def test__timestamp_multi_column_generator__with_unix_epoch_format():
     )
     print(values["column_timestamp"])
     assert list(values["column_timestamp"]) == [
-        1672689973,
-        1673421827,
-        1673740981,
-        1674754100,
-        1673585221,
+        1672610455,
+        1673440676,
+        1675073362,
+        1674172206,
+        1673860245,
     ]
 
 
@@ -54,11 +71,11 @@ def test__timestamp_multi_column_generator__with_iso_8601_format():
     )
     print(values["column_timestamp"])
     assert [str(x) for x in list(values["column_timestamp"])] == [
-        "2023-01-02 13:06:13",
-        "2023-01-11 00:23:47",
-        "2023-01-14 17:03:01",
-        "2023-01-26 10:28:20",
-        "2023-01-12 21:47:01",
+        "2023-01-01 15:00:55",
+        "2023-01-11 05:37:56",
+        "2023-01-30 03:09:22",
+        "2023-01-19 16:50:06",
+        "2023-01-16 02:10:45",
     ]
 
 
@@ -73,11 +90,11 @@ def test__timestamp_multi_column_generator__with_single_column_timestamp_format(
     )
     print(values["column_timestamp"])
     assert list(values["column_timestamp"]) == [
-        "2023-01-02 13:06:13",
-        "2023-01-11 00:23:47",
-        "2023-01-14 17:03:01",
-        "2023-01-26 10:28:20",
-        "2023-01-12 21:47:01",
+        "2023-01-01 15:00:55",
+        "2023-01-11 05:37:56",
+        "2023-01-30 03:09:22",
+        "2023-01-19 16:50:06",
+        "2023-01-16 02:10:45",
     ]
 
 
@@ -92,19 +109,19 @@ def test__timestamp_multi_column_generator__with_multi_column_timestamp_format()
     )
     print(values["column_date"])
     assert [str(x) for x in list(values["column_date"])] == [
-        "2023-01-02",
+        "2023-01-01",
         "2023-01-11",
-        "2023-01-14",
-        "2023-01-26",
-        "2023-01-12",
+        "2023-01-30",
+        "2023-01-19",
+        "2023-01-16",
     ]
     print(values["column_time"])
     assert [str(x) for x in list(values["column_time"])] == [
-        "13:06:13",
-        "00:23:47",
-        "17:03:01",
-        "10:28:20",
-        "21:47:01",
+        "15:00:55",
+        "05:37:56",
+        "03:09:22",
+        "16:50:06",
+        "02:10:45",
     ]
 
 
@@ -119,11 +136,11 @@ def test__timestamp_multi_column_generator__with_single_column_date_format():
     )
     print(values["column_date"])
     assert [str(x) for x in list(values["column_date"])] == [
-        "2023-01-02",
+        "2023-01-01",
         "2023-01-11",
-        "2023-01-14",
-        "2023-01-26",
-        "2023-01-12",
+        "2023-01-30",
+        "2023-01-19",
+        "2023-01-16",
     ]
 
 
@@ -154,11 +171,11 @@ def test__timestamp_multi_column_generator__with_multi_column_date_format():
     ]
     print(values["column_day"])
     assert list(values["column_day"]) == [
-        2,
+        1,
         11,
-        14,
-        26,
-        12,
+        30,
+        19,
+        16,
     ]
 
 
@@ -174,10 +191,90 @@ def test__partial_sort():
         TimestampMultiColumnGenerator._partial_sort(list_, 0.0)
     )
     print(partially_sorted_list)
-    assert partially_sorted_list == [8, 1, 7, 2, 4, 3, 5, 0, 9, 6]
+    assert partially_sorted_list == [9, 7, 8, 3, 6, 2, 1, 4, 0, 5]
 
     partially_sorted_list = list(
         TimestampMultiColumnGenerator._partial_sort(list_, 0.7)
     )
     print(partially_sorted_list)
-    assert partially_sorted_list == [1, 4, 2, 5, 6, 7, 8, 3, 9, 0]
+    assert partially_sorted_list == [1, 2, 3, 4, 7, 5, 6, 8, 9, 0]
+
+
+def _reference_partial_sort(list_, p):
+    """The original, list-based implementation of _partial_sort, kept as a reference."""
+
+    list_ = list(list_)
+    length = len(list_)
+    cutoff = int(length * p)
+
+    copied_list = list_.copy()
+    random.shuffle(copied_list)
+
+    sorted_list = sorted(copied_list[:cutoff])
+    random_list = copied_list[cutoff:]
+    random.shuffle(random_list)
+
+    source_list = [1 for _ in range(cutoff)] + [0 for _ in range(length - cutoff)]
+    random.shuffle(source_list)
+
+    partially_sorted_list = []
+    for source in source_list:
+        if source == 1:
+            partially_sorted_list.append(sorted_list.pop(0))
+        else:
+            partially_sorted_list.append(random_list.pop(0))
+
+    return partially_sorted_list
+
+
+def _sortedness_stats(values):
+    """Summary statistics of how sorted a permutation of range(len(values)) is."""
+
+    values = np.asarray(values)
+    ascending_pairs = np.mean(np.diff(values) > 0)
+    displacement = np.mean(np.abs(values - np.arange(len(values))))
+    return ascending_pairs, displacement
+
+
+@pytest.mark.parametrize("p", [0.0, 0.3, 0.7, 0.9, 1.0])
+def test__partial_sort__matches_reference_distribution(p):
+    num_trials = 200
+    list_ = list(range(200))
+
+    reference_stats = np.array(
+        [
+            _sortedness_stats(_reference_partial_sort(list_, p))
+            for _ in range(num_trials)
+        ]
+    )
+    stats = np.array(
+        [
+            _sortedness_stats(TimestampMultiColumnGenerator._partial_sort(list_, p))
+            for _ in range(num_trials)
+        ]
+    )
+
+    # The means of both statistics agree to within a few standard errors
+    standard_error = np.sqrt(
+        (reference_stats.var(axis=0) + stats.var(axis=0)) / num_trials
+    )
+    difference = np.abs(reference_stats.mean(axis=0) - stats.mean(axis=0))
+    assert (difference <= 4 * standard_error + 1e-9).all()
+
+    # And partially sorting never adds or drops values
+    assert sorted(TimestampMultiColumnGenerator._partial_sort(list_, p)) == list_
+
+
+def test__to_local_datetimes__matches_fromtimestamp():
+    # Cover several years, so that any daylight saving time transitions are included
+    timestamps = np.random.default_rng(40).integers(
+        int(datetime.datetime(2020, 1, 1).timestamp()),
+        int(datetime.datetime(2024, 1, 1).timestamp()),
+        size=5000,
+    )
+
+    datetimes = TimestampMultiColumnGenerator._to_local_datetimes(timestamps)
+
+    assert datetimes.tolist() == [
+        datetime.datetime.fromtimestamp(x) for x in timestamps.tolist()
+    ]
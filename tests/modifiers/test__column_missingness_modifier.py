@@ -51,8 +51,109 @@ def test__missify_series_from_plan():
     new_series = column_modifier.modify(
         series=series,
     )
-    assert new_series.isna().sum() == 47  # About 50, but not exactly 50
+    assert new_series.isna().sum() == 55  # About 50, but not exactly 50
     assert new_series.shape == series.shape
 
     # Any values that are not null are the same as the original series
     assert (new_series[new_series.notnull()] == series[new_series.notnull()]).all()
+
+
+def test__modify__is_reproducible_for_a_fixed_seed():
+    series = pd.Series(range(1000))
+    column_modifier = ColumnMissingnessModifier.create(
+        missingness_type=ColumnMissingnessType.PROPORTIONAL,
+        missingness_params=ProportionalColumnMissingnessParams(
+            proportion=0.3,
+        ),
+    )
+
+    random.seed(7)
+    first = column_modifier.modify(series)
+    random.seed(7)
+    second = column_modifier.modify(series)
+
+    assert first.isna().equals(second.isna())
+
+
+def test__modify__writes_nulls_that_fit_the_dtype():
+    index = pd.RangeIndex(10, 20)
+    column_modifier = ColumnMissingnessModifier.create(
+        missingness_type=ColumnMissingnessType.ALWAYS,
+    )
+
+    float_series = column_modifier.modify(
+        pd.Series(range(10), index=index, dtype=float)
+    )
+    assert float_series.dtype == float
+    assert float_series.isna().all()
+    assert float_series.index.equals(index)
+
+    original_datetime_series = pd.Series(
+        pd.date_range("2023-01-01", periods=10), index=index
+    )
+    datetime_series = column_modifier.modify(original_datetime_series)
+    assert datetime_series.dtype == original_datetime_series.dtype
+    assert datetime_series.isna().all()
+
+    object_series = column_modifier.modify(pd.Series([[i] for i in range(10)]))
+    assert object_series.dtype == object
+    assert object_series.tolist() == [None] * 10
+
+
+def test__modify__with_a_seed():
+    modifier = ColumnMissingnessModifier.create(
+        missingness_type="PROPORTIONAL",
+        seed=1,
+    )
+    series = pd.Series(range(100))
+
+    state = random.getstate()
+    modified_series = modifier.modify(series, seed=2)
+    assert random.getstate() == state
+
+    pd.testing.assert_series_equal(modifier.modify(series, seed=2), modified_series)
+    assert not modifier.modify(series, seed=3).equals(modified_series)
+
+
+@pytest.mark.parametrize(
+    "values, dtype, expected_dtype",
+    [
+        (list(range(10)), "int64", "Int64"),
+        ([i / 2 for i in range(10)], "float64", "Float64"),
+        ([i % 2 == 0 for i in range(10)], "bool", "boolean"),
+        ([str(i) for i in range(10)], object, "string"),
+        ([[i] for i in range(10)], object, object),
+    ],
+)
+def test__modify__with_a_nullable_dtype_backend(values, dtype, expected_dtype):
+    index = pd.RangeIndex(10, 20)
+    series = pd.Series(values, index=index, dtype=dtype, name="x")
+
+    for missingness_type in ["ALWAYS", "NEVER", "PROPORTIONAL"]:
+        column_modifier = ColumnMissingnessModifier.create(
+            missingness_type=missingness_type,
+            dtype_backend="numpy_nullable",
+        )
+
+        new_series = column_modifier.modify(series)
+
+        # The dtype is the same whether or not any values are missing
+        assert new_series.dtype == expected_dtype
+        assert new_series.index.equals(index)
+        assert new_series.name == "x"
+        assert new_series.isna().all() == (missingness_type == "ALWAYS")
+
+
+def test__modify__with_the_pyarrow_dtype_backend():
+    pytest.importorskip("pyarrow")
+
+    column_modifier = ColumnMissingnessModifier.create(
+        missingness_type="PROPORTIONAL",
+        missingness_params=ProportionalColumnMissingnessParams(proportion=0.5),
+        dtype_backend="pyarrow",
+    )
+
+    new_series = column_modifier.modify(pd.Series(range(100)))
+
+    assert str(new_series.dtype) == "int64[pyarrow]"
+    assert 0 < new_series.isna().sum() < 100
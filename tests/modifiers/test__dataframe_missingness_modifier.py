@@ -0,0 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from did_you_miss_me.modifiers.missingness import (
+    ColumnMissingnessModifier,
+    ColumnMissingnessType,
+    DataframeMissingnessModifier,
+    ProportionalColumnMissingnessParams,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_random_seed():
+    random.seed(1)
+
+
+def _create_df(num_rows: int = 1_000) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "floats": np.arange(num_rows) / 2,
+            "more_floats": np.arange(num_rows) / 4,
+            "ints": range(num_rows),
+            "strs": [str(i) for i in range(num_rows)],
+            "objects": pd.Series([str(i) for i in range(num_rows)], dtype=object),
+            "timestamps": pd.date_range("2020-01-01", periods=num_rows, freq="s"),
+        }
+    )
+
+
+@pytest.fixture
+def modifier():
+    return DataframeMissingnessModifier(
+        column_modifiers=[
+            ColumnMissingnessModifier(
+                missingness_type=ColumnMissingnessType.PROPORTIONAL,
+                missingness_params=ProportionalColumnMissingnessParams(proportion=0.3),
+            )
+            for i in range(5)
+        ]
+        + [ColumnMissingnessModifier(missingness_type=ColumnMissingnessType.NEVER)],
+    )
+
+
+def test__create():
+    modifier = DataframeMissingnessModifier.create(num_columns=4)
+    assert modifier.num_columns == 4
+
+    column_modifiers = modifier.column_modifiers[:2]
+    modifier = DataframeMissingnessModifier.create(column_generators=column_modifiers)
+    assert modifier.column_modifiers == column_modifiers
+
+
+def test__modify(modifier):
+    df = _create_df()
+
+    missing_df = modifier.modify(df)
+
+    assert missing_df.shape == df.shape
+    assert 0.25 < missing_df["floats"].isna().mean() < 0.35
+    assert missing_df["ints"].dtype == np.float64
+    assert missing_df["timestamps"].isna().sum() == 0
+
+    # The original dataframe is untouched
+    pd.testing.assert_frame_equal(df, _create_df())
+
+    # Columns without missingness aren't copied
+    assert np.shares_memory(
+        missing_df["timestamps"].to_numpy(), df["timestamps"].to_numpy()
+    )
+
+
+def test__modify__inplace(modifier):
+    df = _create_df()
+    floats = df["floats"].to_numpy()
+
+    missing_df = modifier.modify(df, inplace=True, seed=1)
+
+    assert missing_df is df
+    # Nulls are written into the existing float column, rather than a copy of it
+    assert np.shares_memory(df["floats"].to_numpy(), floats)
+    pd.testing.assert_frame_equal(missing_df, modifier.modify(_create_df(), seed=1))
+
+
+def test__modify__wrong_number_of_columns(modifier):
+    with pytest.raises(ValueError):
+        modifier.modify(_create_df().iloc[:, :3])
+
+
+def test__modify__is_reproducible_in_parallel(modifier):
+    df = _create_df()
+
+    missing_df = modifier.modify(df, seed=1)
+
+    pd.testing.assert_frame_equal(modifier.modify(df, seed=1), missing_df)
+    pd.testing.assert_frame_equal(modifier.modify(df, n_jobs=2, seed=1), missing_df)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        pd.testing.assert_frame_equal(
+            modifier.modify(df, executor=executor, seed=1), missing_df
+        )
+    pd.testing.assert_frame_equal(
+        modifier.modify(_create_df(), inplace=True, n_jobs=2, seed=1), missing_df
+    )
@@ -2,13 +2,18 @@
 
 import random
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from did_you_miss_me.generators.column import (
     FakerColumnGenerator,
 )
+from did_you_miss_me.modifiers import fat_fingers
 from did_you_miss_me.modifiers.fat_fingers import (
+    _ERROR_FUNCTIONS,
     ColumnFatFingersModifier,
+    _slice_strings_in_python,
 )
 
 # @pytest.fixture(autouse=True)
@@ -25,37 +30,24 @@ from did_you_miss_me.modifiers.fat_fingers import (
 
 
 def test___modify_values():
-    """Tests that the __modify_values method works as expected."""
+    """Tests that each error function works as expected."""
 
-    test_string = "abcd"
+    test_values = np.array(["abcd"] * 10, dtype=np.dtypes.StringDType())
 
     # Print out some examples, for manual inspection.
-    error_types = [
-        "missing_chars",
-        "extra_chars",
-        "transposed_chars",
-        "mistaken_chars",
-        "repeated_chars",
-    ]
-
-    for error_type in error_types:
+    for error_type, error_function in _ERROR_FUNCTIONS.items():
         print(f"##### {error_type} #####")
-        for i in range(10):
-            print(ColumnFatFingersModifier._modify_value(test_string, error_type))
-
-    random.seed(1)
-    assert ColumnFatFingersModifier._modify_value(test_string, "missing_chars") == "acd"
-    assert ColumnFatFingersModifier._modify_value(test_string, "extra_chars") == "cabcd"
-    assert (
-        ColumnFatFingersModifier._modify_value(test_string, "transposed_chars")
-        == "bacd"
-    )
-    assert (
-        ColumnFatFingersModifier._modify_value(test_string, "mistaken_chars") == "abc3"
-    )
-    assert (
-        ColumnFatFingersModifier._modify_value(test_string, "repeated_chars") == "abcdd"
-    )
+        print(error_function(test_values, np.random.default_rng()).tolist())
+
+    def modify_value(error_type):
+        values = np.array(["abcd"], dtype=np.dtypes.StringDType())
+        return _ERROR_FUNCTIONS[error_type](values, np.random.default_rng(1))[0]
+
+    assert modify_value("missing_chars") == "abd"
+    assert modify_value("extra_chars") == "abdcd"
+    assert modify_value("transposed_chars") == "acbd"
+    assert modify_value("mistaken_chars") == "ab2d"
+    assert modify_value("repeated_chars") == "abccd"
 
 
 def test___modify_column():
@@ -79,3 +71,102 @@ def test___modify_column():
     modified_numbers = modifier.modify(numbers)
     print(numbers)
     print(modified_numbers)
+
+
+@pytest.mark.parametrize(
+    "error_type, length_change",
+    [
+        ("missing_chars", -1),
+        ("extra_chars", 1),
+        ("transposed_chars", 0),
+        ("mistaken_chars", 0),
+        ("repeated_chars", 1),
+    ],
+)
+def test___error_functions(error_type, length_change):
+    values = np.array(["abcdefgh", "xy", "z"] * 20, dtype=np.dtypes.StringDType())
+
+    modified_values = _ERROR_FUNCTIONS[error_type](values, np.random.default_rng(1))
+
+    for value, modified_value in zip(values.tolist(), modified_values.tolist()):
+        if error_type == "transposed_chars":
+            # A single character can't be transposed
+            assert sorted(modified_value) == sorted(value)
+        else:
+            assert len(modified_value) == len(value) + length_change
+
+        if error_type == "repeated_chars":
+            assert set(modified_value) == set(value)
+
+    assert (modified_values != values).any()
+
+
+def test___modify_column__in_bulk():
+    modifier = ColumnFatFingersModifier.create(
+        error_rate=0.2,
+    )
+    series = pd.Series(
+        [f"value_{i}" for i in range(10_000)] + [None, "", 3], dtype=object
+    )
+
+    modified_series = modifier.modify(series, seed=1)
+
+    pd.testing.assert_index_equal(modified_series.index, series.index)
+    assert 0.15 < (modified_series != series).mean() < 0.25
+    # Values that aren't non-empty strings are left alone
+    assert modified_series.iloc[-3:].tolist() == [None, "", 3]
+    pd.testing.assert_series_equal(modifier.modify(series, seed=1), modified_series)
+
+
+def test___modify_column__keeps_the_dtype():
+    modifier = ColumnFatFingersModifier.create(
+        error_rate=0.5,
+    )
+    series = pd.Series(["abc", "defg", None] * 10, dtype="string")
+
+    modified_series = modifier.modify(series)
+
+    assert modified_series.dtype == series.dtype
+    assert modified_series.isna().sum() == 10
+    pd.testing.assert_series_equal(
+        modifier.modify(pd.Series(range(5))), pd.Series(range(5))
+    )
+
+
+def test___slice_strings_in_python():
+    values = np.array(["abcdefgh", "xy", "z", ""], dtype=np.dtypes.StringDType())
+    starts = np.array([1, 0, 1, 0])
+    stops = np.array([3, 5, 1, 2])
+
+    assert _slice_strings_in_python(values, starts, stops).tolist() == [
+        "bc",
+        "xy",
+        "",
+        "",
+    ]
+    assert _slice_strings_in_python(values, 0, starts).tolist() == ["a", "", "z", ""]
+    assert _slice_strings_in_python(values, starts, None).tolist() == [
+        "bcdefgh",
+        "xy",
+        "",
+        "",
+    ]
+    if hasattr(np.strings, "slice"):
+        assert (
+            _slice_strings_in_python(values, starts, stops).tolist()
+            == np.strings.slice(values, starts, stops).tolist()
+        )
+
+
+def test___modify_column__without_numpy_string_slicing(monkeypatch):
+    """The fallback for NumPy < 2.3 adds the same typos."""
+
+    modifier = ColumnFatFingersModifier.create(
+        error_rate=0.5,
+    )
+    series = pd.Series([f"value_{i}" for i in range(1_000)], dtype=object)
+    modified_series = modifier.modify(series, seed=1)
+
+    monkeypatch.setattr(fat_fingers, "_slice_strings", _slice_strings_in_python)
+
+    pd.testing.assert_series_equal(modifier.modify(series, seed=1), modified_series)
@@ -0,0 +1,103 @@
+from concurrent.futures import ProcessPoolExecutor
+import random
+
+import pandas as pd
+import pytest
+
+from did_you_miss_me.modifiers.fat_fingers import (
+    ColumnFatFingersModifier,
+    DataframeFatFingersModifier,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_random_seed():
+    random.seed(40)
+
+
+@pytest.fixture
+def df():
+    num_rows = 2_000
+    return pd.DataFrame(
+        {
+            "names": [f"name_{i}" for i in range(num_rows)],
+            "numbers": range(num_rows),
+            "codes": pd.Series([f"code_{i}" for i in range(num_rows)], dtype="string"),
+            "floats": [i / 2 for i in range(num_rows)],
+        }
+    )
+
+
+def test__create():
+    modifier = DataframeFatFingersModifier.create(num_columns=5)
+    assert modifier.num_columns == 5
+    assert all(m.error_rate == 0.01 for m in modifier.column_modifiers)
+
+    modifier = DataframeFatFingersModifier.create(error_rates=[0.1, 0.0, 0.5])
+    assert [m.error_rate for m in modifier.column_modifiers] == [0.1, 0.0, 0.5]
+
+    modifier = DataframeFatFingersModifier.create(num_columns=3, error_rates=0.2)
+    assert [m.error_rate for m in modifier.column_modifiers] == [0.2] * 3
+
+
+def test__modify(df):
+    modifier = DataframeFatFingersModifier.create(error_rates=[0.2, 0.2, 0.0, 0.2])
+
+    modified_df = modifier.modify(df)
+
+    # Non-text columns are skipped, and so is a column with an error rate of 0
+    unchanged_columns = ["numbers", "codes", "floats"]
+    pd.testing.assert_frame_equal(modified_df[unchanged_columns], df[unchanged_columns])
+    assert 0.15 < (modified_df["names"] != df["names"]).mean() < 0.25
+    assert modified_df.dtypes.equals(df.dtypes)
+
+    # The original dataframe isn't modified
+    assert df["names"].tolist() == [f"name_{i}" for i in range(len(df))]
+
+
+def test__modify__inplace(df):
+    modifier = DataframeFatFingersModifier.create(num_columns=4, error_rates=0.2)
+    original_names = df["names"].copy()
+
+    modified_df = modifier.modify(df, inplace=True)
+
+    assert modified_df is df
+    assert (df["names"] != original_names).any()
+
+
+def test__modify__wrong_number_of_columns(df):
+    modifier = DataframeFatFingersModifier.create(num_columns=3)
+
+    with pytest.raises(ValueError):
+        modifier.modify(df)
+
+
+def test__modify__matches_column_modifiers(df):
+    """Each column's typos don't depend on the other columns' dtypes or error rates."""
+
+    modifier = DataframeFatFingersModifier.create(error_rates=[0.2, 0.2, 0.3, 0.2])
+    other_modifier = DataframeFatFingersModifier(
+        column_modifiers=[
+            ColumnFatFingersModifier.create(error_rate=0.0),
+            *modifier.column_modifiers[1:],
+        ],
+    )
+
+    modified_df = modifier.modify(df, seed=1)
+    other_modified_df = other_modifier.modify(df, seed=1)
+
+    pd.testing.assert_series_equal(modified_df["codes"], other_modified_df["codes"])
+
+
+def test__modify__seed_and_executor(df):
+    modifier = DataframeFatFingersModifier.create(num_columns=4, error_rates=0.2)
+
+    modified_df = modifier.modify(df, seed=1)
+    pd.testing.assert_frame_equal(modifier.modify(df, seed=1), modified_df)
+
+    threaded_df = modifier.modify(df, n_jobs=2, seed=1)
+    pd.testing.assert_frame_equal(threaded_df, modified_df)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        processed_df = modifier.modify(df, executor=executor, seed=1)
+    pd.testing.assert_frame_equal(processed_df, modified_df)
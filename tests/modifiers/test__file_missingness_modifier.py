@@ -0,0 +1,180 @@
+import pytest
+import random
+
+import numpy as np
+import pandas as pd
+
+import did_you_miss_me as dymm
+from did_you_miss_me.modifiers.files import (
+    FileMissingnessModifier,
+    get_file_format,
+    read_column_names,
+)
+from did_you_miss_me.modifiers.missingness import (
+    ColumnMissingnessModifier,
+    ColumnMissingnessType,
+    ProportionalColumnMissingnessParams,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_random_seed():
+    random.seed(40)
+
+
+def _create_df(num_rows: int = 1_000) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ints": range(num_rows),
+            "floats": np.arange(num_rows) / 2,
+            "strs": [f"value_{i}" for i in range(num_rows)],
+            "bools": [i % 3 == 0 for i in range(num_rows)],
+        }
+    )
+
+
+def _create_modifier(**kwargs) -> FileMissingnessModifier:
+    return FileMissingnessModifier.create(
+        column_modifiers=[
+            ColumnMissingnessModifier(
+                missingness_type=ColumnMissingnessType.PROPORTIONAL,
+                missingness_params=ProportionalColumnMissingnessParams(proportion=0.3),
+            ),
+            ColumnMissingnessModifier(missingness_type=ColumnMissingnessType.NEVER),
+            ColumnMissingnessModifier(missingness_type=ColumnMissingnessType.ALWAYS),
+            ColumnMissingnessModifier(
+                missingness_type=ColumnMissingnessType.PROPORTIONAL,
+                missingness_params=ProportionalColumnMissingnessParams(proportion=0.5),
+            ),
+        ],
+        **kwargs,
+    )
+
+
+def test__get_file_format():
+    assert get_file_format("data.csv") == "csv"
+    assert get_file_format("data.CSV.gz") == "csv"
+    assert get_file_format("data/part-0.parquet") == "parquet"
+
+    with pytest.raises(ValueError):
+        get_file_format("data.json")
+
+
+def test__modify__csv(tmp_path):
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output.csv"
+    df = _create_df()
+    df.to_csv(input_path, index=False)
+
+    result_object = _create_modifier(chunk_size=300).modify(input_path, output_path)
+
+    assert (result_object.num_rows, result_object.num_chunks) == (1_000, 4)
+
+    missing_df = pd.read_csv(output_path)
+    assert missing_df.shape == df.shape
+    assert 0.25 < missing_df["ints"].isna().mean() < 0.35
+    pd.testing.assert_series_equal(missing_df["floats"], df["floats"])
+    assert missing_df["strs"].isna().all()
+
+    # Integers are written as integers, even in chunks with missing values
+    ints = pd.read_csv(output_path, dtype=str)["ints"].dropna()
+    assert not ints.str.contains(".", regex=False).any()
+    not_null = missing_df["ints"].notna()
+    assert (missing_df["ints"][not_null] == df["ints"][not_null]).all()
+
+
+def test__modify__csv__blanks_in_a_later_chunk(tmp_path):
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output.csv"
+    input_path.write_text("a,b\n1,0.5\n2,1.5\n,2.5\n4,3.0\n")
+    modifier = FileMissingnessModifier.create(
+        column_modifiers=[
+            ColumnMissingnessModifier(missingness_type=ColumnMissingnessType.NEVER),
+            ColumnMissingnessModifier(missingness_type=ColumnMissingnessType.NEVER),
+        ],
+        chunk_size=2,
+    )
+
+    modifier.modify(input_path, output_path)
+
+    # The integer column is written as integers in every chunk, and floats stay floats
+    assert output_path.read_text() == "a,b\n1,0.5\n2,1.5\n,2.5\n4,3.0\n"
+
+
+def test__modify__csv__is_reproducible(tmp_path):
+    input_path = tmp_path / "input.csv"
+    _create_df().to_csv(input_path, index=False)
+    modifier = _create_modifier(chunk_size=300)
+
+    modifier.modify(input_path, tmp_path / "output_0.csv", seed=1)
+    modifier.modify(input_path, tmp_path / "output_1.csv", seed=1)
+
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / "output_0.csv"), pd.read_csv(tmp_path / "output_1.csv")
+    )
+
+
+def test__modify__parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    input_path = tmp_path / "input.parquet"
+    output_path = tmp_path / "output.parquet"
+    df = _create_df()
+    df.to_parquet(input_path, index=False)
+
+    result_object = _create_modifier(chunk_size=300).modify(input_path, output_path)
+
+    assert (result_object.num_rows, result_object.num_chunks) == (1_000, 4)
+
+    # The output has the input's schema, with one row group per chunk
+    parquet_file = pq.ParquetFile(output_path)
+    assert parquet_file.schema_arrow.equals(pq.read_schema(input_path))
+    assert parquet_file.num_row_groups == 4
+
+    table = parquet_file.read()
+    assert 0.25 < table["ints"].null_count / len(table) < 0.35
+    assert table["floats"].null_count == 0
+    assert table["strs"].null_count == len(table)
+    assert 0.45 < table["bools"].null_count / len(table) < 0.55
+
+
+def test__modify__parquet__with_an_index(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    input_path = tmp_path / "input.parquet"
+    output_path = tmp_path / "output.parquet"
+    df = _create_df(num_rows=10).set_index(pd.Index(list("qwertyuiop"), name="key"))
+    df.to_parquet(input_path)
+
+    assert read_column_names(input_path) == ["ints", "floats", "strs", "bools"]
+
+    result_object = dymm.missify_file(input_path, output_path, chunk_size=4, seed=1)
+
+    assert (result_object.num_rows, result_object.num_chunks) == (10, 3)
+
+    # The index is written back as it was, and isn't missified
+    missing_df = pd.read_parquet(output_path)
+    pd.testing.assert_index_equal(missing_df.index, df.index)
+    assert missing_df.columns.tolist() == df.columns.tolist()
+
+
+def test__missify_file(tmp_path):
+    input_path = tmp_path / "input.csv"
+    _create_df().to_csv(input_path, index=False)
+
+    result_object = dymm.missify_file(
+        input_path, tmp_path / "output.csv", chunk_size=400, seed=2
+    )
+    dymm.missify_file(input_path, tmp_path / "output_1.csv", chunk_size=400, seed=2)
+
+    assert result_object.num_chunks == 3
+    assert read_column_names(tmp_path / "output.csv") == [
+        "ints",
+        "floats",
+        "strs",
+        "bools",
+    ]
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / "output.csv"), pd.read_csv(tmp_path / "output_1.csv")
+    )
@@ -0,0 +1,128 @@
+import pytest
+import random
+
+import numpy as np
+import pandas as pd
+
+pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq
+
+import did_you_miss_me as dymm
+from did_you_miss_me.generators.multibatch import (
+    MissingFakerMultiBatchGenerator,
+)
+from did_you_miss_me.sinks.parquet import (
+    ParquetSink,
+)
+from did_you_miss_me.sinks.schema import (
+    infer_schema_from_generator,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_random_seed():
+    random.seed(40)
+
+
+def _create_generator() -> MissingFakerMultiBatchGenerator:
+    return MissingFakerMultiBatchGenerator.create(
+        exact_rows=10,
+        num_columns=6,
+        num_epochs=2,
+        batches_per_epoch=3,
+        include_primary_key=True,
+        include_timestamps=True,
+    )
+
+
+def test__write__file_per_batch(tmp_path):
+    generator = _create_generator()
+    result_objects = list(generator.iter_batches())
+
+    sink = ParquetSink.create(root_path=tmp_path)
+    sink_result_object = sink.write(
+        iter(result_objects),
+        schema=infer_schema_from_generator(
+            generator.epochs[0].missing_faker_dataframe_generator
+        ),
+    )
+
+    assert sink_result_object.num_rows == 60
+    assert sink_result_object.num_batches == 6
+    assert sink_result_object.file_paths == [
+        str(
+            tmp_path
+            / f"epoch={r.epoch_index}"
+            / f"batch_id={r.indexes.batch_id}"
+            / "part-0.parquet"
+        )
+        for r in result_objects
+    ]
+
+    # Every batch has the same schema, and the partition keys come back as columns
+    df = pd.read_parquet(tmp_path)
+    assert len(df) == 60
+    assert set(df["epoch"].astype(int)) == {0, 1}
+    assert set(df["batch_id"].astype(int)) == {
+        r.indexes.batch_id for r in result_objects
+    }
+
+    expected_df = pd.concat([r.dataframe for r in result_objects], ignore_index=True)
+    df = df.sort_values(
+        "column_primary_key", key=lambda s: s.astype(int), ignore_index=True
+    )
+    for column in expected_df.columns:
+        assert df[column].isnull().sum() == expected_df[column].isnull().sum()
+
+
+def test__write__row_group_per_batch(tmp_path):
+    generator = _create_generator()
+
+    sink = ParquetSink.create(root_path=tmp_path, row_group_per_batch=True)
+    sink_result_object = sink.write(generator.iter_batches())
+
+    assert sink_result_object.file_paths == [
+        str(tmp_path / "epoch=0" / "part-0.parquet"),
+        str(tmp_path / "epoch=1" / "part-0.parquet"),
+    ]
+    for file_path in sink_result_object.file_paths:
+        parquet_file = pq.ParquetFile(file_path)
+        assert parquet_file.num_row_groups == 3
+        assert parquet_file.metadata.num_rows == 30
+
+
+def test__write__keeps_types_stable_across_batches(tmp_path):
+    generator = _create_generator()
+    result_objects = list(generator.iter_batches())
+    # Missing values can turn integer columns into floats, and leave a column with no values at all
+    result_objects[1].dataframe["column_primary_key"] = np.nan
+    result_objects[2].dataframe["column_primary_key"] = (
+        result_objects[2].dataframe["column_primary_key"].astype(float)
+    )
+
+    schema = infer_schema_from_generator(
+        generator.epochs[0].missing_faker_dataframe_generator
+    )
+    sink_result_object = ParquetSink.create(root_path=tmp_path).write(
+        result_objects, schema=schema
+    )
+
+    arrow_schemas = [
+        pq.read_schema(file_path) for file_path in sink_result_object.file_paths
+    ]
+    assert all(arrow_schema.equals(arrow_schemas[0]) for arrow_schema in arrow_schemas)
+
+
+def test__generate_multiple_batches_and_write_to_parquet(tmp_path):
+    result_object = dymm.generate_multiple_batches_and_write_to_parquet(
+        root_path=tmp_path,
+        exact_rows=10,
+        num_columns=12,
+        num_epochs=2,
+        batches_per_epoch=2,
+        include_primary_key=True,
+        include_foreign_keys=True,
+    )
+
+    assert result_object.num_rows == 40
+    assert len(pd.read_parquet(tmp_path)) == 40
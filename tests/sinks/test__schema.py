@@ -0,0 +1,63 @@
+import datetime
+import pytest
+import random
+
+import numpy as np
+import pandas as pd
+
+from did_you_miss_me.generators.dataframe import (
+    MissingFakerDataframeGenerator,
+)
+from did_you_miss_me.sinks.schema import (
+    infer_schema,
+    infer_schema_from_generator,
+)
+from did_you_miss_me.sinks.sql import (
+    infer_sql_schema_from_generator,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_random_seed():
+    random.seed(40)
+
+
+def test__infer_schema():
+    df = pd.DataFrame(
+        {
+            "int": [1, 2],
+            "float": [1.0, np.nan],
+            "bool": [True, False],
+            "timestamp": pd.to_datetime(["2020-01-01", "2020-01-02"]),
+            "str": ["a", "b"],
+            "bytes": [b"a", None],
+            "date": [datetime.date(2020, 1, 1), None],
+            "time": [datetime.time(1, 2), None],
+        }
+    )
+
+    assert [(c.name, c.column_type) for c in infer_schema(df)] == [
+        ("int", "integer"),
+        ("float", "float"),
+        ("bool", "boolean"),
+        ("timestamp", "timestamp"),
+        ("str", "string"),
+        ("bytes", "binary"),
+        ("date", "date"),
+        ("time", "time"),
+    ]
+
+
+def test__infer_schema_from_generator__matches_the_sql_schema():
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=4,
+        exact_rows=20,
+        include_primary_key=True,
+        include_timestamps=True,
+    )
+
+    schema = infer_schema_from_generator(generator)
+    sql_schema = infer_sql_schema_from_generator(generator)
+
+    assert [c.name for c in schema] == [c.name for c in sql_schema]
+    assert [c.name for c in schema] == list(generator.generate().dataframe.columns)
@@ -0,0 +1,255 @@
+import datetime
+import pytest
+import random
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from did_you_miss_me.generators.dataframe import (
+    MissingFakerDataframeGenerator,
+)
+from did_you_miss_me.generators.multibatch import (
+    MissingFakerMultiBatchGenerator,
+)
+from did_you_miss_me.generators.timestamp import (
+    TimestampFormat,
+    TimestampMultiColumnGenerator,
+)
+from did_you_miss_me.generators.timestamps_and_ids import (
+    Indexes,
+)
+from did_you_miss_me.sinks.sql import (
+    SqlColumn,
+    SqlSink,
+    infer_sql_schema,
+    infer_sql_schema_from_generator,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_random_seed():
+    random.seed(40)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "test.db")
+    yield conn
+    conn.close()
+
+
+def _get_batches():
+    return [
+        pd.DataFrame(
+            {
+                "id": [1, 2, 3],
+                "score": [0.5, np.nan, 1.5],
+                "name": ["a", None, "c"],
+            }
+        ),
+        pd.DataFrame(
+            {
+                "id": [4, 5],
+                "score": [2.5, 3.5],
+                "name": ["d", "e"],
+            }
+        ),
+    ]
+
+
+def test__infer_sql_schema():
+    df = pd.DataFrame(
+        {
+            "int": [1, 2],
+            "float": [1.0, np.nan],
+            "bool": [True, False],
+            "timestamp": pd.to_datetime(["2020-01-01", "2020-01-02"]),
+            "str": ["a", "b"],
+            "object_int": pd.Series([None, 3], dtype=object),
+            "bytes": [b"a", None],
+            "list": [[1, 2], [3]],
+            "date": [datetime.date(2020, 1, 1), None],
+            "category": pd.Series([1, 2], dtype="category"),
+            "nullable_int": pd.Series([1, None], dtype="Int64"),
+            "timestamp_tz": pd.to_datetime(["2020-01-01", "2020-01-02"]).tz_localize(
+                "UTC"
+            ),
+        }
+    )
+
+    assert [(c.name, c.sql_type) for c in infer_sql_schema(df)] == [
+        ("int", "INTEGER"),
+        ("float", "REAL"),
+        ("bool", "BOOLEAN"),
+        ("timestamp", "TIMESTAMP"),
+        ("str", "TEXT"),
+        ("object_int", "INTEGER"),
+        ("bytes", "BLOB"),
+        ("list", "TEXT"),
+        ("date", "DATE"),
+        ("category", "INTEGER"),
+        ("nullable_int", "INTEGER"),
+        ("timestamp_tz", "TIMESTAMP"),
+    ]
+
+
+def test__write(conn):
+    sink = SqlSink.create(conn=conn, table_name="my table", chunk_size=2)
+    result_object = sink.write(iter(_get_batches()))
+
+    assert result_object.num_rows == 5
+    assert result_object.num_batches == 2
+    assert result_object.rows_per_second > 0
+
+    rows = conn.execute('SELECT id, score, name FROM "my table" ORDER BY id').fetchall()
+    assert rows == [
+        (1, 0.5, "a"),
+        (2, None, None),
+        (3, 1.5, "c"),
+        (4, 2.5, "d"),
+        (5, 3.5, "e"),
+    ]
+
+
+def test__write__if_exists(conn):
+    SqlSink.create(conn=conn, table_name="my_table").write(_get_batches())
+
+    SqlSink.create(conn=conn, table_name="my_table", if_exists="append").write(
+        _get_batches()
+    )
+    assert conn.execute("SELECT COUNT(*) FROM my_table").fetchone() == (10,)
+
+    SqlSink.create(conn=conn, table_name="my_table", if_exists="replace").write(
+        _get_batches()
+    )
+    assert conn.execute("SELECT COUNT(*) FROM my_table").fetchone() == (5,)
+
+    with pytest.raises(sqlite3.OperationalError):
+        SqlSink.create(conn=conn, table_name="my_table", if_exists="fail").write(
+            _get_batches()
+        )
+
+    with pytest.raises(ValueError):
+        SqlSink.create(conn=conn, table_name="my_table", if_exists="overwrite")
+
+
+def test__write__rolls_back_a_failed_batch(conn):
+    batches = _get_batches()
+    # The second row of the second batch can't be stored as an INTEGER, so (with one row
+    # per chunk) inserting the batch fails after its first chunk has been sent
+    batches[1]["id"] = pd.Series([4, "x"], dtype=object)
+
+    with pytest.raises(ValueError):
+        SqlSink.create(conn=conn, table_name="my_table", chunk_size=1).write(batches)
+
+    assert conn.execute("SELECT COUNT(*) FROM my_table").fetchone() == (3,)
+
+
+def test__write__multibatch_data(conn):
+    generator = MissingFakerMultiBatchGenerator.create(
+        exact_rows=20,
+        num_columns=12,
+        num_epochs=2,
+        batches_per_epoch=3,
+        include_primary_key=True,
+        include_foreign_keys=True,
+        include_timestamps=True,
+    )
+    result_objects = list(generator.iter_batches())
+
+    sink = SqlSink.create(conn=conn, table_name="my_table")
+    sink.write(result_object.dataframe for result_object in result_objects)
+
+    df = pd.concat([r.dataframe for r in result_objects], ignore_index=True)
+    assert conn.execute("SELECT COUNT(*) FROM my_table").fetchone() == (len(df),)
+
+    # Nulls in the data are stored as NULLs
+    for column in df.columns:
+        num_nulls = conn.execute(
+            f'SELECT COUNT(*) FROM my_table WHERE "{column}" IS NULL'
+        ).fetchone()[0]
+        assert num_nulls == df[column].isnull().sum()
+
+
+def test__infer_sql_schema_from_generator():
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=4,
+        exact_rows=20,
+        include_primary_key=True,
+        include_timestamps=True,
+    )
+    faker_types = ["pyint", "pyfloat", "boolean", "date_object"]
+    for column_generator, faker_type in zip(generator.column_generators, faker_types):
+        column_generator.faker_type = faker_type
+        # All-null columns don't carry any type information in the data
+        column_generator.missingness_type = "ALWAYS"
+    generator.timestamp_and_id_widget.timestamp_column_generator = (
+        TimestampMultiColumnGenerator.create(
+            timestamp_format=TimestampFormat.MULTI_COLUMN_TIMESTAMP,
+        )
+    )
+
+    schema = infer_sql_schema_from_generator(generator)
+
+    df = generator.generate().dataframe
+    assert [c.name for c in schema] == list(df.columns)
+    assert [c.sql_type for c in schema] == [
+        (
+            "INTEGER"
+            if generator.timestamp_and_id_widget.primary_key_column_generator.data_type
+            == "int"
+            else "TEXT"
+        ),
+        "DATE",
+        "TIME",
+        "INTEGER",
+        "REAL",
+        "BOOLEAN",
+        "DATE",
+    ]
+
+
+def test__infer_sql_schema_from_generator__does_not_change_generated_data():
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=4,
+        exact_rows=20,
+    )
+    for column_generator in generator.column_generators:
+        column_generator.faker_type = "name"
+    next_indexes = Indexes.create()
+
+    random.seed(1)
+    expected_df = generator.generate(next_indexes=next_indexes, n_jobs=1).dataframe
+
+    infer_sql_schema_from_generator(generator)
+
+    random.seed(1)
+    df = generator.generate(next_indexes=next_indexes, n_jobs=1).dataframe
+
+    pd.testing.assert_frame_equal(df, expected_df)
+
+
+def test__write__with_schema_keeps_types_stable(conn):
+    schema = [
+        SqlColumn(name="id", sql_type="INTEGER"),
+        SqlColumn(name="score", sql_type="REAL"),
+        SqlColumn(name="name", sql_type="TEXT"),
+    ]
+    batches = _get_batches()
+    # Missing values turn integer columns into floats, and can leave a column with no values at all
+    batches[0]["id"] = [1.0, np.nan, 3.0]
+    batches[0]["name"] = None
+
+    SqlSink.create(conn=conn, table_name="my_table").write(batches, schema=schema)
+
+    assert conn.execute(
+        "SELECT typeof(id), typeof(name) FROM my_table WHERE id = 4"
+    ).fetchone() == ("integer", "text")
+    assert conn.execute(
+        "SELECT name, type FROM pragma_table_info('my_table')"
+    ).fetchall() == [
+        ("id", "INTEGER"),
+        ("score", "REAL"),
+        ("name", "TEXT"),
+    ]
@@ -1,8 +1,9 @@
-""" Tests for top-level API methods """
+"""Tests for top-level API methods"""
 
 import pytest
 import random
 
+import numpy as np
 import pandas as pd
 
 import did_you_miss_me as dymm
@@ -75,6 +76,14 @@ def test__missify_dataframe():
     assert (df.x[missing_df.x.notnull()] == missing_df.x[missing_df.x.notnull()]).all()
 
 
+def test__missify_dataframe__with_a_seed():
+    df = pd.DataFrame({"x": range(100), "y": range(100)})
+
+    missing_df = dymm.missify_dataframe(df, seed=4)
+
+    pd.testing.assert_frame_equal(dymm.missify_dataframe(df, seed=4), missing_df)
+
+
 def test__generate_multibatch_dataframe():
     dymm.generate_multibatch_dataframe(
         num_columns=2,
@@ -83,6 +92,8 @@ def test__generate_multibatch_dataframe():
         batches_per_epoch=2,
     )
 
+    # With only two columns, whether any missingness is added depends on the seed
+    random.seed(1)
     df = dymm.generate_multibatch_dataframe(
         num_columns=2,
         exact_rows=20,
@@ -146,16 +157,76 @@ def test__generate_multibatch_dataframe():
     # print(df.column_primary_key)
     # assert (df["column_primary_key"] == range(80)).all()
 
+
+def test__iter_multibatch_dataframe():
+    result_objects = list(
+        dymm.iter_multibatch_dataframe(
+            num_columns=2,
+            exact_rows=20,
+            num_epochs=2,
+            batches_per_epoch=2,
+            include_timestamps=False,
+        )
+    )
+
+    assert len(result_objects) == 4
+    assert [r.epoch_index for r in result_objects] == [0, 0, 1, 1]
+    assert [r.batch_index for r in result_objects] == [0, 1, 0, 1]
+    for result_object in result_objects:
+        assert result_object.dataframe.shape == (20, 2)
+
+
 def test__generate_multiple_batches_and_upload_to_sql():
     random.seed(0)
 
     import sqlite3
+
     conn = sqlite3.connect(":memory:")
 
-    dymm.generate_multiple_batches_and_upload_to_sql(
+    result_object = dymm.generate_multiple_batches_and_upload_to_sql(
         conn=conn,
         table_name="test_table",
         num_epochs=2,
         exact_rows=5,
         batches_per_epoch=10,
-    )
\ No newline at end of file
+    )
+
+    assert result_object.num_rows == 100
+    assert result_object.num_batches == 20
+    assert conn.execute("SELECT COUNT(*) FROM test_table").fetchone() == (100,)
+
+
+def test__missify_dataframe__inplace():
+    df = pd.DataFrame({"x": [float(i) for i in range(100)], "y": range(100)})
+    expected_df = dymm.missify_dataframe(df.copy(), seed=4)
+
+    missing_df = dymm.missify_dataframe(df, seed=4, inplace=True, n_jobs=2)
+
+    assert missing_df is df
+    pd.testing.assert_frame_equal(missing_df, expected_df)
+
+
+def test__generate_dataframe__with_a_nullable_dtype_backend():
+    df = dymm.generate_dataframe(
+        exact_rows=50,
+        num_columns=12,
+        dtype_backend="numpy_nullable",
+        seed=3,
+    )
+
+    # Integer columns with missing values aren't upcast to floats
+    numpy_dtypes = [dtype for dtype in df.dtypes if isinstance(dtype, np.dtype)]
+    assert all(dtype.kind in "mMO" for dtype in numpy_dtypes)
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        dymm.generate_dataframe,
+        dymm.generate_multibatch_dataframe,
+        dymm.iter_multibatch_dataframe,
+    ],
+)
+def test__seed_with_value_pools__raises(function):
+    with pytest.raises(ValueError, match="use_value_pools"):
+        function(use_value_pools=True, seed=1)
@@ -0,0 +1,57 @@
+"""Tests that importing the package stays cheap"""
+
+import subprocess
+import sys
+
+
+def _get_imported_modules(code: str, top_level: bool = True) -> set:
+    """Run code in a fresh interpreter, and return the (top-level) modules it imported."""
+
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    if not top_level:
+        return set(result.stdout.split())
+
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+def test__import_package__is_lazy():
+    modules = _get_imported_modules("import did_you_miss_me")
+
+    assert "did_you_miss_me" in modules
+    assert not modules & {"pandas", "numpy", "pydantic", "faker", "pyarrow"}
+
+
+def test__import_package__loads_the_api_on_first_use():
+    modules = _get_imported_modules(
+        "import did_you_miss_me\n" "did_you_miss_me.generate_dataframe"
+    )
+
+    assert {"pandas", "pydantic"} <= modules
+
+
+def test__create_generators__does_not_build_faker():
+    modules = _get_imported_modules(
+        "from did_you_miss_me.generators.multibatch import MissingFakerMultiBatchGenerator\n"
+        "MissingFakerMultiBatchGenerator.create(num_epochs=2, batches_per_epoch=2)"
+    )
+
+    assert "faker" not in modules
+
+
+def test__api__does_not_load_the_sinks():
+    modules = _get_imported_modules(
+        "import did_you_miss_me\n" "did_you_miss_me.generate_dataframe",
+        top_level=False,
+    )
+
+    assert "did_you_miss_me.api" in modules
+    assert not modules & {
+        "did_you_miss_me.modifiers.files",
+        "did_you_miss_me.sinks.parquet",
+        "did_you_miss_me.sinks.sql",
+    }
@@ -0,0 +1,210 @@
+import inspect
+import json
+import random
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from did_you_miss_me.generators.column import (
+    MissingFakerColumnGenerator,
+)
+from did_you_miss_me.generators.dataframe import (
+    MissingFakerDataframeGenerator,
+)
+from did_you_miss_me.generators.multibatch import (
+    MissingFakerMultiBatchGenerator,
+)
+from did_you_miss_me.instrumentation import (
+    InstrumentationCollector,
+    add_hook,
+    remove_hook,
+    span,
+)
+from did_you_miss_me.modifiers.missingness import (
+    ColumnMissingnessType,
+    ProportionalColumnMissingnessParams,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_random_seed():
+    random.seed(1)
+
+
+def _create_generator() -> MissingFakerDataframeGenerator:
+    generator = MissingFakerDataframeGenerator.create(
+        num_columns=3,
+        exact_rows=100,
+        include_timestamps=True,
+    )
+    for i, (column_generator, faker_type) in enumerate(
+        zip(generator.column_generators, ["first_name", "pyint", "country"])
+    ):
+        column_generator.name = f"column_{i}"
+        column_generator.faker_type = faker_type
+        column_generator.missingness_type = ColumnMissingnessType.PROPORTIONAL
+        column_generator.missingness_params = ProportionalColumnMissingnessParams(
+            proportion=0.3
+        )
+
+    return generator
+
+
+def test__instrumentation__reports_every_stage():
+    generator = _create_generator()
+
+    with InstrumentationCollector() as collector:
+        generator.generate(seed=1)
+
+    stages = {event.stage for event in collector.events}
+    assert {
+        "MissingFakerDataframeGenerator.generate",
+        "MissingFakerDataframeGenerator.assemble",
+        "MissingFakerColumnGenerator.generate",
+        "FakerColumnGenerator.generate",
+        "ColumnMissingnessModifier.modify",
+        "TimestampMultiColumnGenerator.generate",
+    } <= stages
+
+    # The seeded call re-enters generate once, but it's only reported once
+    (dataframe_event,) = [
+        event
+        for event in collector.events
+        if event.stage == "MissingFakerDataframeGenerator.generate"
+    ]
+    assert dataframe_event.depth == 0
+    assert dataframe_event.num_rows == 100
+    assert dataframe_event.num_bytes > 0
+    assert 0 <= dataframe_event.self_seconds <= dataframe_event.seconds
+
+    column_events = [
+        event
+        for event in collector.events
+        if event.stage == "MissingFakerColumnGenerator.generate"
+    ]
+    assert [event.column for event in column_events] == [
+        "column_0",
+        "column_1",
+        "column_2",
+    ]
+    assert all(event.num_rows == 100 for event in column_events)
+    assert all(event.depth == 1 for event in column_events)
+
+
+def test__instrumentation__does_not_change_output():
+    generator = _create_generator()
+    df = generator.generate(seed=1).dataframe
+
+    with InstrumentationCollector():
+        instrumented_df = generator.generate(seed=1).dataframe
+
+    pd.testing.assert_frame_equal(df, instrumented_df)
+
+
+def test__instrumentation__keeps_signatures():
+    signature = inspect.signature(MissingFakerColumnGenerator.generate)
+
+    assert list(signature.parameters) == ["self", "num_rows", "seed"]
+
+
+def test__instrumentation__reports_compiled_plan_stages():
+    generator = MissingFakerMultiBatchGenerator.create(
+        num_epochs=2,
+        batches_per_epoch=2,
+    )
+
+    with InstrumentationCollector() as collector:
+        df = generator.generate()
+
+    summary_df = collector.summary()
+    assert summary_df.loc["CompiledColumnPlan.draw", "calls"] > 0
+    assert summary_df.loc["CompiledColumnPlan.add_missingness", "calls"] > 0
+    assert summary_df.loc["MissingFakerMultiBatchGenerator.concat", "num_rows"] == len(
+        df
+    )
+    assert summary_df["self_share"].sum() == pytest.approx(1.0)
+
+
+def test__instrumentation_collector__summary_by_column():
+    generator = _create_generator()
+
+    with InstrumentationCollector() as collector:
+        generator.generate()
+
+    summary_df = collector.summary(by="column")
+
+    assert {"column_0", "column_1", "column_2"} <= set(summary_df.index)
+    assert list(summary_df.columns) == [
+        "calls",
+        "seconds",
+        "self_seconds",
+        "self_share",
+        "num_rows",
+        "rows_per_second",
+        "mb",
+        "allocated_mb",
+    ]
+
+
+def test__instrumentation_collector__empty_summary():
+    collector = InstrumentationCollector()
+
+    assert len(collector.summary()) == 0
+    assert collector.to_chrome_trace()["traceEvents"] == []
+
+
+def test__instrumentation_collector__traces_allocations():
+    generator = _create_generator()
+
+    with InstrumentationCollector(trace_allocations=True) as collector:
+        generator.generate()
+
+    assert not tracemalloc.is_tracing()
+    assert all(event.allocated_bytes is not None for event in collector.events)
+    assert collector.summary()["allocated_mb"].notna().all()
+
+
+def test__instrumentation_collector__chrome_trace(tmp_path):
+    generator = _create_generator()
+
+    with InstrumentationCollector() as collector:
+        generator.generate()
+
+    path = tmp_path / "trace.json"
+    collector.write_chrome_trace(path)
+    trace = json.loads(path.read_text())
+
+    assert len(trace["traceEvents"]) == len(collector.events)
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
+    assert min(event["ts"] for event in trace["traceEvents"]) == 0
+
+    events = json.loads(collector.to_json())
+    assert [event["stage"] for event in events] == [
+        event.stage for event in collector.events
+    ]
+
+
+def test__instrumentation__stops_reporting_after_exit():
+    generator = _create_generator()
+
+    with InstrumentationCollector() as collector:
+        pass
+    generator.generate()
+
+    assert collector.events == []
+
+
+def test__add_hook__receives_spans():
+    events = []
+    add_hook(events.append)
+    try:
+        with span("custom", column="a") as s:
+            s.set_output(pd.Series(range(10)))
+    finally:
+        remove_hook(events.append)
+
+    (event,) = events
+    assert event.stage == "custom"
+    assert event.column == "a"
+    assert event.num_rows == 10